@@ -0,0 +1,86 @@
+"""partition sent_notifications by month of sent_date (Postgres only)
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-03-23 12:00:00.000000
+"""
+from datetime import date
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.retention import PARTITIONS_AHEAD, partition_ddl
+
+
+revision: str = 'a7b8c9d0e1f2'
+down_revision: Union[str, None] = 'f6a7b8c9d0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_OLD = 'sent_notifications_unpartitioned'
+_COLUMNS = 'id, user_id, notification_key, sent_date, created_at'
+
+
+def _rename_old_table() -> None:
+    op.execute(f"ALTER TABLE sent_notifications RENAME TO {_OLD}")
+    op.execute(f"ALTER TABLE {_OLD} RENAME CONSTRAINT sent_notifications_pkey TO {_OLD}_pkey")
+    op.execute(f"ALTER TABLE {_OLD} RENAME CONSTRAINT uq_sent_notification TO uq_{_OLD}")
+    op.execute(f"ALTER INDEX ix_sent_notifications_user_id RENAME TO ix_{_OLD}_user_id")
+    op.execute(f"ALTER INDEX ix_sent_notifications_sent_date RENAME TO ix_{_OLD}_sent_date")
+
+
+def _copy_and_drop_old_table() -> None:
+    op.execute(f"INSERT INTO sent_notifications ({_COLUMNS}) SELECT {_COLUMNS} FROM {_OLD}")
+    op.execute("ALTER SEQUENCE sent_notifications_id_seq OWNED BY sent_notifications.id")
+    op.execute(f"DROP TABLE {_OLD}")
+    op.create_index('ix_sent_notifications_user_id', 'sent_notifications', ['user_id'], unique=False)
+    op.create_index('ix_sent_notifications_sent_date', 'sent_notifications', ['sent_date'], unique=False)
+
+
+def upgrade() -> None:
+    # SQLite keeps the plain table; app.core.retention purges it in batches
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _rename_old_table()
+    # The partition key must be part of every unique constraint
+    op.execute("""
+        CREATE TABLE sent_notifications (
+            id integer NOT NULL DEFAULT nextval('sent_notifications_id_seq'),
+            user_id integer NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+            notification_key varchar(255) NOT NULL,
+            sent_date date NOT NULL,
+            created_at timestamptz NOT NULL,
+            CONSTRAINT sent_notifications_pkey PRIMARY KEY (id, sent_date),
+            CONSTRAINT uq_sent_notification UNIQUE (user_id, notification_key, sent_date)
+        ) PARTITION BY RANGE (sent_date)
+    """)
+    op.execute("CREATE TABLE sent_notifications_default PARTITION OF sent_notifications DEFAULT")
+
+    # One partition per month from the oldest existing row, so history stays droppable
+    today = date.today()
+    oldest = op.get_bind().execute(sa.text(f"SELECT min(sent_date) FROM {_OLD}")).scalar() or today
+    year, month = oldest.year, oldest.month
+    last = (today.year * 12 + today.month - 1) + PARTITIONS_AHEAD
+    while year * 12 + month - 1 <= last:
+        op.execute(partition_ddl(date(year, month, 1)))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    _copy_and_drop_old_table()
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _rename_old_table()
+    op.create_table('sent_notifications',
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('sent_notifications_id_seq')"), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('notification_key', sa.String(length=255), nullable=False),
+        sa.Column('sent_date', sa.Date(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id', name='sent_notifications_pkey'),
+        sa.UniqueConstraint('user_id', 'notification_key', 'sent_date', name='uq_sent_notification'),
+    )
+    # Dropping the partitioned parent drops its partitions too
+    _copy_and_drop_old_table()
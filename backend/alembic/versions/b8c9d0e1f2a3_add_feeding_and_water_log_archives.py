@@ -0,0 +1,53 @@
+"""add feeding_logs_archive and water_logs_archive
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-03-30 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b8c9d0e1f2a3'
+down_revision: Union[str, None] = 'a7b8c9d0e1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Cold storage for app.core.archive: ids are copied from the hot tables,
+    # and a single (pet_id, datetime) index serves history reads
+    op.create_table('feeding_logs_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('pet_id', sa.Integer(), nullable=False),
+        sa.Column('datetime', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('food_type', sa.String(length=120), nullable=False),
+        sa.Column('planned_amount_grams', sa.Float(), nullable=True),
+        sa.Column('actual_amount_grams', sa.Float(), nullable=False),
+        sa.Column('notes', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['pet_id'], ['pets.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_feeding_logs_archive_pet_id_datetime', 'feeding_logs_archive', ['pet_id', 'datetime'], unique=False,
+    )
+    op.create_table('water_logs_archive',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('pet_id', sa.Integer(), nullable=False),
+        sa.Column('datetime', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('amount_ml', sa.Float(), nullable=False),
+        sa.Column('daily_goal_ml', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['pet_id'], ['pets.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_water_logs_archive_pet_id_datetime', 'water_logs_archive', ['pet_id', 'datetime'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_water_logs_archive_pet_id_datetime', table_name='water_logs_archive')
+    op.drop_table('water_logs_archive')
+    op.drop_index('ix_feeding_logs_archive_pet_id_datetime', table_name='feeding_logs_archive')
+    op.drop_table('feeding_logs_archive')
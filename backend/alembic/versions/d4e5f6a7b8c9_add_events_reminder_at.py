@@ -0,0 +1,39 @@
+"""add events.reminder_at fire-time column
+
+Revision ID: d4e5f6a7b8c9
+Revises: b3c4d5e6f7a8
+Create Date: 2026-03-02 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, None] = 'b3c4d5e6f7a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('reminder_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_events_reminder_at'), 'events', ['reminder_at'], unique=False)
+
+    # Backfill fire times for events that already have a reminder configured
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute(
+            "UPDATE events "
+            "SET reminder_at = datetime_start - make_interval(mins => reminder_minutes_before) "
+            "WHERE reminder_minutes_before IS NOT NULL"
+        )
+    else:
+        op.execute(
+            "UPDATE events "
+            "SET reminder_at = datetime(datetime_start, '-' || reminder_minutes_before || ' minutes') "
+            "WHERE reminder_minutes_before IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_events_reminder_at'), table_name='events')
+    op.drop_column('events', 'reminder_at')
@@ -0,0 +1,33 @@
+"""add composite (pet_id, <time>) indexes for per-pet newest-first reads
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-04-20 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'e1f2a3b4c5d6'
+down_revision: Union[str, None] = 'd0e1f2a3b4c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each lets GET /pets/{id}/timeline read one page per table straight off the index
+_INDEXES = (
+    ('ix_feeding_logs_pet_id_datetime', 'feeding_logs', ['pet_id', 'datetime']),
+    ('ix_water_logs_pet_id_datetime', 'water_logs', ['pet_id', 'datetime']),
+    ('ix_weight_logs_history_pet_id_datetime', 'weight_logs_history', ['pet_id', 'datetime']),
+    ('ix_symptoms_pet_id_datetime', 'symptoms', ['pet_id', 'datetime']),
+    ('ix_vaccines_pet_id_date_administered', 'vaccines', ['pet_id', 'date_administered']),
+)
+
+
+def upgrade() -> None:
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
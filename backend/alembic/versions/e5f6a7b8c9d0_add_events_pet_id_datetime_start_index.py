@@ -0,0 +1,25 @@
+"""add composite (pet_id, datetime_start) index on events
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-03-09 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the per-pet top-N upcoming events window query
+    op.create_index(
+        'ix_events_pet_id_datetime_start', 'events', ['pet_id', 'datetime_start'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_pet_id_datetime_start', table_name='events')
@@ -0,0 +1,38 @@
+"""add full-text search index (SQLite FTS5 + triggers, Postgres tsvector + GIN)
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-04-27 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+from app.core.search import (
+    postgres_ddl, postgres_drop_ddl, sqlite_backfill, sqlite_ddl, sqlite_drop_ddl,
+)
+
+
+revision: str = 'f2a3b4c5d6e7'
+down_revision: Union[str, None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        # Generated columns fill themselves for existing rows
+        statements = postgres_ddl()
+    elif dialect == 'sqlite':
+        statements = sqlite_ddl() + sqlite_backfill()
+    else:
+        return
+    for statement in statements:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    ddl = {'postgresql': postgres_drop_ddl, 'sqlite': sqlite_drop_ddl}.get(dialect)
+    for statement in ddl() if ddl else ():
+        op.execute(statement)
@@ -0,0 +1,25 @@
+"""add composite (pet_id, start_date, end_date) index on medications
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-03-16 12:00:00.000000
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = 'f6a7b8c9d0e1'
+down_revision: Union[str, None] = 'e5f6a7b8c9d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the reminder loop's active-course filter
+    op.create_index(
+        'ix_medications_pet_id_start_end', 'medications', ['pet_id', 'start_date', 'end_date'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_medications_pet_id_start_end', table_name='medications')
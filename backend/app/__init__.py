@@ -0,0 +1,4 @@
+import time
+
+# Reference point for the "import" startup phase (see app.core.startup)
+IMPORT_STARTED = time.perf_counter()
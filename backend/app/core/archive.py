@@ -0,0 +1,141 @@
+"""Hot/cold storage for feeding and water logs.
+
+Only the last few days of logs are read by the dashboards and the reminder
+loop, yet every row stays in ``feeding_logs``/``water_logs`` and in each of
+their indexes.  ``archive_loop`` moves rows older than ``ARCHIVE_AFTER_DAYS``
+into ``feeding_logs_archive``/``water_logs_archive``: plain tables with a
+single (pet_id, datetime) index, rows keeping their original ids.
+
+The mover works ``ARCHIVE_BATCH_SIZE`` rows per transaction (copy, then
+delete by id) and, on Postgres, skips rows locked by in-flight writes, so it
+never holds up the API.  The newest water row carrying a ``daily_goal_ml``
+stays hot for each pet because the dashboards read the current goal from it.
+
+History reads go through :func:`log_history`, which adds the archive table to
+the query only when the requested range reaches past the horizon.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, exists, insert, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.metrics import archive_rows_moved_total
+from app.core.startup import startup
+from app.models.feeding_log import FeedingLog, FeedingLogArchive
+from app.models.water_log import WaterLog, WaterLogArchive
+
+logger = logging.getLogger("pwelltrack.archive")
+
+ARCHIVES = {FeedingLog: FeedingLogArchive, WaterLog: WaterLogArchive}
+
+
+def archive_horizon(now: datetime | None = None) -> datetime:
+    """Rows older than this may live in the archive."""
+    return (now or datetime.now(timezone.utc)) - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+
+
+def _keep_hot(model):
+    """Extra criteria for rows that must stay in the hot table."""
+    if model is not WaterLog:
+        return ()
+    newer_goal = aliased(WaterLog)
+    return (or_(
+        WaterLog.daily_goal_ml.is_(None),
+        exists().where(
+            newer_goal.pet_id == WaterLog.pet_id,
+            newer_goal.daily_goal_ml.isnot(None),
+            newer_goal.datetime_ > WaterLog.datetime_,
+        ),
+    ),)
+
+
+async def archive_batch(engine: AsyncEngine, model, cutoff: datetime, batch_size: int) -> int:
+    """Move up to ``batch_size`` rows older than ``cutoff`` in one transaction."""
+    archive = ARCHIVES[model]
+    columns = [c.name for c in model.__table__.columns]
+    async with engine.begin() as conn:
+        ids = (await conn.execute(
+            select(model.id)
+            .where(model.datetime_ < cutoff, *_keep_hot(model))
+            .order_by(model.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )).scalars().all()
+        if not ids:
+            return 0
+        await conn.execute(
+            insert(archive).from_select(columns, select(*model.__table__.c).where(model.id.in_(ids)))
+        )
+        await conn.execute(delete(model).where(model.id.in_(ids)))
+    archive_rows_moved_total.inc(model.__tablename__, amount=len(ids))
+    return len(ids)
+
+
+async def archive_old_logs(
+    engine: AsyncEngine,
+    cutoff: datetime | None = None,
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+) -> dict[str, int]:
+    """Move every log older than ``cutoff``, batch by batch; returns rows moved per table."""
+    cutoff = cutoff or archive_horizon()
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    moved = {}
+    for model in ARCHIVES:
+        total = batches = 0
+        while max_batches is None or batches < max_batches:
+            count = await archive_batch(engine, model, cutoff, batch_size)
+            total += count
+            batches += 1
+            if count < batch_size:
+                break
+            await asyncio.sleep(settings.ARCHIVE_BATCH_PAUSE_SECONDS)
+        moved[model.__tablename__] = total
+        if total:
+            logger.info("Archived %d %s rows older than %s", total, model.__tablename__, cutoff)
+    return moved
+
+
+async def archive_loop(engine: AsyncEngine):
+    """Run the mover every ARCHIVE_INTERVAL_SECONDS (disabled when ARCHIVE_AFTER_DAYS is 0)."""
+    if settings.ARCHIVE_AFTER_DAYS <= 0:
+        return
+    await startup.ready.wait()
+    while True:
+        try:
+            await archive_old_logs(engine)
+        except Exception as e:
+            logger.error("Log archival failed: %s", e)
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL_SECONDS)
+
+
+def log_history(model, pet_id: int, date_from: datetime | None, date_to: datetime | None,
+                limit: int, offset: int):
+    """Newest-first page of a pet's ``model`` rows, hot and archived alike.
+
+    Returns a select of ``model`` entities.  When the range can reach archived
+    rows, each table contributes only its own top ``offset + limit`` rows
+    before the union is sorted and paged.
+    """
+    def branch(table_model):
+        q = select(table_model).where(table_model.pet_id == pet_id)
+        if date_from:
+            q = q.where(table_model.datetime_ >= date_from)
+        if date_to:
+            q = q.where(table_model.datetime_ <= date_to)
+        return q.order_by(table_model.datetime_.desc())
+
+    if date_from is not None:
+        start = date_from if date_from.tzinfo else date_from.replace(tzinfo=timezone.utc)
+        if start >= archive_horizon():
+            return branch(model).limit(limit).offset(offset)
+
+    parts = [branch(m).limit(offset + limit).subquery() for m in (model, ARCHIVES[model])]
+    combined = union_all(*(select(*part.c) for part in parts)).subquery()
+    source = aliased(model, combined, adapt_on_names=True)
+    return select(source).order_by(source.datetime_.desc()).limit(limit).offset(offset)
@@ -0,0 +1,135 @@
+"""Coalesced ``data_changed`` pushes for clients on the notifications WebSocket.
+
+CRUD routers call :meth:`ChangeFeed.publish` right after a successful commit.
+Changes are collected per user for ``DATA_CHANGED_COALESCE_SECONDS`` and then
+sent as one message, so a burst of edits (or a bulk import) costs one push and
+one totals query instead of one per row::
+
+    {"type": "data_changed",
+     "changes": [{"entity": "feeding", "pet_id": 3, "upserted": [41], "deleted": []}],
+     "totals": {"3": {"date": "2026-03-10", "feeding_grams": 250.0, "feeding_count": 2,
+                      "water_ml": 400.0, "water_count": 3}}}
+
+``totals`` holds the pet's local-day feeding and water figures and is only
+present when feeding or water logs changed; every other entity carries the
+changed record ids so the client can refetch just those rows.  Nothing is
+queued for users without an open socket.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, time, timezone
+from typing import Awaitable, Callable
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.feeding_log import FeedingLog
+from app.models.user import User
+from app.models.water_log import WaterLog
+
+logger = logging.getLogger(__name__)
+
+_TOTALS_ENTITIES = {"feeding", "water"}
+
+
+class _Pending:
+    def __init__(self, tz_name: str):
+        self.tz_name = tz_name
+        # (entity, pet_id) -> (upserted ids, deleted ids)
+        self.changes: dict[tuple[str, int], tuple[set[int], set[int]]] = {}
+
+
+class ChangeFeed:
+    """Per-user buffer of committed changes, flushed after a short window."""
+
+    def __init__(self, window: float | None = None):
+        self.window = settings.DATA_CHANGED_COALESCE_SECONDS if window is None else window
+        self._send: Callable[[int, dict], Awaitable[None]] | None = None
+        self._is_connected: Callable[[int], bool] = lambda user_id: False
+        self._pending: dict[int, _Pending] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def bind(self, send: Callable[[int, dict], Awaitable[None]], is_connected: Callable[[int], bool]) -> None:
+        """Attach the WebSocket delivery functions (done by the notifications router)."""
+        self._send = send
+        self._is_connected = is_connected
+
+    def publish(self, user: User, entity: str, pet_id: int, *,
+                upserted: int | None = None, deleted: int | None = None) -> None:
+        """Record a committed change; never blocks the request."""
+        if self._send is None or not self._is_connected(user.id):
+            return
+        pending = self._pending.get(user.id)
+        if pending is None:
+            pending = self._pending[user.id] = _Pending(user.timezone or "UTC")
+            task = asyncio.get_running_loop().create_task(self._flush_later(user.id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        upserts, deletes = pending.changes.setdefault((entity, pet_id), (set(), set()))
+        if upserted is not None:
+            upserts.add(upserted)
+        if deleted is not None:
+            upserts.discard(deleted)
+            deletes.add(deleted)
+
+    async def _flush_later(self, user_id: int) -> None:
+        await asyncio.sleep(self.window)
+        pending = self._pending.pop(user_id, None)
+        if pending is None:
+            return
+        try:
+            await self._send(user_id, await self._message(pending))
+        except Exception as e:
+            logger.warning("data_changed push to user %s failed: %s", user_id, e)
+
+    async def _message(self, pending: _Pending) -> dict:
+        changes = []
+        totals_pets: set[int] = set()
+        deleted_pets: set[int] = set()
+        for (entity, pet_id), (upserts, deletes) in pending.changes.items():
+            changes.append({"entity": entity, "pet_id": pet_id,
+                            "upserted": sorted(upserts), "deleted": sorted(deletes)})
+            if entity in _TOTALS_ENTITIES:
+                totals_pets.add(pet_id)
+            elif entity == "pet" and deletes:
+                deleted_pets |= deletes
+        message = {"type": "data_changed", "changes": changes}
+        if totals_pets - deleted_pets:
+            message["totals"] = await _daily_totals(totals_pets - deleted_pets, pending.tz_name)
+        return message
+
+
+async def _daily_totals(pet_ids: set[int], tz_name: str) -> dict[str, dict]:
+    """Local-day feeding and water totals for ``pet_ids`` (two grouped queries)."""
+    try:
+        tz = ZoneInfo(tz_name)
+    except (KeyError, ValueError):
+        tz = timezone.utc
+    today = datetime.now(tz).date()
+    start = datetime.combine(today, time.min, tzinfo=tz).astimezone(timezone.utc)
+    end = datetime.combine(today, time.max, tzinfo=tz).astimezone(timezone.utc)
+    totals = {pid: {"date": today.isoformat(), "feeding_grams": 0.0, "feeding_count": 0,
+                    "water_ml": 0.0, "water_count": 0} for pid in pet_ids}
+    async with async_session() as db:
+        feeding = await db.execute(
+            select(FeedingLog.pet_id, func.coalesce(func.sum(FeedingLog.actual_amount_grams), 0),
+                   func.count(FeedingLog.id))
+            .where(FeedingLog.pet_id.in_(pet_ids), FeedingLog.datetime_.between(start, end))
+            .group_by(FeedingLog.pet_id)
+        )
+        for pid, grams, count in feeding.all():
+            totals[pid].update(feeding_grams=float(grams), feeding_count=count)
+        water = await db.execute(
+            select(WaterLog.pet_id, func.coalesce(func.sum(WaterLog.amount_ml), 0), func.count(WaterLog.id))
+            .where(WaterLog.pet_id.in_(pet_ids), WaterLog.datetime_.between(start, end))
+            .group_by(WaterLog.pet_id)
+        )
+        for pid, ml, count in water.all():
+            totals[pid].update(water_ml=float(ml), water_count=count)
+    return {str(pid): values for pid, values in totals.items()}
+
+
+data_changes = ChangeFeed()
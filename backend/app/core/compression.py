@@ -0,0 +1,213 @@
+"""Negotiated response compression (zstd, brotli, gzip).
+
+Pure ASGI, like the rest of ``app.core``: bodies sent in one message are
+compressed whole when they reach ``COMPRESSION_MINIMUM_SIZE`` bytes, while
+streamed bodies are compressed chunk by chunk with a sync flush after each
+one, so clients keep receiving data as it is produced.  Responses that are
+already encoded, marked ``no-transform`` or carry media that is compressed
+by nature (images, audio, video, archives) pass through untouched.
+
+gzip comes from the standard library; brotli (``pip install brotli``) and
+zstd (``pip install zstandard``) are used when installed.  Every compressed
+response records its compression ratio and the CPU time spent compressing.
+"""
+
+import time
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import (
+    http_response_compression_cpu_seconds,
+    http_response_compression_ratio,
+    http_response_size_bytes_total,
+)
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional
+    zstandard = None
+
+_GZIP_LEVEL = 6
+_BROTLI_QUALITY = 4  # favour speed: dynamic API responses, not static assets
+_ZSTD_LEVEL = 3
+
+_INCOMPRESSIBLE_PREFIXES = ("image/", "audio/", "video/", "font/woff")
+_INCOMPRESSIBLE_TYPES = {
+    "application/zip", "application/gzip", "application/x-gzip", "application/x-bzip2",
+    "application/x-7z-compressed", "application/zstd", "application/pdf", "application/octet-stream",
+}
+_COMPRESSIBLE_IMAGES = {"image/svg+xml"}
+
+
+class _GzipEncoder:
+    def __init__(self):
+        self._obj = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self):
+        self._obj = brotli.Compressor(quality=_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class _ZstdEncoder:
+    def __init__(self):
+        self._obj = zstandard.ZstdCompressor(level=_ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encoders() -> dict[str, type]:
+    """Supported encodings in server preference order."""
+    encoders: dict[str, type] = {}
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdEncoder
+    if brotli is not None:
+        encoders["br"] = _BrotliEncoder
+    encoders["gzip"] = _GzipEncoder
+    return encoders
+
+
+def negotiate(accept_encoding: str, supported: list[str]) -> str | None:
+    """Pick the acceptable encoding with the highest q-value, ties going to server preference."""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _compressible(headers: Headers) -> bool:
+    if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+        return False
+    media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if media_type in _COMPRESSIBLE_IMAGES:
+        return True
+    return not (media_type in _INCOMPRESSIBLE_TYPES or media_type.startswith(_INCOMPRESSIBLE_PREFIXES))
+
+
+class CompressionMiddleware:
+    """Compress response bodies with the best encoding the client accepts."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        self.encoders = available_encoders()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding", ""), list(self.encoders))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        encoder = None
+        passthrough = False
+        original_size = compressed_size = 0
+        cpu_seconds = 0.0
+
+        def encode(body: bytes, more_body: bool) -> bytes:
+            nonlocal original_size, compressed_size, cpu_seconds
+            started = time.thread_time()
+            out = encoder.compress(body) + (encoder.flush() if more_body else encoder.finish())
+            cpu_seconds += time.thread_time() - started
+            original_size += len(body)
+            compressed_size += len(out)
+            return out
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                status = message["status"]
+                length = headers.get("content-length")
+                if (status < 200 or status in (204, 304) or not _compressible(headers)
+                        or (length is not None and int(length) < self.minimum_size)):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message  # held until we see the first body chunk
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+                encoder = self.encoders[encoding]()
+                headers = MutableHeaders(scope=start_message)
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                del headers["content-length"]
+                out = encode(body, more_body)
+                if not more_body:
+                    headers["content-length"] = str(len(out))
+                await send(start_message)
+            else:
+                out = encode(body, more_body)
+            await send({"type": "http.response.body", "body": out, "more_body": more_body})
+            if not more_body:
+                http_response_size_bytes_total.inc(encoding, "original", amount=original_size)
+                http_response_size_bytes_total.inc(encoding, "compressed", amount=compressed_size)
+                if original_size:
+                    http_response_compression_ratio.observe(compressed_size / original_size, encoding)
+                http_response_compression_cpu_seconds.observe(cpu_seconds, encoding)
+
+        await self.app(scope, receive, send_wrapper)
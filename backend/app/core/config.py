@@ -19,6 +19,34 @@ class Settings(BaseSettings):
     CORS_ORIGINS: str = "https://p-well-track.vercel.app,http://localhost:3000"
     DB_CONNECT_RETRIES: int = 3
     DB_CONNECT_RETRY_DELAY: int = 5
+    FAST_STARTUP: bool = False  # serve immediately, check migrations in the background (scale-to-zero)
+    STARTUP_GATE_TIMEOUT: float = 10.0  # seconds a request waits for startup before a 503
+    HEALTH_CHECK_INTERVAL: float = 10.0  # seconds between background DB pings for /health/ready
+    HEALTH_CHECK_TIMEOUT: float = 5.0
+    HEALTH_MAX_POOL_SATURATION: float = 0.9  # not ready above this share of connections in use
+    DB_REQUEST_CONCURRENCY: int = 4  # sibling sessions one request may use for independent queries
+    DB_MAX_CONNECTIONS: int = 15  # connection budget when the pool itself is unbounded (NullPool)
+    RATE_LIMIT_STORAGE_URI: str = "memory://"  # memory://, database, db+sqlite:///..., db+postgresql://...
+    SENT_NOTIFICATION_RETENTION_DAYS: int = 7  # reminder dedup rows kept (minimum 2)
+    RETENTION_BATCH_SIZE: int = 5000  # rows per DELETE transaction
+    RETENTION_INTERVAL_SECONDS: float = 3600.0
+    ARCHIVE_AFTER_DAYS: int = 365  # feeding/water logs older than this move to archive tables; 0 disables the mover
+    ARCHIVE_BATCH_SIZE: int = 500  # rows per archive transaction
+    ARCHIVE_BATCH_PAUSE_SECONDS: float = 0.05
+    ARCHIVE_INTERVAL_SECONDS: float = 3600.0
+    JOB_WORKER_IN_PROCESS: bool = True  # run the job worker inside the API; false when using `python -m app.worker`
+    JOB_WORKER_CONCURRENCY: int = 2
+    JOB_POLL_INTERVAL: float = 1.0  # seconds an idle worker waits before claiming again
+    JOB_LEASE_SECONDS: float = 300.0  # a claimed job is re-run if its worker goes silent this long
+    JOB_MAX_ATTEMPTS: int = 5
+    JOB_RETRY_BACKOFF_SECONDS: float = 10.0
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = 3600.0
+    ACCOUNT_DELETE_SYNC_MAX_ROWS: int = 5000  # larger accounts are deleted by a background job
+    ACCOUNT_DELETE_BATCH_SIZE: int = 1000  # rows per DELETE transaction in that job
+    DATA_CHANGED_COALESCE_SECONDS: float = 0.5  # batch data_changed WebSocket pushes per user
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # bytes; smaller bodies are sent as-is
+    SQL_STATS_HEADERS: bool = False  # expose per-request query count/DB time headers
+    SQL_N_PLUS_ONE_THRESHOLD: int = 10  # warn when one statement repeats this often per request
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
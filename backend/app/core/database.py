@@ -1,8 +1,15 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.core.health import monitor
+from app.core.metrics import instrument_engine
+from app.core.query_stats import instrument_queries
 
 connect_args = {}
 engine_kwargs = {}
@@ -14,12 +21,27 @@ if settings.is_postgres:
     connect_args = {"ssl": "require", "statement_cache_size": 0}
     engine_kwargs = {"poolclass": NullPool}
 
+
+def enable_sqlite_foreign_keys(sync_engine) -> None:
+    """SQLite ignores foreign keys (and their ON DELETE CASCADE) unless asked per connection."""
+    @event.listens_for(sync_engine, "connect")
+    def _foreign_keys(dbapi_conn, record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 engine = create_async_engine(
     settings.async_database_url,
     echo=False,
     connect_args=connect_args,
     **engine_kwargs,
 )
+if engine.dialect.name == "sqlite":
+    enable_sqlite_foreign_keys(engine.sync_engine)
+instrument_engine(engine.sync_engine)
+instrument_queries(engine.sync_engine)
+monitor.track_pool(engine.sync_engine)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -30,3 +52,21 @@ class Base(DeclarativeBase):
 async def get_db() -> AsyncSession:  # type: ignore[misc]
     async with async_session() as session:
         yield session
+
+
+async def run_concurrently(
+    db: AsyncSession, *jobs: Callable[[AsyncSession], Awaitable[Any]], limit: int | None = None,
+) -> list[Any]:
+    """Run independent read-only jobs on sibling sessions of ``db``, at most ``limit`` at a time.
+
+    A session is bound to one connection and can't run statements in parallel,
+    so each job gets its own session on the same engine; results keep job order.
+    """
+    semaphore = asyncio.Semaphore(limit or settings.DB_REQUEST_CONCURRENCY)
+
+    async def run(job):
+        async with semaphore:
+            async with AsyncSession(db.bind, expire_on_commit=False) as session:
+                return await job(session)
+
+    return await asyncio.gather(*(run(job) for job in jobs))
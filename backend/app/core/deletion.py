@@ -0,0 +1,89 @@
+"""Account deletion, small accounts inline and large ones in background batches.
+
+Every child table references ``pets``/``users`` with ``ON DELETE CASCADE`` and
+the ORM relationships are ``passive_deletes``, so deleting a user or pet is
+one statement and nothing is loaded into memory.  For an account with years
+of logs that single statement is still one huge transaction, so
+``delete_account`` in the auth router only deletes inline up to
+``ACCOUNT_DELETE_SYNC_MAX_ROWS`` rows.  Past that it signs the account out
+(``User.deleted_at``, email released) and enqueues the ``delete_account`` job
+below, which removes rows ``ACCOUNT_DELETE_BATCH_SIZE`` at a time, one short
+transaction per batch, keeping only pet ids in memory.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, select, union_all
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.core.jobs import JobContext, enqueue, register
+from app.models.event import Event
+from app.models.feeding_log import FeedingLog, FeedingLogArchive
+from app.models.job import Job
+from app.models.medication import Medication
+from app.models.pet import Pet
+from app.models.sent_notification import SentNotification
+from app.models.symptom import Symptom
+from app.models.user import User
+from app.models.vaccine import Vaccine
+from app.models.water_log import WaterLog, WaterLogArchive
+from app.models.weight_log import WeightLog
+
+PET_CHILDREN = (
+    FeedingLog, FeedingLogArchive, WaterLog, WaterLogArchive, WeightLog,
+    Symptom, Event, Medication, Vaccine,
+)
+
+
+async def owned_rows_exceed(db: AsyncSession, user_id: int, limit: int) -> bool:
+    """Whether the user owns more than ``limit`` pet rows; reads at most limit + 1 ids."""
+    pet_ids = select(Pet.id).where(Pet.user_id == user_id)
+    ids = union_all(*(select(m.id).where(m.pet_id.in_(pet_ids)) for m in PET_CHILDREN)).limit(limit + 1)
+    count = (await db.execute(select(func.count()).select_from(ids.subquery()))).scalar_one()
+    return count > limit
+
+
+async def request_account_deletion(db: AsyncSession, user: User) -> Job | None:
+    """Delete ``user`` now if small, else detach the account and enqueue a job (caller commits)."""
+    if not await owned_rows_exceed(db, user.id, settings.ACCOUNT_DELETE_SYNC_MAX_ROWS):
+        await db.execute(delete(User).where(User.id == user.id))
+        return None
+    user.deleted_at = datetime.now(timezone.utc)
+    user.email = f"deleted-{user.id}@deleted.invalid"  # free the address for a new signup
+    user.password_hash = "!deleted"
+    return await enqueue(db, "delete_account", {"user_id": user.id}, user_id=user.id)
+
+
+async def _delete_in_batches(engine: AsyncEngine, model, criterion, batch_size: int) -> int:
+    total = 0
+    while True:
+        batch = select(model.id).where(criterion).limit(batch_size).scalar_subquery()
+        async with engine.begin() as conn:
+            deleted = (await conn.execute(delete(model).where(model.id.in_(batch)))).rowcount or 0
+        total += deleted
+        if deleted < batch_size:
+            return total
+
+
+@register("delete_account")
+async def delete_account(ctx: JobContext, payload: dict) -> dict:
+    user_id = payload["user_id"]
+    batch_size = settings.ACCOUNT_DELETE_BATCH_SIZE
+    async with ctx.engine.connect() as conn:
+        pet_ids = (await conn.execute(select(Pet.id).where(Pet.user_id == user_id))).scalars().all()
+
+    deleted = 0
+    for i, pet_id in enumerate(pet_ids):
+        for model in PET_CHILDREN:
+            deleted += await _delete_in_batches(ctx.engine, model, model.pet_id == pet_id, batch_size)
+        async with ctx.engine.begin() as conn:
+            await conn.execute(delete(Pet).where(Pet.id == pet_id))
+        deleted += 1
+        await ctx.progress((i + 1) / (len(pet_ids) + 1), f"Deleted {i + 1} of {len(pet_ids)} pets")
+
+    deleted += await _delete_in_batches(
+        ctx.engine, SentNotification, SentNotification.user_id == user_id, batch_size)
+    async with ctx.engine.begin() as conn:
+        deleted += (await conn.execute(delete(User).where(User.id == user_id))).rowcount or 0
+    return {"deleted_rows": deleted}
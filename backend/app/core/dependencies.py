@@ -1,6 +1,9 @@
 """Shared FastAPI dependencies for pet ownership verification."""
 
+from typing import Any
+
 from fastapi import HTTPException
+from sqlalchemy import delete, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.pet import Pet
@@ -13,3 +16,63 @@ async def get_pet_for_user(pet_id: int, user: User, db: AsyncSession) -> Pet:
     if not pet or pet.user_id != user.id:
         raise HTTPException(status_code=404, detail="Pet not found")
     return pet
+
+
+def owned_by(model, user: User):
+    """WHERE criterion: the ``model`` row is (or belongs to) one of ``user``'s pets."""
+    if model is Pet:
+        return Pet.user_id == user.id
+    return model.pet_id.in_(select(Pet.id).where(Pet.user_id == user.id))
+
+
+async def insert_owned(db: AsyncSession, model, pet_id: int, user: User, values: dict[str, Any]):
+    """``INSERT ... SELECT ... FROM pets WHERE owned RETURNING *`` in one statement; 404 if not owned.
+
+    Runs in the caller's transaction (the caller commits).  Mapper-level
+    hooks and Python-side column defaults do not apply, so ``values`` must
+    be complete.
+    """
+    columns = model.__table__.c
+    names = [model.__mapper__.attrs[key].columns[0].name for key in values]
+    source = select(
+        *(literal(value, columns[name].type) for name, value in zip(names, values.values())),
+        Pet.id,
+    ).where(Pet.id == pet_id, Pet.user_id == user.id)
+    stmt = insert(model).from_select([*names, "pet_id"], source).returning(model)
+    row = (await db.execute(stmt)).scalar_one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Pet not found")
+    return row
+
+
+async def update_owned(db: AsyncSession, model, row_id: int, user: User, values: dict[str, Any], detail: str):
+    """``UPDATE ... WHERE id AND owned RETURNING *`` in one statement; 404 if nothing matched.
+
+    Runs in the caller's transaction (the caller commits).  Mapper-level
+    hooks do not fire for this statement.
+    """
+    criteria = (model.id == row_id, owned_by(model, user))
+    if values:
+        stmt = (
+            update(model).where(*criteria).values(**values).returning(model)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(model).where(*criteria)
+    row = (await db.execute(stmt)).scalar_one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail=detail)
+    return row
+
+
+async def delete_owned(db: AsyncSession, model, row_id: int, user: User, detail: str) -> int:
+    """``DELETE ... WHERE id AND owned RETURNING pet_id``; 404 if nothing matched."""
+    pet_column = model.id if model is Pet else model.pet_id
+    result = await db.execute(
+        delete(model).where(model.id == row_id, owned_by(model, user)).returning(pet_column)
+        .execution_options(synchronize_session=False)
+    )
+    pet_id = result.scalar_one_or_none()
+    if pet_id is None:
+        raise HTTPException(status_code=404, detail=detail)
+    return pet_id
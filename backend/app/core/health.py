@@ -0,0 +1,136 @@
+"""Liveness/readiness state, refreshed in the background.
+
+``/health/live`` only says the process is serving.  ``/health/ready`` reads
+state kept here, so probes never touch the database themselves:
+
+- ``HealthMonitor.run`` pings the DB every ``HEALTH_CHECK_INTERVAL`` seconds
+  and caches the result (a result older than three intervals counts as
+  failed, e.g. when the ping itself hangs);
+- pool usage is tracked from checkout/checkin events, so it works with the
+  NullPool used behind pgbouncer as well as with queue pools;
+- the reminder loop calls ``reminder_heartbeat.beat()`` every tick.
+"""
+
+import asyncio
+import logging
+import time
+
+from sqlalchemy import event, text
+
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.core.startup import startup
+
+logger = logging.getLogger("pwelltrack.health")
+
+
+class Heartbeat:
+    """Last time a background loop reported progress."""
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self.last: float | None = None
+
+    def beat(self) -> None:
+        self.last = time.monotonic()
+
+    def age(self) -> float | None:
+        return None if self.last is None else time.monotonic() - self.last
+
+    def is_alive(self) -> bool:
+        age = self.age()
+        return age is not None and age <= self.max_age_seconds
+
+
+class HealthMonitor:
+    def __init__(self):
+        self.db_ok = False
+        self.db_latency_seconds: float | None = None
+        self.db_error: str | None = None
+        self.checked_at: float | None = None
+        self.connections_in_use = 0
+        self._pool_capacity: int | None = None
+
+    # ── Pool ──
+
+    def track_pool(self, sync_engine) -> None:
+        pool = sync_engine.pool
+        if hasattr(pool, "size"):
+            self._pool_capacity = pool.size() + max(pool._max_overflow, 0)
+
+        @event.listens_for(sync_engine, "checkout")
+        def _checkout(dbapi_conn, record, proxy):
+            self.connections_in_use += 1
+
+        @event.listens_for(sync_engine, "checkin")
+        def _checkin(dbapi_conn, record):
+            self.connections_in_use -= 1
+
+    @property
+    def pool_capacity(self) -> int:
+        # NullPool has no limit of its own; the pooler in front of Postgres does
+        return self._pool_capacity or settings.DB_MAX_CONNECTIONS
+
+    @property
+    def pool_saturation(self) -> float:
+        return self.connections_in_use / self.pool_capacity
+
+    # ── Database ping ──
+
+    async def check(self, engine) -> bool:
+        start = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                await asyncio.wait_for(conn.execute(text("SELECT 1")), settings.HEALTH_CHECK_TIMEOUT)
+            self.db_ok, self.db_error = True, None
+        except Exception as exc:
+            if self.db_ok:
+                logger.warning("Database health check failed: %s", exc)
+            self.db_ok, self.db_error = False, str(exc) or exc.__class__.__name__
+        self.db_latency_seconds = time.perf_counter() - start
+        self.checked_at = time.monotonic()
+        return self.db_ok
+
+    async def run(self, engine) -> None:
+        await startup.ready.wait()
+        while True:
+            await self.check(engine)
+            await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL)
+
+    def db_result_age(self) -> float | None:
+        return None if self.checked_at is None else time.monotonic() - self.checked_at
+
+    # ── Readiness ──
+
+    def readiness(self) -> tuple[bool, dict]:
+        age = self.db_result_age()
+        fresh = age is not None and age <= 3 * settings.HEALTH_CHECK_INTERVAL
+        record_cache("health_db_ping", hit=fresh)
+        db_ready = fresh and self.db_ok
+        pool_ready = self.pool_saturation < settings.HEALTH_MAX_POOL_SATURATION
+        loop_age = reminder_heartbeat.age()
+        checks = {
+            "startup": {"ok": not startup.gated},
+            "database": {
+                "ok": db_ready,
+                "latency_ms": None if self.db_latency_seconds is None else round(self.db_latency_seconds * 1000, 1),
+                "checked_seconds_ago": None if age is None else round(age, 1),
+                "error": self.db_error,
+            },
+            "pool": {
+                "ok": pool_ready,
+                "in_use": self.connections_in_use,
+                "capacity": self.pool_capacity,
+                "saturation": round(self.pool_saturation, 3),
+            },
+            "reminder_loop": {
+                "ok": reminder_heartbeat.is_alive(),
+                "last_tick_seconds_ago": None if loop_age is None else round(loop_age, 1),
+            },
+        }
+        return all(check["ok"] for check in checks.values()), checks
+
+
+# The reminder loop ticks every 60 s; three missed ticks mean it is stuck
+reminder_heartbeat = Heartbeat(max_age_seconds=180)
+monitor = HealthMonitor()
@@ -0,0 +1,202 @@
+"""Durable background jobs stored in the ``jobs`` table; no broker needed.
+
+Enqueue inside the request's transaction so the job exists only if the
+request's own writes commit::
+
+    job = await enqueue(db, "delete_account", {"user_id": user.id}, user_id=user.id)
+    await db.commit()
+
+and register the handler once at import time::
+
+    @register("delete_account")
+    async def delete_account(ctx: JobContext, payload: dict) -> dict | None:
+        ...
+        await ctx.progress(0.5, "half way")
+
+Workers run in the API process (``JOB_WORKER_IN_PROCESS``) or on their own
+via ``python -m app.worker``, and share the same claim protocol:
+
+- a claim is one ``UPDATE ... WHERE id = (SELECT ... FOR UPDATE SKIP LOCKED)
+  RETURNING`` statement, so concurrent workers on Postgres never contend for
+  the same row (SQLite serialises writers, and the clause is omitted there);
+- a claim holds a lease of ``JOB_LEASE_SECONDS``, renewed by every progress
+  report; a job whose worker died is claimed again once its lease lapses;
+- a failed attempt is retried with exponential backoff
+  (``JOB_RETRY_BACKOFF_SECONDS`` doubling up to ``JOB_RETRY_BACKOFF_MAX_SECONDS``)
+  until ``max_attempts``, then left ``failed`` with its last error.
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import random
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import job_duration_seconds, jobs_total
+from app.core.startup import startup
+from app.models.job import Job
+
+logger = logging.getLogger("pwelltrack.jobs")
+
+Handler = Callable[["JobContext", dict], Awaitable[dict | None]]
+
+_handlers: dict[str, Handler] = {}
+
+# Modules whose import registers handlers; loaded by every worker
+HANDLER_MODULES: tuple[str, ...] = ("app.core.deletion",)
+
+
+def register(kind: str) -> Callable[[Handler], Handler]:
+    def decorator(fn: Handler) -> Handler:
+        if kind in _handlers:
+            raise ValueError(f"Job handler {kind!r} already registered")
+        _handlers[kind] = fn
+        return fn
+    return decorator
+
+
+def load_handlers() -> None:
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+
+async def enqueue(
+    db: AsyncSession,
+    kind: str,
+    payload: dict | None = None,
+    *,
+    user_id: int | None = None,
+    max_attempts: int | None = None,
+    delay: float = 0.0,
+) -> Job:
+    """Add a job to ``db``'s transaction; it becomes claimable once committed."""
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        user_id=user_id,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=datetime.now(timezone.utc) + timedelta(seconds=delay),
+    )
+    db.add(job)
+    await db.flush()
+    return job
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next attempt, with ±20% jitter so retries don't stampede."""
+    base = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return min(base, settings.JOB_RETRY_BACKOFF_MAX_SECONDS) * random.uniform(0.8, 1.2)
+
+
+class JobContext:
+    """What a handler gets besides its payload."""
+
+    def __init__(self, engine: AsyncEngine, job_id: int, worker_id: str, attempt: int):
+        self.engine = engine
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.attempt = attempt
+
+    async def progress(self, fraction: float, message: str | None = None) -> None:
+        """Record progress (0..1) and renew the lease."""
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                update(Job)
+                .where(Job.id == self.job_id, Job.locked_by == self.worker_id)
+                .values(
+                    progress=max(0.0, min(fraction, 1.0)),
+                    progress_message=message[:255] if message else None,
+                    locked_until=datetime.now(timezone.utc) + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                )
+            )
+
+
+class Worker:
+    """Claims and runs jobs with up to ``concurrency`` in flight."""
+
+    def __init__(self, engine: AsyncEngine, concurrency: int | None = None, poll_interval: float | None = None):
+        self.engine = engine
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.poll_interval = settings.JOB_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+
+    async def claim(self) -> tuple[int, str, dict, int, int] | None:
+        """Take the next due job (or one whose lease lapsed): (id, kind, payload, attempts, max_attempts)."""
+        now = datetime.now(timezone.utc)
+        claimable = or_(
+            and_(Job.status == "queued", Job.run_at <= now),
+            and_(Job.status == "running", Job.locked_until < now),  # lease lapsed
+        )
+        candidate = (
+            select(Job.id).where(claimable).order_by(Job.run_at).limit(1)
+            .with_for_update(skip_locked=True).scalar_subquery()
+        )
+        async with self.engine.begin() as conn:
+            row = (await conn.execute(
+                update(Job)
+                .where(Job.id == candidate, claimable)
+                .values(
+                    status="running",
+                    locked_by=self.worker_id,
+                    locked_until=now + timedelta(seconds=settings.JOB_LEASE_SECONDS),
+                    attempts=Job.attempts + 1,
+                )
+                .returning(Job.id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+            )).first()
+        return None if row is None else tuple(row)
+
+    async def run_once(self) -> bool:
+        """Claim and run one job; False when nothing was claimable."""
+        claimed = await self.claim()
+        if claimed is None:
+            return False
+        job_id, kind, payload, attempts, max_attempts = claimed
+        handler = _handlers.get(kind)
+        started = time.perf_counter()
+        try:
+            if handler is None:
+                raise LookupError(f"No handler registered for job kind {kind!r}")
+            result = await handler(JobContext(self.engine, job_id, self.worker_id, attempts), payload or {})
+        except Exception as e:
+            logger.warning("Job %s (%s) attempt %d failed: %s", job_id, kind, attempts, e)
+            final = handler is None or attempts >= max_attempts
+            values = {"last_error": f"{type(e).__name__}: {e}", "locked_by": None, "locked_until": None}
+            if final:
+                values.update(status="failed", finished_at=datetime.now(timezone.utc))
+            else:
+                values.update(status="queued",
+                              run_at=datetime.now(timezone.utc) + timedelta(seconds=retry_delay(attempts)))
+            outcome = "failed" if final else "retried"
+        else:
+            values = {"status": "succeeded", "result": result, "progress": 1.0,
+                      "locked_by": None, "locked_until": None, "finished_at": datetime.now(timezone.utc)}
+            outcome = "succeeded"
+        async with self.engine.begin() as conn:
+            await conn.execute(update(Job).where(Job.id == job_id, Job.locked_by == self.worker_id).values(**values))
+        jobs_total.inc(kind, outcome)
+        job_duration_seconds.observe(time.perf_counter() - started, kind)
+        return True
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                ran = await self.run_once()
+            except Exception as e:  # claim/bookkeeping failure, e.g. database unreachable
+                logger.error("Job worker error: %s", e)
+                ran = False
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+
+    async def run(self) -> None:
+        load_handlers()
+        await startup.ready.wait()
+        logger.info("Job worker %s started (%d slots)", self.worker_id, self.concurrency)
+        await asyncio.gather(*(self._loop() for _ in range(self.concurrency)))
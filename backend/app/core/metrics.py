@@ -0,0 +1,291 @@
+"""In-process metrics registry rendered in the Prometheus text format.
+
+Deliberately tiny: a metric is a dict from label values to numbers, and a
+histogram observation is one ``bisect`` plus three additions, so it is cheap
+enough to leave on in production.  Everything runs on the event loop thread,
+so no locking is done.  Scrape it at ``GET /metrics``.
+"""
+
+import time
+from bisect import bisect_left
+from typing import Callable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Request/query latencies in seconds: 1 ms .. 10 s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """Compute the (unlabelled) value lazily at scrape time."""
+        self._function = fn
+
+    def value(self, *labels: str) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        if self._function is not None:
+            lines.append(f"{self.name} {_format_value(self._function())}")
+            return lines
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last)..., sum, count]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [0.0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._values.get(labels)
+        return int(series[-1]) if series else 0
+
+    def sum(self, *labels: str) -> float:
+        series = self._values.get(labels)
+        return series[-2] if series else 0.0
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for labels, series in self._values.items():
+            cumulative = 0.0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), series):
+                cumulative += bucket_count
+                le = _format_labels(self.labelnames, labels, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {_format_value(cumulative)}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{label_str} {_format_value(series[-1])}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))  # type: ignore[return-value]
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))  # type: ignore[return-value]
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ── HTTP ──
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "HTTP requests currently being served.")
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"))
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route"))
+http_response_size_bytes_total = registry.counter(
+    "http_response_size_bytes_total", "Compressed response bodies before and after encoding.",
+    ("encoding", "stage"))
+http_response_compression_ratio = registry.histogram(
+    "http_response_compression_ratio", "Compressed / original body size per compressed response.",
+    ("encoding",), buckets=(0.05, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0))
+http_response_compression_cpu_seconds = registry.histogram(
+    "http_response_compression_cpu_seconds", "CPU time spent compressing one response body.",
+    ("encoding",), buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25))
+
+# ── Database ──
+db_queries_total = registry.counter(
+    "db_queries_total", "SQL statements executed, by statement kind.", ("operation",))
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds", "SQL statement execution time, by statement kind.", ("operation",))
+
+# ── WebSocket / background work ──
+ws_connections = registry.gauge(
+    "ws_connections", "Open notification WebSocket connections.")
+reminder_tick_duration_seconds = registry.histogram(
+    "reminder_tick_duration_seconds", "Duration of one reminder loop tick.",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+retention_rows_deleted_total = registry.counter(
+    "retention_rows_deleted_total", "Rows removed by retention batches, by table.", ("table",))
+jobs_total = registry.counter(
+    "jobs_total", "Background job attempts by kind and outcome.", ("kind", "outcome"))
+job_duration_seconds = registry.histogram(
+    "job_duration_seconds", "Duration of one background job attempt.", ("kind",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0))
+archive_rows_moved_total = registry.counter(
+    "archive_rows_moved_total", "Log rows moved to archive tables, by source table.", ("table",))
+
+# ── Startup ──
+startup_phase_seconds = registry.gauge(
+    "startup_phase_seconds", "Duration of each startup phase of this process.", ("phase",))
+
+# ── Caches ── (hit ratio = hits / (hits + misses))
+cache_requests_total = registry.counter(
+    "cache_requests_total", "In-process cache lookups by cache name and result.", ("cache", "result"))
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    cache_requests_total.inc(cache, "hit" if hit else "miss")
+
+
+# ── SQLAlchemy hooks ──
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip()[:10].split(None, 1)
+    return head[0].lower() if head else "other"
+
+
+def instrument_engine(sync_engine) -> None:
+    """Count and time every statement executed on ``sync_engine``."""
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        op = _operation(statement)
+        db_queries_total.inc(op)
+        db_query_duration_seconds.observe(elapsed, op)
+
+
+# ── ASGI middleware ──
+
+class MetricsMiddleware:
+    """Record in-flight requests, status counts and latency per route template."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            # The router stores the matched route in the (shared) scope; label by its
+            # template so /pets/{pet_id} stays one series instead of one per pet.
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            http_requests_total.inc(method, template, str(status_code))
+            http_request_duration_seconds.observe(time.perf_counter() - start, method, template)
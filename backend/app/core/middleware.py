@@ -0,0 +1,101 @@
+"""Pure ASGI middleware.
+
+``BaseHTTPMiddleware`` runs every request through an extra task and memory
+stream, which adds latency and buffers streaming responses.  These classes
+wrap ``send`` instead, so response messages pass straight through.
+"""
+
+import logging
+import time
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.query_stats import current_stats
+
+logger = logging.getLogger("pwelltrack")
+
+
+class RequestLoggingMiddleware:
+    """Log method, path, status, elapsed time and SQL usage for every HTTP request."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        stats = current_stats()
+        if stats is None:
+            logger.info("%s %s %d (%.0fms)", scope["method"], scope["path"], status_code, elapsed_ms)
+        else:
+            logger.info(
+                "%s %s %d (%.0fms, %d queries, %.1fms db)",
+                scope["method"], scope["path"], status_code, elapsed_ms,
+                stats.count, stats.total_seconds * 1000,
+            )
+
+
+class CORSSafetyMiddleware:
+    """Outermost middleware: catches any exception that escapes CORSMiddleware
+    and ensures the response always carries CORS headers."""
+
+    def __init__(self, app: ASGIApp, allowed_origins: list[str]):
+        self.app = app
+        self.allowed_origins = set(allowed_origins)
+        self.allow_all = "*" in self.allowed_origins
+
+    def get_cors_origin(self, scope: Scope) -> str | None:
+        """Return the origin to reflect in CORS headers, or None if not allowed."""
+        origin = Headers(scope=scope).get("origin")
+        if not origin:
+            return None
+        if self.allow_all:
+            return origin  # reflect the actual origin (never send literal "*")
+        if origin in self.allowed_origins:
+            return origin
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = self.get_cors_origin(scope)
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                # Ensure CORS headers exist — if CORSMiddleware didn't set them
+                # (e.g. on uncaught exceptions), set them here.
+                headers = MutableHeaders(scope=message)
+                if origin and "access-control-allow-origin" not in headers:
+                    headers["access-control-allow-origin"] = origin
+                    headers["access-control-allow-credentials"] = "true"
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            logger.exception("Exception escaped middleware stack on %s %s", scope["method"], scope["path"])
+            if response_started:
+                # Headers are already on the wire; nothing sensible left to send.
+                raise
+            response = JSONResponse(status_code=500, content={"detail": "Internal server error"})
+            await response(scope, receive, send_wrapper)
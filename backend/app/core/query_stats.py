@@ -0,0 +1,120 @@
+"""Per-request SQL instrumentation.
+
+Engine cursor hooks feed every executed statement into the ``QueryStats``
+collectors active in the current context.  ``QueryStatsMiddleware`` opens
+one per HTTP request (the request log line picks it up through
+``current_stats()``), logs the slowest statement at DEBUG, warns when the
+same statement repeats often enough to look like an N+1 pattern and, when
+``SQL_STATS_HEADERS`` is on, reports the numbers in response headers.
+Tests use ``capture_queries()`` to enforce query budgets per endpoint.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger("pwelltrack.sql")
+
+_active: ContextVar[tuple["QueryStats", ...]] = ContextVar("query_stats", default=())
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[statement] += 1
+        if elapsed >= self.slowest_seconds:
+            self.slowest_seconds = elapsed
+            self.slowest_statement = statement
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least ``threshold`` times (likely N+1 loops)."""
+        return [(stmt, n) for stmt, n in self.statements.most_common() if n >= threshold]
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Collect every statement executed in this context (nests with other collectors)."""
+    stats = QueryStats()
+    token = _active.set(_active.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def current_stats() -> QueryStats | None:
+    """The innermost active collector (the current request's), if any."""
+    active = _active.get()
+    return active[-1] if active else None
+
+
+def instrument_queries(sync_engine) -> None:
+    """Attach the per-context collectors to ``sync_engine``."""
+    from sqlalchemy import event
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_stats_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_stats_start"].pop()
+        for stats in _active.get():
+            stats.record(statement, elapsed)
+
+
+def _shorten(statement: str | None, limit: int = 200) -> str:
+    text = " ".join((statement or "").split())
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+class QueryStatsMiddleware:
+    """Track SQL per HTTP request; log it, flag N+1 patterns, optionally add headers."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with capture_queries() as stats:
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start" and settings.SQL_STATS_HEADERS:
+                    headers = MutableHeaders(scope=message)
+                    headers["x-db-query-count"] = str(stats.count)
+                    headers["x-db-time-ms"] = f"{stats.total_seconds * 1000:.1f}"
+                    headers.append("server-timing", f"db;dur={stats.total_seconds * 1000:.1f}")
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        if not stats.count:
+            return
+        logger.debug(
+            "%s %s slowest query %.1fms: %s",
+            scope["method"], scope["path"], stats.slowest_seconds * 1000, _shorten(stats.slowest_statement),
+        )
+        for statement, times in stats.repeated(settings.SQL_N_PLUS_ONE_THRESHOLD):
+            logger.warning(
+                "Possible N+1 on %s %s: statement ran %d times: %s",
+                scope["method"], scope["path"], times, _shorten(statement),
+            )
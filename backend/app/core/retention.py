@@ -0,0 +1,142 @@
+"""Retention for ``sent_notifications``.
+
+Reminders only ever look up today's (and, for event reminders straddling
+midnight, yesterday's) dedup rows, so anything older than
+``SENT_NOTIFICATION_RETENTION_DAYS`` is dead weight in the table and in
+``uq_sent_notification``.  ``retention_loop`` purges it every
+``RETENTION_INTERVAL_SECONDS``:
+
+- on Postgres, where the table is range-partitioned by month of
+  ``sent_date`` (migration a7b8c9d0e1f2), partitions that lie entirely before
+  the cutoff are dropped outright and the next months' partitions are
+  created ahead of time;
+- rows left over (SQLite, the default partition, the cutoff month) are
+  deleted ``RETENTION_BATCH_SIZE`` at a time, one short transaction per
+  batch, so the purge never holds long locks against the reminder loop.
+"""
+
+import asyncio
+import logging
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import retention_rows_deleted_total
+from app.core.startup import startup
+from app.models.sent_notification import SentNotification
+
+logger = logging.getLogger("pwelltrack.retention")
+
+PARTITION_PREFIX = "sent_notifications_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+# Months of partitions kept ready ahead of today
+PARTITIONS_AHEAD = 2
+
+
+def _month_start(day: date, offset: int = 0) -> date:
+    month = day.month - 1 + offset
+    return date(day.year + month // 12, month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_ddl(month: date) -> str:
+    """CREATE statement for the partition holding ``month``'s rows."""
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF sent_notifications "
+        f"FOR VALUES FROM ('{_month_start(month):%Y-%m-%d}') TO ('{_month_start(month, 1):%Y-%m-%d}')"
+    )
+
+
+async def _is_partitioned(engine: AsyncEngine) -> bool:
+    if engine.dialect.name != "postgresql":
+        return False
+    async with engine.connect() as conn:
+        result = await conn.execute(text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = 'sent_notifications'"
+        ))
+        return result.first() is not None
+
+
+async def maintain_partitions(engine: AsyncEngine, cutoff: date, today: date) -> int:
+    """Create upcoming monthly partitions and drop those wholly before ``cutoff``.
+
+    Returns the number of partitions dropped.
+    """
+    async with engine.begin() as conn:
+        for offset in range(PARTITIONS_AHEAD + 1):
+            try:
+                async with conn.begin_nested():
+                    await conn.execute(text(partition_ddl(_month_start(today, offset))))
+            except Exception as e:  # e.g. the default partition already holds rows for that month
+                logger.warning("Could not create partition for %s: %s", _month_start(today, offset), e)
+        result = await conn.execute(text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = 'sent_notifications'"
+        ))
+        dropped = 0
+        for (name,) in result.all():
+            match = _PARTITION_NAME.match(name)
+            if not match:
+                continue
+            month = date(int(match[1]), int(match[2]), 1)
+            if _month_start(month, 1) <= cutoff:
+                await conn.execute(text(f"DROP TABLE {name}"))
+                logger.info("Dropped partition %s", name)
+                dropped += 1
+    return dropped
+
+
+async def purge_sent_notifications(
+    engine: AsyncEngine,
+    retention_days: int | None = None,
+    batch_size: int | None = None,
+    today: date | None = None,
+) -> int:
+    """Delete dedup rows older than the retention window; returns rows deleted by batches."""
+    retention_days = settings.SENT_NOTIFICATION_RETENTION_DAYS if retention_days is None else retention_days
+    batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+    today = today or datetime.now(timezone.utc).date()
+    # Event reminders still consult yesterday's rows
+    cutoff = today - timedelta(days=max(retention_days, 2))
+
+    if await _is_partitioned(engine):
+        await maintain_partitions(engine, cutoff, today)
+
+    total = 0
+    while True:
+        batch = (
+            select(SentNotification.id)
+            .where(SentNotification.sent_date < cutoff)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        async with engine.begin() as conn:
+            result = await conn.execute(delete(SentNotification).where(SentNotification.id.in_(batch)))
+        deleted = result.rowcount or 0
+        total += deleted
+        retention_rows_deleted_total.inc("sent_notifications", amount=deleted)
+        if deleted < batch_size:
+            break
+        await asyncio.sleep(0)  # let other tasks at the connection pool between batches
+    if total:
+        logger.info("Purged %d sent_notifications rows before %s", total, cutoff)
+    return total
+
+
+async def retention_loop(engine: AsyncEngine):
+    """Run the purge every RETENTION_INTERVAL_SECONDS."""
+    await startup.ready.wait()
+    while True:
+        try:
+            await purge_sent_notifications(engine)
+        except Exception as e:
+            logger.error("sent_notifications retention failed: %s", e)
+        await asyncio.sleep(settings.RETENTION_INTERVAL_SECONDS)
@@ -0,0 +1,193 @@
+"""Full-text search over notes, event titles/locations and symptom types.
+
+The index lives in the database and is kept current by the database itself,
+so every write path (ORM, the single-statement INSERT/UPDATE helpers, bulk
+deletes, archival, cascades) stays searchable without application hooks:
+
+- SQLite: one FTS5 table, ``search_index``, fed by AFTER INSERT/UPDATE/DELETE
+  triggers on each source table.  The FTS rowid encodes the source
+  (``id * len(SOURCES) + position``) so deletes hit the rowid directly, and
+  an ``owner`` column holding ``u<user_id>`` lets the match itself scope
+  results to one user before ranking.
+- Postgres: a generated ``search_vector tsvector`` column on each source
+  table with a GIN index; a query is a UNION ALL of per-table index scans
+  joined to the caller's pets.
+
+Both use the ``simple`` configuration (no stemming) because notes are written
+in more than one language, and match every query word as a prefix.
+"""
+
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import Base
+
+FTS_TABLE = "search_index"
+MAX_TERMS = 16
+
+
+@dataclass(frozen=True)
+class SearchSource:
+    kind: str
+    table: str
+    columns: tuple[str, ...]
+    pet_id: str = "pet_id"  # column naming the owning pet
+
+
+SOURCES = (
+    SearchSource("pet", "pets", ("notes",), pet_id="id"),
+    SearchSource("feeding", "feeding_logs", ("notes",)),
+    SearchSource("feeding", "feeding_logs_archive", ("notes",)),
+    SearchSource("symptom", "symptoms", ("type", "notes")),
+    SearchSource("event", "events", ("title", "location", "notes")),
+    SearchSource("vaccine", "vaccines", ("notes",)),
+    SearchSource("medication", "medications", ("notes",)),
+)
+
+
+def _body(columns: tuple[str, ...], prefix: str = "") -> str:
+    return " || ' ' || ".join(f"coalesce({prefix}{c}, '')" for c in columns)
+
+
+def _index_rows(source: SearchSource, position: int, alias: str, joined: bool = False) -> str:
+    """INSERT ... SELECT adding ``alias``'s row(s) of ``source`` to the FTS table."""
+    body = _body(source.columns, f"{alias}.")
+    source_table = f"{source.table} {alias} JOIN pets ON" if joined else "pets WHERE"
+    return (
+        f"INSERT INTO {FTS_TABLE} (rowid, body, owner, pet_id) "
+        f"SELECT {alias}.id * {len(SOURCES)} + {position}, {body}, 'u' || pets.user_id, pets.id "
+        f"FROM {source_table} pets.id = {alias}.{source.pet_id} {'WHERE' if joined else 'AND'} trim({body}) != ''"
+    )
+
+
+def sqlite_ddl() -> list[str]:
+    """The FTS5 table and the triggers that keep it in step with the source tables."""
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+        "body, owner, pet_id UNINDEXED, tokenize = 'unicode61 remove_diacritics 2')"
+    ]
+    for position, source in enumerate(SOURCES):
+        name = f"{FTS_TABLE}_{source.table}"
+        unindex = f"DELETE FROM {FTS_TABLE} WHERE rowid = OLD.id * {len(SOURCES)} + {position}"
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {source.table} "
+            f"BEGIN {_index_rows(source, position, 'NEW')}; END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {', '.join(source.columns)} "
+            f"ON {source.table} BEGIN {unindex}; {_index_rows(source, position, 'NEW')}; END",
+            f"CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {source.table} "
+            f"BEGIN {unindex}; END",
+        ]
+    return statements
+
+
+def sqlite_backfill() -> list[str]:
+    """Index rows written before the triggers existed."""
+    return [_index_rows(source, position, "t", joined=True) for position, source in enumerate(SOURCES)]
+
+
+def sqlite_drop_ddl() -> list[str]:
+    statements = [f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{s.table}_{op}" for s in SOURCES for op in ("ai", "au", "ad")]
+    return statements + [f"DROP TABLE IF EXISTS {FTS_TABLE}"]
+
+
+def postgres_ddl() -> list[str]:
+    statements = []
+    for source in SOURCES:
+        statements += [
+            f"ALTER TABLE {source.table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS (to_tsvector('simple', {_body(source.columns)})) STORED",
+            f"CREATE INDEX IF NOT EXISTS ix_{source.table}_search_vector ON {source.table} USING gin (search_vector)",
+        ]
+    return statements
+
+
+def postgres_drop_ddl() -> list[str]:
+    return [
+        f"ALTER TABLE {s.table} DROP COLUMN IF EXISTS search_vector" for s in SOURCES
+    ]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_index(target, connection, **kw) -> None:
+    # create_all (tests, boots without migrations); migration f2a3b4c5d6e7 runs the same DDL
+    if connection.dialect.name == "postgresql":
+        statements = postgres_ddl()
+    elif connection.dialect.name == "sqlite":
+        exists = connection.exec_driver_sql(
+            f"SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = '{FTS_TABLE}'").first()
+        statements = [] if exists else sqlite_ddl() + sqlite_backfill()
+    else:
+        statements = []
+    for statement in statements:
+        connection.exec_driver_sql(statement)
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_index(target, connection, **kw) -> None:
+    ddl = {"sqlite": sqlite_drop_ddl, "postgresql": postgres_drop_ddl}.get(connection.dialect.name)
+    for statement in ddl() if ddl else ():
+        connection.exec_driver_sql(statement)
+
+
+def query_terms(q: str) -> list[str]:
+    """Words of a free-text query; punctuation and FTS operators are dropped."""
+    return re.findall(r"\w+", q.lower())[:MAX_TERMS]
+
+
+_SQLITE_SEARCH = text(f"""
+    SELECT rowid, pet_id, -bm25({FTS_TABLE}, 1.0, 0.0) AS score,
+           snippet({FTS_TABLE}, 0, '[', ']', '…', 12) AS snippet
+    FROM {FTS_TABLE}
+    WHERE {FTS_TABLE} MATCH :match
+    ORDER BY bm25({FTS_TABLE}, 1.0, 0.0), rowid DESC
+    LIMIT :limit OFFSET :offset
+""")
+
+
+def _postgres_search():
+    branches = " UNION ALL ".join(
+        f"SELECT '{s.kind}' AS kind, t.id, t.{s.pet_id} AS pet_id, "
+        f"ts_rank(t.search_vector, q.query) AS score, {_body(s.columns, 't.')} AS body "
+        f"FROM {s.table} t JOIN pets p ON p.id = t.{s.pet_id} CROSS JOIN q "
+        f"WHERE p.user_id = :user_id AND t.search_vector @@ q.query"
+        for s in SOURCES
+    )
+    return text(f"""
+        WITH q AS (SELECT to_tsquery('simple', :tsquery) AS query)
+        SELECT page.kind, page.id, page.pet_id, page.score,
+               ts_headline('simple', page.body, (SELECT query FROM q),
+                           'StartSel=[, StopSel=], MaxFragments=1, MaxWords=12, MinWords=4') AS snippet
+        FROM (
+            SELECT * FROM ({branches}) hits
+            ORDER BY score DESC, id DESC
+            LIMIT :limit OFFSET :offset
+        ) page
+        ORDER BY page.score DESC, page.id DESC
+    """)
+
+
+_POSTGRES_SEARCH = _postgres_search()
+
+
+async def search(db: AsyncSession, user_id: int, q: str, limit: int, offset: int) -> list[dict]:
+    """Ranked hits (kind, id, pet_id, score, snippet) among ``user_id``'s records."""
+    terms = query_terms(q)
+    if not terms:
+        return []
+    if db.bind.dialect.name == "postgresql":
+        rows = await db.execute(_POSTGRES_SEARCH, {
+            "tsquery": " & ".join(f"{t}:*" for t in terms),
+            "user_id": user_id, "limit": limit, "offset": offset,
+        })
+        return [dict(row._mapping) for row in rows]
+
+    match = f'owner : "u{user_id}" AND body : (' + " ".join(f'"{t}"*' for t in terms) + ")"
+    rows = await db.execute(_SQLITE_SEARCH, {"match": match, "limit": limit, "offset": offset})
+    n = len(SOURCES)
+    return [
+        {"kind": SOURCES[rowid % n].kind, "id": rowid // n, "pet_id": pet_id, "score": score, "snippet": snippet}
+        for rowid, pet_id, score, snippet in rows
+    ]
@@ -89,6 +89,6 @@ async def get_current_user(
         raise credentials_exception
 
     user = await db.get(User, uid)
-    if user is None:
+    if user is None or user.deleted_at is not None:
         raise credentials_exception
     return user
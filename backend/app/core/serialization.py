@@ -0,0 +1,35 @@
+"""Single-pass response serialization.
+
+Handlers that return Pydantic models get validated twice: once by
+``XOut.model_validate`` and again by FastAPI against ``response_model``
+before being run through ``jsonable_encoder``.  ``Serializer`` compiles a
+``TypeAdapter`` per response schema once at import time and has
+pydantic-core write ORM rows straight to JSON bytes, which FastAPI passes
+through untouched.  Keep ``response_model=`` on the route so the OpenAPI
+schema stays accurate.
+"""
+
+from typing import Any, Generic, TypeVar
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+class Serializer(Generic[T]):
+    """Precompiled ORM → JSON serializer for one response schema."""
+
+    def __init__(self, schema: type[T]):
+        self._adapter: TypeAdapter[T] = TypeAdapter(schema)
+
+    def to_json(self, obj: Any) -> bytes:
+        """Validate ``obj`` (ORM rows or schema instances) and encode it as JSON.
+
+        Output matches FastAPI's default encoding (aliases applied, ISO dates).
+        """
+        value = self._adapter.validate_python(obj, from_attributes=True)
+        return self._adapter.dump_json(value, by_alias=True)
+
+    def response(self, obj: Any, status_code: int = 200) -> Response:
+        return Response(self.to_json(obj), status_code=status_code, media_type="application/json")
@@ -0,0 +1,149 @@
+"""Startup phases, timings and the readiness gate.
+
+With ``FAST_STARTUP`` on (meant for scale-to-zero hosting), the lifespan no
+longer blocks on the database: it closes the readiness gate, hands the DB
+work to a background task and lets uvicorn accept connections right away.
+On Postgres that work is one ``SELECT version_num FROM alembic_version``
+compared against the migration scripts' head instead of ``create_all``;
+``alembic upgrade head`` only runs (as a subprocess) when the database is
+behind.  Requests arriving while the gate is closed wait for it for up to
+``STARTUP_GATE_TIMEOUT`` seconds, then get a 503 with ``Retry-After``.
+
+Every phase is timed, logged once startup finishes and exported as
+``startup_phase_seconds{phase=...}`` on ``/metrics``.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from sqlalchemy import text
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import startup_phase_seconds
+
+logger = logging.getLogger("pwelltrack.startup")
+
+_BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Probes and scrapes must answer while the gate is closed
+_UNGATED_PATHS = ("/health", "/metrics")
+
+
+class StartupState:
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self._ready: asyncio.Event | None = None
+        self.gated = False
+
+    @property
+    def ready(self) -> asyncio.Event:
+        if self._ready is None:
+            self._ready = asyncio.Event()
+            self._ready.set()
+        return self._ready
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+        startup_phase_seconds.set(seconds, name)
+
+    def close_gate(self) -> None:
+        self.gated = True
+        self._ready = asyncio.Event()  # binds to the running loop on first wait
+
+    def open_gate(self) -> None:
+        self.gated = False
+        self.ready.set()
+
+    def log_summary(self) -> None:
+        logger.info("Startup phases: %s", ", ".join(f"{k}={v * 1000:.0f}ms" for k, v in self.phases.items()))
+
+
+startup = StartupState()
+
+
+def migration_head() -> str | None:
+    """Head revision of the migration scripts on disk (no database access)."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+
+    config = Config(str(_BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(_BACKEND_DIR / "alembic"))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+async def database_revision(engine) -> str | None:
+    async with engine.connect() as conn:
+        return (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar()
+
+
+async def _upgrade_database() -> bool:
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "alembic", "upgrade", "head", cwd=str(_BACKEND_DIR),
+    )
+    return await proc.wait() == 0
+
+
+async def prepare_database(engine, create_all) -> None:
+    """Check (Postgres) or create (SQLite) the schema, retrying while the DB wakes up."""
+    max_retries = settings.DB_CONNECT_RETRIES
+    for attempt in range(1, max_retries + 1):
+        try:
+            if settings.FAST_STARTUP and settings.is_postgres:
+                with startup.phase("migration_head"):
+                    head = migration_head()
+                with startup.phase("revision_check"):
+                    current = await database_revision(engine)
+                if current != head:
+                    logger.warning("Database at revision %s, expected %s; running migrations", current, head)
+                    with startup.phase("migrate"):
+                        if not await _upgrade_database():
+                            logger.error("alembic upgrade head failed; DB-dependent routes may fail")
+            else:
+                with startup.phase("create_all"):
+                    async with engine.begin() as conn:
+                        await conn.run_sync(create_all)
+            return
+        except Exception as exc:
+            logger.warning("DB connection attempt %d/%d failed: %s", attempt, max_retries, exc)
+            if attempt < max_retries:
+                await asyncio.sleep(settings.DB_CONNECT_RETRY_DELAY)
+    logger.error(
+        "Could not connect to database after %d attempts. "
+        "The API will start but DB-dependent routes may fail.",
+        max_retries,
+    )
+
+
+class ReadinessGateMiddleware:
+    """Hold requests until startup has finished (only while ``startup.gated``)."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if startup.gated and scope["type"] == "http" and not scope["path"].startswith(_UNGATED_PATHS):
+            try:
+                await asyncio.wait_for(startup.ready.wait(), settings.STARTUP_GATE_TIMEOUT)
+            except asyncio.TimeoutError:
+                response = JSONResponse(
+                    {"detail": "Service is starting, retry shortly"}, status_code=503,
+                    headers={"Retry-After": "5"},
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
@@ -4,15 +4,24 @@ import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
+from fastapi.responses import JSONResponse, PlainTextResponse
+from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from starlette.middleware.base import BaseHTTPMiddleware
 
+from app import IMPORT_STARTED
+from app.core.archive import archive_loop
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
 from app.core.database import engine, Base
-from app.routers import auth, pets, feeding, water, vaccines, medications, events, symptoms, notifications, weight
+from app.core.health import monitor as health_monitor
+from app.core.jobs import Worker
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry
+from app.core.middleware import CORSSafetyMiddleware, RequestLoggingMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.rate_limit import limiter
+from app.core.retention import retention_loop
+from app.core.startup import ReadinessGateMiddleware, prepare_database, startup
+from app.routers import auth, pets, feeding, water, vaccines, medications, events, symptoms, notifications, weight, jobs, timeline, search
 
 # Configure logging
 logging.basicConfig(
@@ -22,8 +31,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger("pwelltrack")
 
-limiter = Limiter(key_func=get_remote_address)
-
 
 # --- Allowed origins for CORS ---
 _ALLOWED_ORIGINS = [o.strip() for o in settings.CORS_ORIGINS.split(",")]
@@ -43,18 +50,6 @@ if _ALLOW_ALL:
         )
 
 
-def _get_cors_origin(request: Request) -> str | None:
-    """Return the origin to reflect in CORS headers, or None if not allowed."""
-    origin = request.headers.get("origin")
-    if not origin:
-        return None
-    if _ALLOW_ALL:
-        return origin  # reflect the actual origin (never send literal "*")
-    if origin in _ALLOWED_ORIGINS:
-        return origin
-    return None
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting PWellTrack API")
@@ -70,33 +65,40 @@ async def lifespan(app: FastAPI):
     # Create tables on startup (only needed for local dev with SQLite;
     # in production Alembic handles migrations).  If the database is
     # temporarily unreachable (e.g. Supabase free-tier waking up), retry
-    # a few times so the app doesn't crash on a cold start.
-    max_retries = settings.DB_CONNECT_RETRIES
-    retry_delay = settings.DB_CONNECT_RETRY_DELAY
-    for attempt in range(1, max_retries + 1):
+    # a few times so the app doesn't crash on a cold start.  FAST_STARTUP
+    # does this in the background behind the readiness gate instead.
+    lifespan_started = time.perf_counter()
+
+    async def prepare():
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(Base.metadata.create_all)
-            break
-        except Exception as exc:
-            logger.warning("DB connection attempt %d/%d failed: %s", attempt, max_retries, exc)
-            if attempt < max_retries:
-                await asyncio.sleep(retry_delay)
-            else:
-                logger.error(
-                    "Could not connect to database after %d attempts. "
-                    "The API will start but DB-dependent routes may fail.",
-                    max_retries,
-                )
+            await prepare_database(engine, Base.metadata.create_all)
+        finally:
+            startup.record("lifespan_to_ready", time.perf_counter() - lifespan_started)
+            startup.open_gate()
+            startup.log_summary()
+
+    warm_up = None
+    if settings.FAST_STARTUP:
+        startup.close_gate()
+        warm_up = asyncio.create_task(prepare())
+    else:
+        await prepare()
     # Start background reminder loop
     task = asyncio.create_task(notifications.reminder_loop())
     logger.info("Background reminder loop started")
+    health_task = asyncio.create_task(health_monitor.run(engine))
+    retention_task = asyncio.create_task(retention_loop(engine))
+    archive_task = asyncio.create_task(archive_loop(engine))
+    worker_task = asyncio.create_task(Worker(engine).run()) if settings.JOB_WORKER_IN_PROCESS else None
     yield
-    task.cancel()
-    try:
-        await task
-    except asyncio.CancelledError:
-        pass
+    for background in (task, health_task, retention_task, archive_task, worker_task, warm_up):
+        if background is None:
+            continue
+        background.cancel()
+        try:
+            await background
+        except asyncio.CancelledError:
+            pass
     logger.info("PWellTrack API shutting down")
 
 
@@ -105,22 +107,6 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 
-# --- Request logging middleware ---
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start = time.perf_counter()
-    response = await call_next(request)
-    elapsed_ms = (time.perf_counter() - start) * 1000
-    logger.info(
-        "%s %s %d (%.0fms)",
-        request.method,
-        request.url.path,
-        response.status_code,
-        elapsed_ms,
-    )
-    return response
-
-
 # --- Global exception handler ---
 # NOTE: Do NOT add CORS headers here — CORSMiddleware handles them.
 # Adding them here causes duplicate headers that browsers reject.
@@ -133,33 +119,22 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-class CORSSafetyMiddleware(BaseHTTPMiddleware):
-    """Outermost middleware: catches any exception that escapes CORSMiddleware
-    and ensures the response always carries CORS headers."""
-
-    async def dispatch(self, request: Request, call_next):
-        try:
-            response = await call_next(request)
-        except Exception:
-            logger.exception("Exception escaped middleware stack on %s %s", request.method, request.url.path)
-            response = JSONResponse(status_code=500, content={"detail": "Internal server error"})
-
-        # Ensure CORS headers exist — if CORSMiddleware didn't set them (e.g. on
-        # uncaught exceptions), set them here.
-        if "access-control-allow-origin" not in response.headers:
-            origin = _get_cors_origin(request)
-            if origin:
-                response.headers["access-control-allow-origin"] = origin
-                response.headers["access-control-allow-credentials"] = "true"
-        return response
-
-
 # Middleware order matters — outermost first:
 # 1. CORSSafetyMiddleware (catches everything, ensures CORS on errors)
 # 2. CORSMiddleware (standard CORS handling for normal requests)
-# 3. log_requests (request logging)
-# 4. FastAPI ExceptionMiddleware + route handlers
-app.add_middleware(CORSSafetyMiddleware)
+# 3. QueryStatsMiddleware (per-request SQL count/time, N+1 warnings)
+# 4. RequestLoggingMiddleware (request logging)
+# 5. MetricsMiddleware (latency histograms per route template)
+# 6. CompressionMiddleware (zstd/br/gzip for bodies over COMPRESSION_MINIMUM_SIZE)
+# 7. ReadinessGateMiddleware (holds requests while FAST_STARTUP warms up)
+# 8. FastAPI ExceptionMiddleware + route handlers
+# add_middleware() wraps the current stack, so register innermost first.
+# All are pure ASGI: responses (including streams) pass straight through.
+app.add_middleware(ReadinessGateMiddleware)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestLoggingMiddleware)
+app.add_middleware(QueryStatsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=_ALLOWED_ORIGINS,
@@ -167,6 +142,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(CORSSafetyMiddleware, allowed_origins=_ALLOWED_ORIGINS)
 
 app.include_router(auth.router)
 app.include_router(pets.router)
@@ -178,6 +154,9 @@ app.include_router(events.router)
 app.include_router(symptoms.router)
 app.include_router(notifications.router)
 app.include_router(weight.router)
+app.include_router(jobs.router)
+app.include_router(timeline.router)
+app.include_router(search.router)
 
 
 @app.get("/")
@@ -186,5 +165,26 @@ async def root():
 
 
 @app.get("/health")
+@app.get("/health/live")
 async def health():
+    """Liveness: the process is up and serving (no dependencies checked)."""
     return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def health_ready():
+    """Readiness from cached background checks; never queries the database itself."""
+    ready, checks = health_monitor.readiness()
+    return JSONResponse(
+        {"status": "ready" if ready else "not_ready", "checks": checks},
+        status_code=200 if ready else 503,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of the in-process metrics registry."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
+startup.record("import", time.perf_counter() - IMPORT_STARTED)
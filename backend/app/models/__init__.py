@@ -1,23 +1,27 @@
 from app.models.user import User
 from app.models.pet import Pet
-from app.models.feeding_log import FeedingLog
-from app.models.water_log import WaterLog
+from app.models.feeding_log import FeedingLog, FeedingLogArchive
+from app.models.water_log import WaterLog, WaterLogArchive
 from app.models.vaccine import Vaccine
 from app.models.medication import Medication
 from app.models.event import Event
 from app.models.symptom import Symptom
 from app.models.weight_log import WeightLog
 from app.models.sent_notification import SentNotification
+from app.models.job import Job
 
 __all__ = [
     "User",
     "Pet",
     "FeedingLog",
+    "FeedingLogArchive",
     "WaterLog",
+    "WaterLogArchive",
     "Vaccine",
     "Medication",
     "Event",
     "Symptom",
     "WeightLog",
     "SentNotification",
+    "Job",
 ]
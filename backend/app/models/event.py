@@ -1,6 +1,6 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Text
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Index, Text, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Per-pet "next N upcoming events" (pets_summary, pet_today)
+        Index("ix_events_pet_id_datetime_start", "pet_id", "datetime_start"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"), index=True)
@@ -18,5 +22,23 @@ class Event(Base):
     location: Mapped[Optional[str]] = mapped_column(String(300), nullable=True)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     reminder_minutes_before: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # Denormalized fire time (datetime_start - reminder_minutes_before, UTC) so the
+    # reminder loop can fetch due reminders with a single indexed range query.
+    reminder_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
 
     pet = relationship("Pet", back_populates="events")
+
+
+def compute_reminder_at(start: datetime | None, minutes_before: int | None) -> datetime | None:
+    """Return the UTC fire time for an event reminder, or None if no reminder is set."""
+    if start is None or minutes_before is None:
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    return (start - timedelta(minutes=minutes_before)).astimezone(timezone.utc)
+
+
+@event.listens_for(Event, "before_insert")
+@event.listens_for(Event, "before_update")
+def _sync_reminder_at(mapper, connection, target: Event) -> None:
+    target.reminder_at = compute_reminder_at(target.datetime_start, target.reminder_minutes_before)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import String, Float, DateTime, ForeignKey, Text
+from sqlalchemy import String, Float, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class FeedingLog(Base):
     __tablename__ = "feeding_logs"
+    __table_args__ = (
+        # Per-pet newest-first reads (history lists, timeline)
+        Index("ix_feeding_logs_pet_id_datetime", "pet_id", "datetime"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"), index=True)
@@ -20,3 +24,21 @@ class FeedingLog(Base):
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     pet = relationship("Pet", back_populates="feeding_logs")
+
+
+class FeedingLogArchive(Base):
+    """Feeding logs moved out of the hot table by app.core.archive (ids preserved)."""
+    __tablename__ = "feeding_logs_archive"
+    __table_args__ = (
+        Index("ix_feeding_logs_archive_pet_id_datetime", "pet_id", "datetime"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"))
+    datetime_: Mapped[datetime] = mapped_column("datetime", DateTime(timezone=True))
+    food_type: Mapped[str] = mapped_column(String(120))
+    planned_amount_grams: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    actual_amount_grams: Mapped[float] = mapped_column(Float)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    pet = relationship("Pet", back_populates="archived_feeding_logs")
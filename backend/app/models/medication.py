@@ -1,6 +1,6 @@
 from datetime import date
 from typing import Optional
-from sqlalchemy import String, Integer, Date, ForeignKey, Text, JSON
+from sqlalchemy import String, Integer, Date, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,9 @@ from app.core.database import Base
 
 class Medication(Base):
     __tablename__ = "medications"
+    __table_args__ = (
+        Index("ix_medications_pet_id_start_end", "pet_id", "start_date", "end_date"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"), index=True)
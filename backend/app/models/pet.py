@@ -29,10 +29,13 @@ class Pet(Base):
     )
 
     owner = relationship("User", back_populates="pets")
-    feeding_logs = relationship("FeedingLog", back_populates="pet", cascade="all, delete-orphan")
-    water_logs = relationship("WaterLog", back_populates="pet", cascade="all, delete-orphan")
-    vaccines = relationship("Vaccine", back_populates="pet", cascade="all, delete-orphan")
-    medications = relationship("Medication", back_populates="pet", cascade="all, delete-orphan")
-    events = relationship("Event", back_populates="pet", cascade="all, delete-orphan")
-    symptoms = relationship("Symptom", back_populates="pet", cascade="all, delete-orphan")
-    weight_logs = relationship("WeightLog", back_populates="pet", cascade="all, delete-orphan")
+    # Children are removed by the ON DELETE CASCADE foreign keys, never loaded for deletion
+    feeding_logs = relationship("FeedingLog", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    water_logs = relationship("WaterLog", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    vaccines = relationship("Vaccine", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    medications = relationship("Medication", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    events = relationship("Event", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    symptoms = relationship("Symptom", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    weight_logs = relationship("WeightLog", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    archived_feeding_logs = relationship("FeedingLogArchive", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
+    archived_water_logs = relationship("WaterLogArchive", back_populates="pet", cascade="all, delete-orphan", passive_deletes=True)
@@ -6,6 +6,8 @@ from app.core.database import Base
 
 
 class SentNotification(Base):
+    # On Postgres the table is partitioned by month of sent_date with a
+    # (id, sent_date) primary key; see app.core.retention
     __tablename__ = "sent_notifications"
     __table_args__ = (
         UniqueConstraint("user_id", "notification_key", "sent_date", name="uq_sent_notification"),
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import String, DateTime, ForeignKey, Text
+from sqlalchemy import String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Symptom(Base):
     __tablename__ = "symptoms"
+    __table_args__ = (
+        # Per-pet newest-first reads (history lists, timeline)
+        Index("ix_symptoms_pet_id_datetime", "pet_id", "datetime"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"), index=True)
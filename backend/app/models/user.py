@@ -23,5 +23,7 @@ class User(Base):
         default=lambda: datetime.now(timezone.utc),
         onupdate=lambda: datetime.now(timezone.utc),
     )
+    # Set when a large account is handed to the background delete_account job
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    pets = relationship("Pet", back_populates="owner", cascade="all, delete-orphan")
+    pets = relationship("Pet", back_populates="owner", cascade="all, delete-orphan", passive_deletes=True)
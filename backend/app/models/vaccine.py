@@ -1,6 +1,6 @@
 from datetime import date
 from typing import Optional
-from sqlalchemy import String, Date, ForeignKey, Text
+from sqlalchemy import String, Date, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class Vaccine(Base):
     __tablename__ = "vaccines"
+    __table_args__ = (
+        # Per-pet newest-first reads (history lists, timeline)
+        Index("ix_vaccines_pet_id_date_administered", "pet_id", "date_administered"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"), index=True)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import Float, DateTime, ForeignKey
+from sqlalchemy import Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -8,6 +8,10 @@ from app.core.database import Base
 
 class WaterLog(Base):
     __tablename__ = "water_logs"
+    __table_args__ = (
+        # Per-pet newest-first reads (history lists, timeline)
+        Index("ix_water_logs_pet_id_datetime", "pet_id", "datetime"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"), index=True)
@@ -18,3 +22,19 @@ class WaterLog(Base):
     daily_goal_ml: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
     pet = relationship("Pet", back_populates="water_logs")
+
+
+class WaterLogArchive(Base):
+    """Water logs moved out of the hot table by app.core.archive (ids preserved)."""
+    __tablename__ = "water_logs_archive"
+    __table_args__ = (
+        Index("ix_water_logs_archive_pet_id_datetime", "pet_id", "datetime"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    pet_id: Mapped[int] = mapped_column(ForeignKey("pets.id", ondelete="CASCADE"))
+    datetime_: Mapped[datetime] = mapped_column("datetime", DateTime(timezone=True))
+    amount_ml: Mapped[float] = mapped_column(Float)
+    daily_goal_ml: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+
+    pet = relationship("Pet", back_populates="archived_water_logs")
@@ -1,13 +1,14 @@
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.deletion import request_account_deletion
+from app.core.rate_limit import limiter, user_or_ip_key
+from app.core.serialization import Serializer
 from app.core.security import (
     hash_password, verify_password,
     create_access_token, create_refresh_token, _decode_jwt,
@@ -32,17 +33,19 @@ class _ProfileUpdate(_BaseModel):
     timezone: Optional[str] = Field(default=None, min_length=1, max_length=60)
 
 
-limiter = Limiter(key_func=get_remote_address)
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+_USER_OUT = Serializer(UserOut)
+_TOKEN_OUT = Serializer(TokenResponse)
 
-def _token_response(user: User) -> TokenResponse:
+
+def _token_response(user: User, status_code: int = status.HTTP_200_OK) -> Response:
     """Build a TokenResponse with both access and refresh tokens."""
-    return TokenResponse(
-        access_token=create_access_token(user.id),
-        refresh_token=create_refresh_token(user.id),
-        user=UserOut.model_validate(user),
-    )
+    return _TOKEN_OUT.response({
+        "access_token": create_access_token(user.id),
+        "refresh_token": create_refresh_token(user.id),
+        "user": user,
+    }, status_code=status_code)
 
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
@@ -66,7 +69,7 @@ async def register(request: Request, data: UserCreate, db: AsyncSession = Depend
         raise HTTPException(status_code=400, detail="Email already registered")
     await db.refresh(user)
 
-    return _token_response(user)
+    return _token_response(user, status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -135,7 +138,7 @@ async def google_auth(request: Request, data: GoogleAuthRequest, db: AsyncSessio
 
 @router.get("/me", response_model=UserOut)
 async def me(current_user: User = Depends(get_current_user)):
-    return UserOut.model_validate(current_user)
+    return _USER_OUT.response(current_user)
 
 
 @router.post("/refresh", response_model=TokenResponse)
@@ -149,7 +152,7 @@ async def refresh_token(request: Request, data: RefreshRequest, db: AsyncSession
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
     user = await db.get(User, uid)
-    if not user:
+    if not user or user.deleted_at is not None:
         raise HTTPException(status_code=401, detail="User not found")
 
     return _token_response(user)
@@ -158,7 +161,7 @@ async def refresh_token(request: Request, data: RefreshRequest, db: AsyncSession
 # ── Profile update ────────────────────────────────────────────────────────
 
 @router.put("/profile", response_model=UserOut)
-@limiter.limit("20/minute")
+@limiter.limit("20/minute", key_func=user_or_ip_key)
 async def update_profile(
     request: Request,
     data: _ProfileUpdate,
@@ -172,13 +175,13 @@ async def update_profile(
         current_user.timezone = data.timezone
     await db.commit()
     await db.refresh(current_user)
-    return UserOut.model_validate(current_user)
+    return _USER_OUT.response(current_user)
 
 
 # ── Profile photo ────────────────────────────────────────────────────────
 
 @router.put("/photo", response_model=UserOut)
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_or_ip_key)
 async def update_photo_json(
     request: Request,
     data: _PhotoData,
@@ -195,11 +198,11 @@ async def update_photo_json(
     current_user.photo_url = data.photo_data
     await db.commit()
     await db.refresh(current_user)
-    return UserOut.model_validate(current_user)
+    return _USER_OUT.response(current_user)
 
 
 @router.delete("/photo", response_model=UserOut)
-@limiter.limit("10/minute")
+@limiter.limit("10/minute", key_func=user_or_ip_key)
 async def delete_profile_photo(
     request: Request,
     db: AsyncSession = Depends(get_db),
@@ -208,13 +211,13 @@ async def delete_profile_photo(
     current_user.photo_url = None
     await db.commit()
     await db.refresh(current_user)
-    return UserOut.model_validate(current_user)
+    return _USER_OUT.response(current_user)
 
 
 # ── Change password ──────────────────────────────────────────────────────
 
 @router.put("/password", response_model=UserOut)
-@limiter.limit("5/minute")
+@limiter.limit("5/minute", key_func=user_or_ip_key)
 async def change_password(
     request: Request,
     data: PasswordChange,
@@ -230,18 +233,21 @@ async def change_password(
     current_user.password_hash = hash_password(data.new_password)
     await db.commit()
     await db.refresh(current_user)
-    return UserOut.model_validate(current_user)
+    return _USER_OUT.response(current_user)
 
 
 # ── Delete account ───────────────────────────────────────────────────────
 
 @router.delete("/account", status_code=status.HTTP_204_NO_CONTENT)
-@limiter.limit("3/minute")
+@limiter.limit("3/minute", key_func=user_or_ip_key)
 async def delete_account(
     request: Request,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """Delete the user account and all associated data (pets, logs, etc.)."""
-    await db.delete(current_user)
+    """Delete the user account and all associated data (pets, logs, etc.).
+
+    Large accounts are signed out immediately and removed by a background job.
+    """
+    await request_account_deletion(db, current_user)
     await db.commit()
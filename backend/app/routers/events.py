@@ -1,18 +1,24 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
-from app.models.event import Event
+from app.models.event import Event, compute_reminder_at
 from app.schemas.event import EventCreate, EventUpdate, EventOut
 
 router = APIRouter(tags=["events"])
 
+_OUT = Serializer(EventOut)
+_LIST_OUT = Serializer(list[EventOut])
+
 _ALLOWED_FIELDS = {"type", "title", "datetime_start", "duration_minutes", "location", "notes", "reminder_minutes_before"}
+_REMINDER_FIELDS = {"datetime_start", "reminder_minutes_before"}
 
 
 @router.get("/pets/{pet_id}/events", response_model=list[EventOut])
@@ -33,7 +39,7 @@ async def list_events(
         q = q.where(Event.datetime_start <= date_to)
     q = q.order_by(Event.datetime_start.desc()).limit(limit).offset(offset)
     result = await db.execute(q)
-    return [EventOut.model_validate(e) for e in result.scalars().all()]
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/events", response_model=EventOut, status_code=status.HTTP_201_CREATED)
@@ -43,12 +49,12 @@ async def create_event(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    event = Event(**data.model_dump(), pet_id=pet_id)
-    db.add(event)
+    values = data.model_dump()
+    values["reminder_at"] = compute_reminder_at(values["datetime_start"], values["reminder_minutes_before"])
+    event = await insert_owned(db, Event, pet_id, current_user, values)
     await db.commit()
-    await db.refresh(event)
-    return EventOut.model_validate(event)
+    data_changes.publish(current_user, "event", pet_id, upserted=event.id)
+    return _OUT.response(event, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/events/{event_id}", response_model=EventOut)
@@ -58,16 +64,17 @@ async def update_event(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    event = await db.get(Event, event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    await get_pet_for_user(event.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(event, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    reminder_fields = _REMINDER_FIELDS & values.keys()
+    if reminder_fields == _REMINDER_FIELDS:
+        values["reminder_at"] = compute_reminder_at(values["datetime_start"], values["reminder_minutes_before"])
+    event = await update_owned(db, Event, event_id, current_user, values, "Event not found")
+    if reminder_fields and "reminder_at" not in values:
+        # The bulk UPDATE skips the mapper hook; the other input comes from the stored row
+        event.reminder_at = compute_reminder_at(event.datetime_start, event.reminder_minutes_before)
     await db.commit()
-    await db.refresh(event)
-    return EventOut.model_validate(event)
+    data_changes.publish(current_user, "event", event.pet_id, upserted=event.id)
+    return _OUT.response(event)
 
 
 @router.delete("/events/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -76,9 +83,6 @@ async def delete_event(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    event = await db.get(Event, event_id)
-    if not event:
-        raise HTTPException(status_code=404, detail="Event not found")
-    await get_pet_for_user(event.pet_id, current_user, db)
-    await db.delete(event)
+    pet_id = await delete_owned(db, Event, event_id, current_user, "Event not found")
     await db.commit()
+    data_changes.publish(current_user, "event", pet_id, deleted=event_id)
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.archive import log_history
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.feeding_log import FeedingLog
 from app.schemas.feeding import FeedingCreate, FeedingUpdate, FeedingOut
 
 router = APIRouter(tags=["feeding"])
 
+_OUT = Serializer(FeedingOut)
+_LIST_OUT = Serializer(list[FeedingOut])
+
 _ALLOWED_FIELDS = {"datetime_", "food_type", "planned_amount_grams", "actual_amount_grams", "notes"}
 
 
@@ -26,14 +31,8 @@ async def list_feedings(
     current_user: User = Depends(get_current_user),
 ):
     await get_pet_for_user(pet_id, current_user, db)
-    q = select(FeedingLog).where(FeedingLog.pet_id == pet_id)
-    if date_from:
-        q = q.where(FeedingLog.datetime_ >= date_from)
-    if date_to:
-        q = q.where(FeedingLog.datetime_ <= date_to)
-    q = q.order_by(FeedingLog.datetime_.desc()).limit(limit).offset(offset)
-    result = await db.execute(q)
-    return [FeedingOut.model_validate(f) for f in result.scalars().all()]
+    result = await db.execute(log_history(FeedingLog, pet_id, date_from, date_to, limit, offset))
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/feeding", response_model=FeedingOut, status_code=status.HTTP_201_CREATED)
@@ -43,19 +42,16 @@ async def create_feeding(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    log = FeedingLog(
-        pet_id=pet_id,
-        datetime_=data.datetime_ or datetime.now(timezone.utc),
-        food_type=data.food_type,
-        planned_amount_grams=data.planned_amount_grams,
-        actual_amount_grams=data.actual_amount_grams,
-        notes=data.notes,
-    )
-    db.add(log)
+    log = await insert_owned(db, FeedingLog, pet_id, current_user, {
+        "datetime_": data.datetime_ or datetime.now(timezone.utc),
+        "food_type": data.food_type,
+        "planned_amount_grams": data.planned_amount_grams,
+        "actual_amount_grams": data.actual_amount_grams,
+        "notes": data.notes,
+    })
     await db.commit()
-    await db.refresh(log)
-    return FeedingOut.model_validate(log)
+    data_changes.publish(current_user, "feeding", pet_id, upserted=log.id)
+    return _OUT.response(log, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/feeding/{feeding_id}", response_model=FeedingOut)
@@ -65,16 +61,11 @@ async def update_feeding(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    log = await db.get(FeedingLog, feeding_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="Feeding log not found")
-    await get_pet_for_user(log.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(log, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    log = await update_owned(db, FeedingLog, feeding_id, current_user, values, "Feeding log not found")
     await db.commit()
-    await db.refresh(log)
-    return FeedingOut.model_validate(log)
+    data_changes.publish(current_user, "feeding", log.pet_id, upserted=log.id)
+    return _OUT.response(log)
 
 
 @router.delete("/feeding/{feeding_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -83,9 +74,6 @@ async def delete_feeding(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    log = await db.get(FeedingLog, feeding_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="Feeding log not found")
-    await get_pet_for_user(log.pet_id, current_user, db)
-    await db.delete(log)
+    pet_id = await delete_owned(db, FeedingLog, feeding_id, current_user, "Feeding log not found")
     await db.commit()
+    data_changes.publish(current_user, "feeding", pet_id, deleted=feeding_id)
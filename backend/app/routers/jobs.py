@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.core.serialization import Serializer
+from app.models.job import Job
+from app.models.user import User
+from app.schemas.job import JobOut
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+_OUT = Serializer(JobOut)
+
+
+@router.get("/{job_id}", response_model=JobOut)
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Status and progress of a background job started by the current user."""
+    job = await db.get(Job, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _OUT.response(job)
@@ -1,17 +1,22 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.medication import Medication
 from app.schemas.medication import MedicationCreate, MedicationUpdate, MedicationOut
 
 router = APIRouter(tags=["medications"])
 
+_OUT = Serializer(MedicationOut)
+_LIST_OUT = Serializer(list[MedicationOut])
+
 _ALLOWED_FIELDS = {"name", "dosage", "frequency_per_day", "start_date", "end_date", "times_of_day", "notes"}
 
 
@@ -33,7 +38,7 @@ async def list_medications(
         q = q.where(Medication.start_date <= date_to)
     q = q.order_by(Medication.start_date.desc()).limit(limit).offset(offset)
     result = await db.execute(q)
-    return [MedicationOut.model_validate(m) for m in result.scalars().all()]
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/medications", response_model=MedicationOut, status_code=status.HTTP_201_CREATED)
@@ -43,12 +48,10 @@ async def create_medication(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    med = Medication(**data.model_dump(), pet_id=pet_id)
-    db.add(med)
+    med = await insert_owned(db, Medication, pet_id, current_user, data.model_dump())
     await db.commit()
-    await db.refresh(med)
-    return MedicationOut.model_validate(med)
+    data_changes.publish(current_user, "medication", pet_id, upserted=med.id)
+    return _OUT.response(med, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/medications/{medication_id}", response_model=MedicationOut)
@@ -58,16 +61,11 @@ async def update_medication(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    med = await db.get(Medication, medication_id)
-    if not med:
-        raise HTTPException(status_code=404, detail="Medication not found")
-    await get_pet_for_user(med.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(med, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    med = await update_owned(db, Medication, medication_id, current_user, values, "Medication not found")
     await db.commit()
-    await db.refresh(med)
-    return MedicationOut.model_validate(med)
+    data_changes.publish(current_user, "medication", med.pet_id, upserted=med.id)
+    return _OUT.response(med)
 
 
 @router.delete("/medications/{medication_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -76,9 +74,6 @@ async def delete_medication(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    med = await db.get(Medication, medication_id)
-    if not med:
-        raise HTTPException(status_code=404, detail="Medication not found")
-    await get_pet_for_user(med.pet_id, current_user, db)
-    await db.delete(med)
+    pet_id = await delete_owned(db, Medication, medication_id, current_user, "Medication not found")
     await db.commit()
+    data_changes.publish(current_user, "medication", pet_id, deleted=medication_id)
@@ -1,20 +1,27 @@
-"""WebSocket-based real-time notification system for feeding and medication reminders."""
+"""WebSocket-based real-time notification system for feeding, medication and event reminders."""
 
 import asyncio
 import json
 import logging
-from datetime import date, datetime, time, timezone
+from dataclasses import dataclass, field
+from time import perf_counter
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Dict, Set
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
-from sqlalchemy import select, and_
+from sqlalchemy import Text, and_, cast, or_, select
 
+from app.core.changes import data_changes
 from app.core.database import async_session
+from app.core.health import reminder_heartbeat
+from app.core.metrics import record_cache, reminder_tick_duration_seconds, ws_connections
 from app.core.security import _decode_jwt
+from app.core.startup import startup
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.medication import Medication
+from app.models.event import Event
 from app.models.feeding_log import FeedingLog
 from app.models.sent_notification import SentNotification
 
@@ -57,8 +64,14 @@ class ConnectionManager:
     def connected_users(self) -> set[int]:
         return set(self._connections.keys())
 
+    @property
+    def connection_count(self) -> int:
+        return sum(len(sockets) for sockets in self._connections.values())
+
 
 manager = ConnectionManager()
+ws_connections.set_function(lambda: manager.connection_count)
+data_changes.bind(manager.send_to_user, lambda user_id: user_id in manager._connections)
 
 
 # ── Persistent Deduplication ─────────────────────────────────────────────
@@ -134,7 +147,7 @@ async def websocket_notifications(ws: WebSocket, token: str = Query(default=""))
 
     async with async_session() as db:
         user = await db.get(User, user_id)
-        if not user:
+        if not user or user.deleted_at is not None:
             await ws.close(code=4001, reason="User not found")
             return
 
@@ -158,25 +171,96 @@ async def websocket_notifications(ws: WebSocket, token: str = Query(default=""))
 
 # ── Background Reminder Loop ────────────────────────────────────────────
 
+REMINDER_INTERVAL_SECONDS = 60
+# How late a reminder may still be delivered (matches _is_minute_due's window)
+REMINDER_GRACE = timedelta(minutes=5)
+
+
 async def reminder_loop():
     """Runs continuously, checking for due reminders every 60 seconds."""
+    await startup.ready.wait()  # don't query a schema that may still be migrating
     while True:
+        start = perf_counter()
         try:
             await _check_reminders()
         except Exception as e:
             logger.error("Reminder check failed: %s", e)
-        await asyncio.sleep(60)
+        reminder_tick_duration_seconds.observe(perf_counter() - start)
+        reminder_heartbeat.beat()
+        await asyncio.sleep(REMINDER_INTERVAL_SECONDS)
 
 
-def _is_time_due(current: str, scheduled: str) -> bool:
-    """True if current time is within a 5-minute window after scheduled time."""
+def _minute_of_day(value: str) -> int | None:
+    """Parse "HH:MM" into minutes since midnight, or None if malformed."""
     try:
-        ch, cm = map(int, current.split(":"))
-        sh, sm = map(int, scheduled.split(":"))
-        diff = (ch * 60 + cm) - (sh * 60 + sm)
-        return 0 <= diff <= 5
-    except Exception:
-        return False
+        hours, minutes = map(int, value.split(":"))
+    except (AttributeError, ValueError):
+        return None
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 60 + minutes
+
+
+def _is_minute_due(current: int, scheduled: int) -> bool:
+    """True if current minute is within a 5-minute window after scheduled minute."""
+    return 0 <= current - scheduled <= 5
+
+
+FEEDING_SLOTS = tuple((_minute_of_day(slot), slot) for slot in ("08:00", "13:00", "19:00"))
+
+# Parsed medication schedules, keyed by the stored times_of_day JSON text so an
+# edited course simply misses and re-parses.  Cleared wholesale when full.
+_SLOT_CACHE_SIZE = 4096
+_slot_cache: dict[str, tuple[tuple[int, str], ...]] = {}
+
+
+def _medication_slots(raw: str | None) -> tuple[tuple[int, str], ...]:
+    """(minute of day, "HH:MM") pairs for a raw ``times_of_day`` column value."""
+    if raw is None:
+        return ()
+    slots = _slot_cache.get(raw)
+    record_cache("medication_slots", hit=slots is not None)
+    if slots is None:
+        try:
+            values = json.loads(raw)
+        except ValueError:
+            values = None
+        parsed = []
+        for value in values if isinstance(values, list) else ():
+            minute = _minute_of_day(value)
+            if minute is not None:
+                parsed.append((minute, value))
+        if len(_slot_cache) >= _SLOT_CACHE_SIZE:
+            _slot_cache.clear()
+        slots = _slot_cache[raw] = tuple(parsed)
+    return slots
+
+
+@dataclass
+class _TimezoneBucket:
+    """Connected users sharing a timezone, with that zone's clock for this tick."""
+
+    minute: int  # local minute of day
+    today: date
+    day_start: datetime  # local day bounds, in UTC
+    day_end: datetime
+    user_ids: list[int] = field(default_factory=list)
+    pet_ids: list[int] = field(default_factory=list)
+
+    @classmethod
+    def at(cls, name: str, now_utc: datetime) -> "_TimezoneBucket":
+        try:
+            tz = ZoneInfo(name)
+        except (KeyError, ValueError):
+            tz = timezone.utc
+        local = now_utc.astimezone(tz)
+        today = local.date()
+        return cls(
+            minute=local.hour * 60 + local.minute,
+            today=today,
+            day_start=datetime.combine(today, time.min, tzinfo=tz).astimezone(timezone.utc),
+            day_end=datetime.combine(today, time.max, tzinfo=tz).astimezone(timezone.utc),
+        )
 
 
 async def _check_reminders():
@@ -207,72 +291,143 @@ async def _check_reminders():
         if not all_pet_ids:
             return
 
-        # Batch: load all active medications for all pets
-        # We need each user's "today" for medication filtering, but for a first pass
-        # we can load broadly and filter in-memory
-        meds_result = await db.execute(
-            select(Medication).where(Medication.pet_id.in_(all_pet_ids))
-        )
-        all_meds = meds_result.scalars().all()
-        meds_by_pet: dict[int, list] = {}
-        for m in all_meds:
-            meds_by_pet.setdefault(m.pet_id, []).append(m)
-
-        # Batch: check which pets have been fed today (UTC bounds for broad check)
-        today_utc = now_utc.date()
-        today_start = datetime.combine(today_utc, time.min, tzinfo=timezone.utc)
-        today_end = datetime.combine(today_utc, time.max, tzinfo=timezone.utc)
-        fed_result = await db.execute(
-            select(FeedingLog.pet_id).where(
-                FeedingLog.pet_id.in_(all_pet_ids),
-                FeedingLog.datetime_.between(today_start, today_end),
-            ).distinct()
-        )
-        fed_pet_ids = {row[0] for row in fed_result.all()}
-
-        # Process per user
+        # Bucket users by timezone so local clocks and day bounds are computed
+        # once per zone rather than once per user
+        buckets: dict[str, _TimezoneBucket] = {}
         for user_id in connected:
             user = users.get(user_id)
             if not user:
                 continue
-            try:
-                user_tz = ZoneInfo(user.timezone) if user.timezone else timezone.utc
-            except (KeyError, ValueError):
-                user_tz = timezone.utc
-
-            user_now = now_utc.astimezone(user_tz)
-            current_time = user_now.strftime("%H:%M")
-            user_today = user_now.date()
-
-            for pet in pets_by_user.get(user_id, []):
-                # Medication reminders
-                for med in meds_by_pet.get(pet.id, []):
-                    if med.start_date > user_today:
-                        continue
-                    if med.end_date and med.end_date < user_today:
-                        continue
-                    if not med.times_of_day:
-                        continue
-                    for slot in med.times_of_day:
-                        if _is_time_due(current_time, slot) and not await _was_sent(db, user_id, "medication", med.id, slot):
-                            await manager.send_to_user(user_id, {
-                                "type": "medication_reminder",
-                                "pet_id": pet.id,
-                                "pet_name": pet.name,
-                                "medication_name": med.name,
-                                "dosage": med.dosage,
-                                "scheduled_time": slot,
-                            })
-                            await _mark_sent(db, user_id, "medication", med.id, slot)
-
-                # Feeding reminders
-                if pet.id not in fed_pet_ids:
-                    for slot in ("08:00", "13:00", "19:00"):
-                        if _is_time_due(current_time, slot) and not await _was_sent(db, user_id, "feeding", pet.id, slot):
-                            await manager.send_to_user(user_id, {
-                                "type": "feeding_reminder",
-                                "pet_id": pet.id,
-                                "pet_name": pet.name,
-                                "scheduled_time": slot,
-                            })
-                            await _mark_sent(db, user_id, "feeding", pet.id, slot)
+            name = user.timezone or "UTC"
+            bucket = buckets.get(name)
+            if bucket is None:
+                bucket = buckets[name] = _TimezoneBucket.at(name, now_utc)
+            bucket.user_ids.append(user_id)
+            bucket.pet_ids.extend(p.id for p in pets_by_user.get(user_id, []))
+
+        # Batch: only courses running on their owner's local today.  Local dates
+        # span at most three days at any instant, so this is at most three
+        # range predicates on ix_medications_pet_id_start_end.  times_of_day is
+        # read as raw text so _medication_slots can skip decoding known schedules.
+        pet_ids_by_day: dict[date, list[int]] = {}
+        for bucket in buckets.values():
+            pet_ids_by_day.setdefault(bucket.today, []).extend(bucket.pet_ids)
+        meds_by_pet: dict[int, list] = {}
+        active = [
+            and_(
+                Medication.pet_id.in_(pet_ids),
+                Medication.start_date <= day,
+                or_(Medication.end_date.is_(None), Medication.end_date >= day),
+            )
+            for day, pet_ids in pet_ids_by_day.items() if pet_ids
+        ]
+        if active:
+            meds_result = await db.execute(
+                select(
+                    Medication.id, Medication.pet_id, Medication.name, Medication.dosage,
+                    cast(Medication.times_of_day, Text),
+                ).where(or_(*active), Medication.times_of_day.isnot(None))
+            )
+            for med_id, pet_id, name, dosage, raw_times in meds_result.all():
+                slots = _medication_slots(raw_times)
+                if slots:
+                    meds_by_pet.setdefault(pet_id, []).append((med_id, name, dosage, slots))
+
+        for bucket in buckets.values():
+            current_minute = bucket.minute
+            due_feeding = [slot for minute, slot in FEEDING_SLOTS if _is_minute_due(current_minute, minute)]
+
+            # Pets fed during this zone's local day; only needed while a feeding slot is due
+            fed_pet_ids: set[int] = set()
+            if due_feeding and bucket.pet_ids:
+                fed_result = await db.execute(
+                    select(FeedingLog.pet_id).where(
+                        FeedingLog.pet_id.in_(bucket.pet_ids),
+                        FeedingLog.datetime_.between(bucket.day_start, bucket.day_end),
+                    ).distinct()
+                )
+                fed_pet_ids = {row[0] for row in fed_result.all()}
+
+            for user_id in bucket.user_ids:
+                for pet in pets_by_user.get(user_id, []):
+                    # Medication reminders
+                    for med_id, med_name, dosage, slots in meds_by_pet.get(pet.id, []):
+                        for minute, slot in slots:
+                            if _is_minute_due(current_minute, minute) and not await _was_sent(db, user_id, "medication", med_id, slot):
+                                await manager.send_to_user(user_id, {
+                                    "type": "medication_reminder",
+                                    "pet_id": pet.id,
+                                    "pet_name": pet.name,
+                                    "medication_name": med_name,
+                                    "dosage": dosage,
+                                    "scheduled_time": slot,
+                                })
+                                await _mark_sent(db, user_id, "medication", med_id, slot)
+
+                    # Feeding reminders
+                    if pet.id not in fed_pet_ids:
+                        for slot in due_feeding:
+                            if not await _was_sent(db, user_id, "feeding", pet.id, slot):
+                                await manager.send_to_user(user_id, {
+                                    "type": "feeding_reminder",
+                                    "pet_id": pet.id,
+                                    "pet_name": pet.name,
+                                    "scheduled_time": slot,
+                                })
+                                await _mark_sent(db, user_id, "feeding", pet.id, slot)
+
+        # Runs last and isolated so a failure can't drop this tick's other reminders
+        try:
+            await _check_event_reminders(db, connected, now_utc)
+        except Exception as e:
+            await db.rollback()
+            logger.error("Event reminder check failed: %s", e)
+
+
+async def _check_event_reminders(db, connected: set[int], now_utc: datetime):
+    """Deliver event reminders whose fire time passed within the last REMINDER_GRACE.
+
+    Uses the indexed ``Event.reminder_at`` column, so every tick issues one range
+    query for all connected users plus one batched dedup lookup.
+    """
+    result = await db.execute(
+        select(Event, Pet.user_id, Pet.name)
+        .join(Pet, Pet.id == Event.pet_id)
+        .where(
+            Event.reminder_at > now_utc - REMINDER_GRACE,
+            Event.reminder_at <= now_utc,
+            Pet.user_id.in_(connected),
+        )
+        .order_by(Event.reminder_at)
+    )
+    due = [(ev, user_id, pet_name, f"event:{ev.id}:{ev.reminder_at:%Y-%m-%dT%H:%M}")
+           for ev, user_id, pet_name in result.all()]
+    if not due:
+        return
+
+    # The grace window can straddle midnight, so look at yesterday's rows too
+    today = now_utc.date()
+    sent_result = await db.execute(
+        select(SentNotification.user_id, SentNotification.notification_key).where(
+            SentNotification.user_id.in_({user_id for _, user_id, _, _ in due}),
+            SentNotification.notification_key.in_([key for _, _, _, key in due]),
+            SentNotification.sent_date >= today - timedelta(days=1),
+        )
+    )
+    already_sent = set(sent_result.all())
+
+    for ev, user_id, pet_name, key in due:
+        if (user_id, key) in already_sent:
+            continue
+        await manager.send_to_user(user_id, {
+            "type": "event_reminder",
+            "pet_id": ev.pet_id,
+            "pet_name": pet_name,
+            "event_id": ev.id,
+            "event_type": ev.type,
+            "title": ev.title,
+            "location": ev.location,
+            "datetime_start": ev.datetime_start.isoformat(),
+            "minutes_before": ev.reminder_minutes_before,
+        })
+        await _mark_sent(db, user_id, "event", ev.id, f"{ev.reminder_at:%Y-%m-%dT%H:%M}")
@@ -2,12 +2,15 @@ import logging
 from datetime import date, datetime, time, timedelta, timezone
 from zoneinfo import ZoneInfo
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func
+from sqlalchemy import Float, Integer, cast, func, literal_column, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.changes import data_changes
+from app.core.database import get_db, run_concurrently
+from app.core.dependencies import delete_owned, get_pet_for_user, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.pet import Pet
 from app.models.feeding_log import FeedingLog
@@ -19,15 +22,17 @@ from app.schemas.dashboard import PetDashboard, FeedingSummary, WaterSummary, Va
 from app.schemas.event import EventOut
 from app.schemas.medication import MedicationOut
 from app.models.vaccine import Vaccine as VaccineModel
-from app.schemas.vaccine import VaccineOut
 
 logger = logging.getLogger("pwelltrack.pets")
 router = APIRouter(prefix="/pets", tags=["pets"])
 
 
-def _pet_out(pet: Pet) -> PetOut:
-    """Convert Pet model to PetOut. Photos are always returned inline as data URIs."""
-    return PetOut.model_validate(pet)
+_PET_OUT = Serializer(PetOut)  # photos are always returned inline as data URIs
+_PET_LIST_OUT = Serializer(list[PetOut])
+_SUMMARY_OUT = Serializer(list[PetSummaryItem])
+_DASHBOARD_OUT = Serializer(PetDashboard)
+
+UPCOMING_EVENTS = 5  # default number of upcoming events per pet on dashboards
 
 
 @router.get("/", response_model=list[PetOut])
@@ -43,18 +48,20 @@ async def list_pets(
         .limit(limit)
         .offset(offset)
     )
-    return [_pet_out(p) for p in result.scalars().all()]
+    return _PET_LIST_OUT.response(result.scalars().all())
 
 
 @router.get("/summary", response_model=list[PetSummaryItem])
 async def pets_summary(
+    upcoming_events: int = Query(default=UPCOMING_EVENTS, ge=0, le=50),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Return all pets with their dashboards and vaccine status in a single call.
 
     Replaces the N+1 pattern of GET /pets/ + GET /pets/:id/today + GET /pets/:id/vaccines
-    for each pet. Uses batched queries (6 queries total instead of 2N+1).
+    for each pet. Uses batched queries (7 queries total instead of 2N+1); the six
+    that only need the pet ids run concurrently on separate sessions.
     """
     # Use user's timezone for "today" calculation
     try:
@@ -71,96 +78,116 @@ async def pets_summary(
     pets_result = await db.execute(select(Pet).where(Pet.user_id == current_user.id))
     pets = pets_result.scalars().all()
     if not pets:
-        return []
+        return _SUMMARY_OUT.response([])
 
     pet_ids = [p.id for p in pets]
 
-    # 2. Feeding summaries (batched by pet_id)
-    feeding_result = await db.execute(
-        select(
-            FeedingLog.pet_id,
-            func.coalesce(func.sum(FeedingLog.actual_amount_grams), 0),
-            func.coalesce(func.sum(FeedingLog.planned_amount_grams), 0),
-            func.count(FeedingLog.id),
-        ).where(
-            FeedingLog.pet_id.in_(pet_ids),
-            FeedingLog.datetime_.between(today_start, today_end),
-        ).group_by(FeedingLog.pet_id)
-    )
-    feeding_map: dict[int, FeedingSummary] = {}
-    for row in feeding_result.all():
-        pid, actual, planned, count = row
-        feeding_map[pid] = FeedingSummary(
-            total_actual_grams=float(actual),
-            total_planned_grams=float(planned) if planned is not None and count > 0 else None,
-            entries_count=int(count),
+    # 2-6 only depend on pet_ids: run them concurrently on sibling sessions
+
+    async def load_feeding(session: AsyncSession) -> dict[int, FeedingSummary]:
+        feeding_result = await session.execute(
+            select(
+                FeedingLog.pet_id,
+                func.coalesce(func.sum(FeedingLog.actual_amount_grams), 0),
+                func.coalesce(func.sum(FeedingLog.planned_amount_grams), 0),
+                func.count(FeedingLog.id),
+            ).where(
+                FeedingLog.pet_id.in_(pet_ids),
+                FeedingLog.datetime_.between(today_start, today_end),
+            ).group_by(FeedingLog.pet_id)
         )
-
-    # 3. Water summaries (batched by pet_id)
-    water_result = await db.execute(
-        select(
-            WaterLog.pet_id,
-            func.coalesce(func.sum(WaterLog.amount_ml), 0),
-            func.count(WaterLog.id),
-        ).where(
-            WaterLog.pet_id.in_(pet_ids),
-            WaterLog.datetime_.between(today_start, today_end),
-        ).group_by(WaterLog.pet_id)
-    )
-    water_map: dict[int, tuple[float, int]] = {}
-    for row in water_result.all():
-        pid, total_ml, count = row
-        water_map[pid] = (float(total_ml), int(count))
-
-    # Get latest daily goals per pet in a single query using window function
-    latest_goal_subq = (
-        select(
-            WaterLog.pet_id,
-            WaterLog.daily_goal_ml,
-            func.row_number().over(
-                partition_by=WaterLog.pet_id,
-                order_by=WaterLog.datetime_.desc(),
-            ).label("rn"),
+        feeding_map: dict[int, FeedingSummary] = {}
+        for row in feeding_result.all():
+            pid, actual, planned, count = row
+            feeding_map[pid] = FeedingSummary(
+                total_actual_grams=float(actual),
+                total_planned_grams=float(planned) if planned is not None and count > 0 else None,
+                entries_count=int(count),
+            )
+        return feeding_map
+
+    async def load_water(session: AsyncSession) -> dict[int, tuple[float, int]]:
+        water_result = await session.execute(
+            select(
+                WaterLog.pet_id,
+                func.coalesce(func.sum(WaterLog.amount_ml), 0),
+                func.count(WaterLog.id),
+            ).where(
+                WaterLog.pet_id.in_(pet_ids),
+                WaterLog.datetime_.between(today_start, today_end),
+            ).group_by(WaterLog.pet_id)
         )
-        .where(WaterLog.pet_id.in_(pet_ids), WaterLog.daily_goal_ml.isnot(None))
-        .subquery()
-    )
-    goal_result = await db.execute(
-        select(latest_goal_subq.c.pet_id, latest_goal_subq.c.daily_goal_ml)
-        .where(latest_goal_subq.c.rn == 1)
-    )
-    water_goals: dict[int, float | None] = {row[0]: row[1] for row in goal_result.all()}
-
-    # 4. Upcoming events (all pets, limited to 5 per pet)
-    events_result = await db.execute(
-        select(EventModel)
-        .where(EventModel.pet_id.in_(pet_ids), EventModel.datetime_start >= now_utc)
-        .order_by(EventModel.datetime_start)
-    )
-    events_by_pet: dict[int, list[EventOut]] = {pid: [] for pid in pet_ids}
-    for e in events_result.scalars().all():
-        if len(events_by_pet[e.pet_id]) < 5:
+        return {pid: (float(total_ml), int(count)) for pid, total_ml, count in water_result.all()}
+
+    async def load_water_goals(session: AsyncSession) -> dict[int, float | None]:
+        # Latest daily goal per pet in a single query using a window function
+        latest_goal_subq = (
+            select(
+                WaterLog.pet_id,
+                WaterLog.daily_goal_ml,
+                func.row_number().over(
+                    partition_by=WaterLog.pet_id,
+                    order_by=WaterLog.datetime_.desc(),
+                ).label("rn"),
+            )
+            .where(WaterLog.pet_id.in_(pet_ids), WaterLog.daily_goal_ml.isnot(None))
+            .subquery()
+        )
+        goal_result = await session.execute(
+            select(latest_goal_subq.c.pet_id, latest_goal_subq.c.daily_goal_ml)
+            .where(latest_goal_subq.c.rn == 1)
+        )
+        return {row[0]: row[1] for row in goal_result.all()}
+
+    async def load_events(session: AsyncSession) -> dict[int, list[EventOut]]:
+        # Upcoming events, at most upcoming_events per pet, ranked in SQL so
+        # far-future recurring appointments never leave the database
+        ranked = (
+            select(
+                EventModel,
+                func.row_number().over(
+                    partition_by=EventModel.pet_id,
+                    order_by=(EventModel.datetime_start, EventModel.id),
+                ).label("rn"),
+            )
+            .where(EventModel.pet_id.in_(pet_ids), EventModel.datetime_start >= now_utc)
+            .subquery()
+        )
+        upcoming = aliased(EventModel, ranked)
+        events_result = await session.execute(
+            select(upcoming).where(ranked.c.rn <= upcoming_events).order_by(upcoming.datetime_start, upcoming.id)
+        )
+        events_by_pet: dict[int, list[EventOut]] = {pid: [] for pid in pet_ids}
+        for e in events_result.scalars().all():
             events_by_pet[e.pet_id].append(EventOut.model_validate(e))
-
-    # 5. Active medications (all pets)
-    meds_result = await db.execute(
-        select(Medication).where(
-            Medication.pet_id.in_(pet_ids),
-            Medication.start_date <= user_today,
-            (Medication.end_date.is_(None)) | (Medication.end_date >= user_today),
+        return events_by_pet
+
+    async def load_meds(session: AsyncSession) -> dict[int, list[MedicationOut]]:
+        meds_result = await session.execute(
+            select(Medication).where(
+                Medication.pet_id.in_(pet_ids),
+                Medication.start_date <= user_today,
+                (Medication.end_date.is_(None)) | (Medication.end_date >= user_today),
+            )
         )
-    )
-    meds_by_pet: dict[int, list[MedicationOut]] = {pid: [] for pid in pet_ids}
-    for m in meds_result.scalars().all():
-        meds_by_pet[m.pet_id].append(MedicationOut.model_validate(m))
+        meds_by_pet: dict[int, list[MedicationOut]] = {pid: [] for pid in pet_ids}
+        for m in meds_result.scalars().all():
+            meds_by_pet[m.pet_id].append(MedicationOut.model_validate(m))
+        return meds_by_pet
+
+    async def load_vaccines(session: AsyncSession) -> dict[int, list]:
+        # Vaccines (all pets) for status computation
+        vaccines_result = await session.execute(
+            select(VaccineModel).where(VaccineModel.pet_id.in_(pet_ids))
+        )
+        vaccines_by_pet: dict[int, list] = {pid: [] for pid in pet_ids}
+        for v in vaccines_result.scalars().all():
+            vaccines_by_pet[v.pet_id].append(v)
+        return vaccines_by_pet
 
-    # 6. Vaccines (all pets) for status computation
-    vaccines_result = await db.execute(
-        select(VaccineModel).where(VaccineModel.pet_id.in_(pet_ids))
+    feeding_map, water_map, water_goals, events_by_pet, meds_by_pet, vaccines_by_pet = await run_concurrently(
+        db, load_feeding, load_water, load_water_goals, load_events, load_meds, load_vaccines,
     )
-    vaccines_by_pet: dict[int, list] = {pid: [] for pid in pet_ids}
-    for v in vaccines_result.scalars().all():
-        vaccines_by_pet[v.pet_id].append(v)
 
     # Assemble results
     items: list[PetSummaryItem] = []
@@ -200,12 +227,12 @@ async def pets_summary(
                 vs = VaccineStatusSummary(status="up_to_date", overdue_count=0)
 
         items.append(PetSummaryItem(
-            pet=_pet_out(pet),
+            pet=PetOut.model_validate(pet),
             dashboard=dashboard,
             vaccine_status=vs,
         ))
 
-    return items
+    return _SUMMARY_OUT.response(items)
 
 
 @router.post("/", response_model=PetOut, status_code=status.HTTP_201_CREATED)
@@ -218,8 +245,9 @@ async def create_pet(
         pet = Pet(**data.model_dump(), user_id=current_user.id)
         db.add(pet)
         await db.commit()
+        data_changes.publish(current_user, "pet", pet.id, upserted=pet.id)
         await db.refresh(pet)
-        return _pet_out(pet)
+        return _PET_OUT.response(pet, status_code=status.HTTP_201_CREATED)
     except Exception as exc:
         await db.rollback()
         logger.error(
@@ -239,7 +267,7 @@ async def get_pet(
     current_user: User = Depends(get_current_user),
 ):
     pet = await get_pet_for_user(pet_id, current_user, db)
-    return _pet_out(pet)
+    return _PET_OUT.response(pet)
 
 
 @router.put("/{pet_id}", response_model=PetOut)
@@ -249,19 +277,19 @@ async def update_pet(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    pet = await get_pet_for_user(pet_id, current_user, db)
     _PET_UPDATABLE = {"name", "species", "breed", "date_of_birth", "sex", "weight_kg", "photo_url", "notes"}
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _PET_UPDATABLE}
     try:
-        for key, value in data.model_dump(exclude_unset=True).items():
-            if key in _PET_UPDATABLE:
-                setattr(pet, key, value)
+        pet = await update_owned(db, Pet, pet_id, current_user, values, "Pet not found")
         await db.commit()
-        await db.refresh(pet)
-        return _pet_out(pet)
+    except HTTPException:
+        raise
     except Exception as exc:
         await db.rollback()
         logger.error("Failed to update pet %s: %s", pet_id, exc, exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to update pet")
+    data_changes.publish(current_user, "pet", pet.id, upserted=pet.id)
+    return _PET_OUT.response(pet)
 
 
 @router.delete("/{pet_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -270,9 +298,9 @@ async def delete_pet(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    pet = await get_pet_for_user(pet_id, current_user, db)
-    await db.delete(pet)
+    await delete_owned(db, Pet, pet_id, current_user, "Pet not found")
     await db.commit()
+    data_changes.publish(current_user, "pet", pet_id, deleted=pet_id)
 
 
 @router.delete("/{pet_id}/photo", response_model=PetOut)
@@ -281,11 +309,10 @@ async def delete_pet_photo(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    pet = await get_pet_for_user(pet_id, current_user, db)
-    pet.photo_url = None
+    pet = await update_owned(db, Pet, pet_id, current_user, {"photo_url": None}, "Pet not found")
     await db.commit()
-    await db.refresh(pet)
-    return _pet_out(pet)
+    data_changes.publish(current_user, "pet", pet_id, upserted=pet_id)
+    return _PET_OUT.response(pet)
 
 
 @router.get("/{pet_id}/today", response_model=PetDashboard)
@@ -294,85 +321,108 @@ async def pet_today(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    pet = await get_pet_for_user(pet_id, current_user, db)
-
     # Use user's timezone for "today" calculation
     try:
         user_tz = ZoneInfo(current_user.timezone) if current_user.timezone else timezone.utc
     except (KeyError, ValueError):
         user_tz = timezone.utc
-    user_now = datetime.now(user_tz)
-    user_today = user_now.date()
-    today_start = datetime.combine(user_today, time.min, tzinfo=user_tz).astimezone(timezone.utc)
-    today_end = datetime.combine(user_today, time.max, tzinfo=user_tz).astimezone(timezone.utc)
+    user_today = datetime.now(user_tz).date()
+    return _DASHBOARD_OUT.response(await load_pet_today(db, pet_id, current_user.id, user_today, user_tz))
+
+
+# ── Dashboard in one statement ──
+# pet_today used to await ownership, feeding, water, water goal, events and
+# medications one after another, paying the pooler round trip six times.
+# They are now one UNION ALL: a "summary" row carrying the ownership check
+# and every scalar, plus one row per upcoming event and active medication.
+# Each branch fills its own columns and casts the others to typed NULLs, so
+# the result columns keep the model types (and their result processing) on
+# both SQLite and Postgres.
+
+_SUMMARY_COLUMNS = [
+    ("feeding_actual", Float()), ("feeding_planned", Float()), ("feeding_count", Integer()),
+    ("water_total", Float()), ("water_count", Integer()), ("water_goal", Float()),
+]
+_EVENT_COLUMNS = [c for c in EventModel.__table__.columns if c.name != "reminder_at"]
+_MED_COLUMNS = list(Medication.__table__.columns)
+_TODAY_COLUMNS = (
+    _SUMMARY_COLUMNS
+    + [(f"e_{c.name}", c.type) for c in _EVENT_COLUMNS]
+    + [(f"m_{c.name}", c.type) for c in _MED_COLUMNS]
+)
+
+
+def _today_branch(kind: str, values: dict, source=None):
+    columns = [literal_column(f"'{kind}'").label("kind")]
+    for name, type_ in _TODAY_COLUMNS:
+        columns.append((values[name] if name in values else cast(null(), type_)).label(name))
+    stmt = select(*columns)
+    return stmt.select_from(source) if source is not None else stmt
+
+
+def _today_statement(pet_id: int, user_id: int, today: date, user_tz, now: datetime):
+    today_start = datetime.combine(today, time.min, tzinfo=user_tz).astimezone(timezone.utc)
+    today_end = datetime.combine(today, time.max, tzinfo=user_tz).astimezone(timezone.utc)
+    fed_today = (FeedingLog.pet_id == pet_id, FeedingLog.datetime_.between(today_start, today_end))
+    drank_today = (WaterLog.pet_id == pet_id, WaterLog.datetime_.between(today_start, today_end))
+
+    summary = _today_branch("summary", {
+        "feeding_actual": select(func.coalesce(func.sum(FeedingLog.actual_amount_grams), 0))
+        .where(*fed_today).scalar_subquery(),
+        "feeding_planned": select(func.coalesce(func.sum(FeedingLog.planned_amount_grams), 0))
+        .where(*fed_today).scalar_subquery(),
+        "feeding_count": select(func.count(FeedingLog.id)).where(*fed_today).scalar_subquery(),
+        "water_total": select(func.coalesce(func.sum(WaterLog.amount_ml), 0)).where(*drank_today).scalar_subquery(),
+        "water_count": select(func.count(WaterLog.id)).where(*drank_today).scalar_subquery(),
+        "water_goal": select(WaterLog.daily_goal_ml)
+        .where(WaterLog.pet_id == pet_id, WaterLog.daily_goal_ml.isnot(None))
+        .order_by(WaterLog.datetime_.desc()).limit(1).scalar_subquery(),
+    }, Pet).where(Pet.id == pet_id, Pet.user_id == user_id)
 
-    # Feeding summary
-    feeding_result = await db.execute(
-        select(
-            func.coalesce(func.sum(FeedingLog.actual_amount_grams), 0),
-            func.coalesce(func.sum(FeedingLog.planned_amount_grams), 0),
-            func.count(FeedingLog.id),
-        ).where(
-            FeedingLog.pet_id == pet_id,
-            FeedingLog.datetime_.between(today_start, today_end),
-        )
-    )
-    f_row = feeding_result.one()
-    feeding_summary = FeedingSummary(
-        total_actual_grams=float(f_row[0]),
-        total_planned_grams=float(f_row[1]) if f_row[1] is not None and f_row[2] > 0 else None,
-        entries_count=int(f_row[2]),
+    upcoming = (
+        select(*_EVENT_COLUMNS)
+        .where(EventModel.pet_id == pet_id, EventModel.datetime_start >= now)
+        .order_by(EventModel.datetime_start, EventModel.id)
+        .limit(UPCOMING_EVENTS)
+        .subquery()
     )
+    events = _today_branch("event", {f"e_{c.name}": upcoming.c[c.name] for c in _EVENT_COLUMNS}, upcoming)
 
-    # Water summary
-    water_result = await db.execute(
-        select(
-            func.coalesce(func.sum(WaterLog.amount_ml), 0),
-            func.count(WaterLog.id),
-        ).where(
-            WaterLog.pet_id == pet_id,
-            WaterLog.datetime_.between(today_start, today_end),
-        )
-    )
-    w_row = water_result.one()
-    # Get the latest daily goal
-    latest_water = await db.execute(
-        select(WaterLog.daily_goal_ml)
-        .where(WaterLog.pet_id == pet_id, WaterLog.daily_goal_ml.isnot(None))
-        .order_by(WaterLog.datetime_.desc())
-        .limit(1)
-    )
-    goal = latest_water.scalar_one_or_none()
-    water_summary = WaterSummary(
-        total_ml=float(w_row[0]),
-        daily_goal_ml=goal,
-        entries_count=int(w_row[1]),
+    meds = _today_branch("medication", {f"m_{c.name}": c for c in _MED_COLUMNS}, Medication).where(
+        Medication.pet_id == pet_id,
+        Medication.start_date <= today,
+        (Medication.end_date.is_(None)) | (Medication.end_date >= today),
     )
+    return union_all(summary, events, meds)
 
-    # Upcoming events
+
+async def load_pet_today(db: AsyncSession, pet_id: int, user_id: int, today: date, user_tz) -> PetDashboard:
+    """Build the dashboard with one round trip; 404 unless the pet belongs to ``user_id``."""
     now = datetime.now(timezone.utc)
-    events_result = await db.execute(
-        select(EventModel)
-        .where(EventModel.pet_id == pet_id, EventModel.datetime_start >= now)
-        .order_by(EventModel.datetime_start)
-        .limit(5)
-    )
-    upcoming_events = [EventOut.model_validate(e) for e in events_result.scalars().all()]
-
-    # Active medications
-    today = user_today
-    meds_result = await db.execute(
-        select(Medication).where(
-            Medication.pet_id == pet_id,
-            Medication.start_date <= today,
-            (Medication.end_date.is_(None)) | (Medication.end_date >= today),
-        )
-    )
-    active_meds = [MedicationOut.model_validate(m) for m in meds_result.scalars().all()]
+    rows = (await db.execute(_today_statement(pet_id, user_id, today, user_tz, now))).mappings().all()
+    summary = next((r for r in rows if r["kind"] == "summary"), None)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Pet not found")
 
+    def unprefix(row, prefix: str) -> dict:
+        return {k[len(prefix):]: v for k, v in row.items() if k.startswith(prefix)}
+
+    events = sorted(
+        (unprefix(r, "e_") for r in rows if r["kind"] == "event"),
+        key=lambda e: (e["datetime_start"], e["id"]),
+    )
+    meds = sorted((unprefix(r, "m_") for r in rows if r["kind"] == "medication"), key=lambda m: m["id"])
     return PetDashboard(
-        feeding=feeding_summary,
-        water=water_summary,
-        upcoming_events=upcoming_events,
-        active_medications=active_meds,
+        feeding=FeedingSummary(
+            total_actual_grams=float(summary["feeding_actual"]),
+            total_planned_grams=float(summary["feeding_planned"]) if summary["feeding_count"] > 0 else None,
+            entries_count=int(summary["feeding_count"]),
+        ),
+        water=WaterSummary(
+            total_ml=float(summary["water_total"]),
+            daily_goal_ml=summary["water_goal"],
+            entries_count=int(summary["water_count"]),
+        ),
+        upcoming_events=[EventOut.model_validate(e) for e in events],
+        active_medications=[MedicationOut.model_validate(m) for m in meds],
     )
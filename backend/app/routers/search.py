@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.search import search as run_search
+from app.core.security import get_current_user
+from app.core.serialization import Serializer
+from app.models.user import User
+from app.schemas.search import SearchHit
+
+router = APIRouter(tags=["search"])
+
+_LIST_OUT = Serializer(list[SearchHit])
+
+
+@router.get("/search", response_model=list[SearchHit])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Best matches first among the current user's pets and their records."""
+    hits = await run_search(db, current_user.id, q, limit, offset)
+    return _LIST_OUT.response(hits)
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.symptom import Symptom
 from app.schemas.symptom import SymptomCreate, SymptomUpdate, SymptomOut
 
 router = APIRouter(tags=["symptoms"])
 
+_OUT = Serializer(SymptomOut)
+_LIST_OUT = Serializer(list[SymptomOut])
+
 _ALLOWED_FIELDS = {"datetime_", "type", "severity", "notes"}
 
 
@@ -33,7 +38,7 @@ async def list_symptoms(
         q = q.where(Symptom.datetime_ <= date_to)
     q = q.order_by(Symptom.datetime_.desc()).limit(limit).offset(offset)
     result = await db.execute(q)
-    return [SymptomOut.model_validate(s) for s in result.scalars().all()]
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/symptoms", response_model=SymptomOut, status_code=status.HTTP_201_CREATED)
@@ -43,18 +48,15 @@ async def create_symptom(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    symptom = Symptom(
-        pet_id=pet_id,
-        datetime_=data.datetime_ or datetime.now(timezone.utc),
-        type=data.type,
-        severity=data.severity,
-        notes=data.notes,
-    )
-    db.add(symptom)
+    symptom = await insert_owned(db, Symptom, pet_id, current_user, {
+        "datetime_": data.datetime_ or datetime.now(timezone.utc),
+        "type": data.type,
+        "severity": data.severity,
+        "notes": data.notes,
+    })
     await db.commit()
-    await db.refresh(symptom)
-    return SymptomOut.model_validate(symptom)
+    data_changes.publish(current_user, "symptom", pet_id, upserted=symptom.id)
+    return _OUT.response(symptom, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/symptoms/{symptom_id}", response_model=SymptomOut)
@@ -64,16 +66,11 @@ async def update_symptom(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    symptom = await db.get(Symptom, symptom_id)
-    if not symptom:
-        raise HTTPException(status_code=404, detail="Symptom not found")
-    await get_pet_for_user(symptom.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(symptom, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    symptom = await update_owned(db, Symptom, symptom_id, current_user, values, "Symptom not found")
     await db.commit()
-    await db.refresh(symptom)
-    return SymptomOut.model_validate(symptom)
+    data_changes.publish(current_user, "symptom", symptom.pet_id, upserted=symptom.id)
+    return _OUT.response(symptom)
 
 
 @router.delete("/symptoms/{symptom_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -82,9 +79,6 @@ async def delete_symptom(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    symptom = await db.get(Symptom, symptom_id)
-    if not symptom:
-        raise HTTPException(status_code=404, detail="Symptom not found")
-    await get_pet_for_user(symptom.pet_id, current_user, db)
-    await db.delete(symptom)
+    pet_id = await delete_owned(db, Symptom, symptom_id, current_user, "Symptom not found")
     await db.commit()
+    data_changes.publish(current_user, "symptom", pet_id, deleted=symptom_id)
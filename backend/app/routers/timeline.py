@@ -0,0 +1,162 @@
+"""One newest-first feed of everything recorded for a pet.
+
+Each source table is read with a keyset bound taken from the cursor, ordered
+by its (pet_id, <time>) index and capped at ``limit + 1`` rows, so a page
+costs about ``limit`` rows per table however deep the client has scrolled.
+The per-table runs are then k-way merged with ``heapq.merge`` on
+(at, kind, id), which is also the order the cursor encodes.
+"""
+
+import base64
+import heapq
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.archive import ARCHIVES, archive_horizon
+from app.core.database import get_db, run_concurrently
+from app.core.dependencies import get_pet_for_user
+from app.core.security import get_current_user
+from app.core.serialization import Serializer
+from app.models.event import Event
+from app.models.feeding_log import FeedingLog
+from app.models.medication import Medication
+from app.models.symptom import Symptom
+from app.models.user import User
+from app.models.vaccine import Vaccine
+from app.models.water_log import WaterLog
+from app.models.weight_log import WeightLog
+from app.schemas.event import EventOut
+from app.schemas.feeding import FeedingOut
+from app.schemas.medication import MedicationOut
+from app.schemas.symptom import SymptomOut
+from app.schemas.timeline import TimelineItem, TimelinePage
+from app.schemas.vaccine import VaccineOut
+from app.schemas.water import WaterOut
+from app.schemas.weight import WeightOut
+
+router = APIRouter(tags=["timeline"])
+
+_OUT = Serializer(TimelinePage)
+
+
+@dataclass(frozen=True)
+class _Source:
+    kind: str
+    model: Any
+    at: str  # attribute holding the row's timestamp (or date)
+    schema: type[BaseModel]
+
+
+_SOURCES = (
+    _Source("feeding", FeedingLog, "datetime_", FeedingOut),
+    _Source("water", WaterLog, "datetime_", WaterOut),
+    _Source("weight", WeightLog, "datetime_", WeightOut),
+    _Source("symptom", Symptom, "datetime_", SymptomOut),
+    _Source("vaccine", Vaccine, "date_administered", VaccineOut),
+    _Source("medication", Medication, "start_date", MedicationOut),
+    _Source("event", Event, "datetime_start", EventOut),
+)
+
+Cursor = tuple[datetime, str, int]
+
+
+def _as_utc(value: datetime | date) -> datetime:
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time.min, tzinfo=timezone.utc)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def encode_cursor(key: Cursor) -> str:
+    at, kind, row_id = key
+    raw = json.dumps([at.isoformat(), kind, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        at, kind, row_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return _as_utc(datetime.fromisoformat(at)), str(kind), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _older_than(source: _Source, model, cursor: Cursor):
+    """WHERE criterion: the row sorts after ``cursor`` in (at, kind, id) DESC order."""
+    at, kind, row_id = cursor
+    column = getattr(model, source.at)
+    bound: datetime | date = at
+    if column.type.python_type is date:
+        bound = at.date()
+        if at.time() != time.min:
+            # Every row on that day sits at midnight, before the cursor
+            return column <= bound
+    if source.kind < kind:
+        return column <= bound
+    if source.kind > kind:
+        return column < bound
+    return or_(column < bound, and_(column == bound, model.id < row_id))
+
+
+def _page_query(source: _Source, model, pet_id: int, cursor: Cursor | None, limit: int):
+    column = getattr(model, source.at)
+    q = select(model).where(model.pet_id == pet_id)
+    if cursor is not None:
+        q = q.where(_older_than(source, model, cursor))
+    return q.order_by(column.desc(), model.id.desc()).limit(limit + 1)
+
+
+def _fetch(source: _Source, model, pet_id: int, cursor: Cursor | None, limit: int):
+    async def job(session: AsyncSession) -> list[TimelineItem]:
+        rows = (await session.execute(_page_query(source, model, pet_id, cursor, limit))).scalars().all()
+        return [
+            TimelineItem(
+                kind=source.kind,
+                id=row.id,
+                at=_as_utc(getattr(row, source.at)),
+                data=source.schema.model_validate(row, from_attributes=True),
+            )
+            for row in rows
+        ]
+    return job
+
+
+def _sort_key(item: TimelineItem) -> Cursor:
+    return item.at, item.kind, item.id
+
+
+@router.get("/pets/{pet_id}/timeline", response_model=TimelinePage)
+async def pet_timeline(
+    pet_id: int,
+    cursor: str | None = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Everything recorded for a pet, newest first, one cursor-paged feed."""
+    await get_pet_for_user(pet_id, current_user, db)
+    after = decode_cursor(cursor) if cursor else None
+
+    runs = await run_concurrently(db, *(_fetch(s, s.model, pet_id, after, limit) for s in _SOURCES))
+
+    # Archived logs are all older than the horizon: skip them when the hot
+    # table already filled this page with newer rows
+    horizon = archive_horizon()
+    archived = [
+        (source, ARCHIVES[source.model]) for source, run in zip(_SOURCES, runs)
+        if source.model in ARCHIVES and (len(run) <= limit or run[-1].at < horizon)
+    ]
+    if archived:
+        runs += await run_concurrently(
+            db, *(_fetch(source, archive, pet_id, after, limit) for source, archive in archived))
+
+    merged = heapq.merge(*runs, key=_sort_key, reverse=True)
+    items = [item for _, item in zip(range(limit + 1), merged)]
+    next_cursor = encode_cursor(_sort_key(items[limit - 1])) if len(items) > limit else None
+    return _OUT.response(TimelinePage(items=items[:limit], next_cursor=next_cursor))
@@ -1,17 +1,22 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.vaccine import Vaccine
 from app.schemas.vaccine import VaccineCreate, VaccineUpdate, VaccineOut
 
 router = APIRouter(tags=["vaccines"])
 
+_OUT = Serializer(VaccineOut)
+_LIST_OUT = Serializer(list[VaccineOut])
+
 _ALLOWED_FIELDS = {"name", "date_administered", "next_due_date", "clinic", "notes", "document_url"}
 
 
@@ -33,7 +38,7 @@ async def list_vaccines(
         q = q.where(Vaccine.date_administered <= date_to)
     q = q.order_by(Vaccine.date_administered.desc()).limit(limit).offset(offset)
     result = await db.execute(q)
-    return [VaccineOut.model_validate(v) for v in result.scalars().all()]
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/vaccines", response_model=VaccineOut, status_code=status.HTTP_201_CREATED)
@@ -43,12 +48,10 @@ async def create_vaccine(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    vaccine = Vaccine(**data.model_dump(), pet_id=pet_id)
-    db.add(vaccine)
+    vaccine = await insert_owned(db, Vaccine, pet_id, current_user, data.model_dump())
     await db.commit()
-    await db.refresh(vaccine)
-    return VaccineOut.model_validate(vaccine)
+    data_changes.publish(current_user, "vaccine", pet_id, upserted=vaccine.id)
+    return _OUT.response(vaccine, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/vaccines/{vaccine_id}", response_model=VaccineOut)
@@ -58,16 +61,11 @@ async def update_vaccine(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    vaccine = await db.get(Vaccine, vaccine_id)
-    if not vaccine:
-        raise HTTPException(status_code=404, detail="Vaccine not found")
-    await get_pet_for_user(vaccine.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(vaccine, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    vaccine = await update_owned(db, Vaccine, vaccine_id, current_user, values, "Vaccine not found")
     await db.commit()
-    await db.refresh(vaccine)
-    return VaccineOut.model_validate(vaccine)
+    data_changes.publish(current_user, "vaccine", vaccine.pet_id, upserted=vaccine.id)
+    return _OUT.response(vaccine)
 
 
 @router.delete("/vaccines/{vaccine_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -76,9 +74,6 @@ async def delete_vaccine(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    vaccine = await db.get(Vaccine, vaccine_id)
-    if not vaccine:
-        raise HTTPException(status_code=404, detail="Vaccine not found")
-    await get_pet_for_user(vaccine.pet_id, current_user, db)
-    await db.delete(vaccine)
+    pet_id = await delete_owned(db, Vaccine, vaccine_id, current_user, "Vaccine not found")
     await db.commit()
+    data_changes.publish(current_user, "vaccine", pet_id, deleted=vaccine_id)
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.archive import log_history
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.water_log import WaterLog
 from app.schemas.water import WaterCreate, WaterUpdate, WaterOut
 
 router = APIRouter(tags=["water"])
 
+_OUT = Serializer(WaterOut)
+_LIST_OUT = Serializer(list[WaterOut])
+
 _ALLOWED_FIELDS = {"datetime_", "amount_ml", "daily_goal_ml"}
 
 
@@ -26,14 +31,8 @@ async def list_water(
     current_user: User = Depends(get_current_user),
 ):
     await get_pet_for_user(pet_id, current_user, db)
-    q = select(WaterLog).where(WaterLog.pet_id == pet_id)
-    if date_from:
-        q = q.where(WaterLog.datetime_ >= date_from)
-    if date_to:
-        q = q.where(WaterLog.datetime_ <= date_to)
-    q = q.order_by(WaterLog.datetime_.desc()).limit(limit).offset(offset)
-    result = await db.execute(q)
-    return [WaterOut.model_validate(w) for w in result.scalars().all()]
+    result = await db.execute(log_history(WaterLog, pet_id, date_from, date_to, limit, offset))
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/water", response_model=WaterOut, status_code=status.HTTP_201_CREATED)
@@ -43,17 +42,14 @@ async def create_water(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    log = WaterLog(
-        pet_id=pet_id,
-        datetime_=data.datetime_ or datetime.now(timezone.utc),
-        amount_ml=data.amount_ml,
-        daily_goal_ml=data.daily_goal_ml,
-    )
-    db.add(log)
+    log = await insert_owned(db, WaterLog, pet_id, current_user, {
+        "datetime_": data.datetime_ or datetime.now(timezone.utc),
+        "amount_ml": data.amount_ml,
+        "daily_goal_ml": data.daily_goal_ml,
+    })
     await db.commit()
-    await db.refresh(log)
-    return WaterOut.model_validate(log)
+    data_changes.publish(current_user, "water", pet_id, upserted=log.id)
+    return _OUT.response(log, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/water/{water_id}", response_model=WaterOut)
@@ -63,16 +59,11 @@ async def update_water(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    log = await db.get(WaterLog, water_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="Water log not found")
-    await get_pet_for_user(log.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(log, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    log = await update_owned(db, WaterLog, water_id, current_user, values, "Water log not found")
     await db.commit()
-    await db.refresh(log)
-    return WaterOut.model_validate(log)
+    data_changes.publish(current_user, "water", log.pet_id, upserted=log.id)
+    return _OUT.response(log)
 
 
 @router.delete("/water/{water_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -81,9 +72,6 @@ async def delete_water(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    log = await db.get(WaterLog, water_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="Water log not found")
-    await get_pet_for_user(log.pet_id, current_user, db)
-    await db.delete(log)
+    pet_id = await delete_owned(db, WaterLog, water_id, current_user, "Water log not found")
     await db.commit()
+    data_changes.publish(current_user, "water", pet_id, deleted=water_id)
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.changes import data_changes
 from app.core.database import get_db
-from app.core.dependencies import get_pet_for_user
+from app.core.dependencies import delete_owned, get_pet_for_user, insert_owned, update_owned
 from app.core.security import get_current_user
+from app.core.serialization import Serializer
 from app.models.user import User
 from app.models.weight_log import WeightLog
 from app.schemas.weight import WeightCreate, WeightUpdate, WeightOut
 
 router = APIRouter(tags=["weight"])
 
+_OUT = Serializer(WeightOut)
+_LIST_OUT = Serializer(list[WeightOut])
+
 _ALLOWED_FIELDS = {"datetime_", "weight_kg", "notes"}
 
 
@@ -33,7 +38,7 @@ async def list_weight(
         q = q.where(WeightLog.datetime_ <= date_to)
     q = q.order_by(WeightLog.datetime_.desc()).limit(limit).offset(offset)
     result = await db.execute(q)
-    return [WeightOut.model_validate(w) for w in result.scalars().all()]
+    return _LIST_OUT.response(result.scalars().all())
 
 
 @router.post("/pets/{pet_id}/weight", response_model=WeightOut, status_code=status.HTTP_201_CREATED)
@@ -43,17 +48,14 @@ async def create_weight(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await get_pet_for_user(pet_id, current_user, db)
-    log = WeightLog(
-        pet_id=pet_id,
-        datetime_=data.datetime_ or datetime.now(timezone.utc),
-        weight_kg=data.weight_kg,
-        notes=data.notes,
-    )
-    db.add(log)
+    log = await insert_owned(db, WeightLog, pet_id, current_user, {
+        "datetime_": data.datetime_ or datetime.now(timezone.utc),
+        "weight_kg": data.weight_kg,
+        "notes": data.notes,
+    })
     await db.commit()
-    await db.refresh(log)
-    return WeightOut.model_validate(log)
+    data_changes.publish(current_user, "weight", pet_id, upserted=log.id)
+    return _OUT.response(log, status_code=status.HTTP_201_CREATED)
 
 
 @router.put("/weight/{weight_id}", response_model=WeightOut)
@@ -63,16 +65,11 @@ async def update_weight(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    log = await db.get(WeightLog, weight_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="Weight log not found")
-    await get_pet_for_user(log.pet_id, current_user, db)
-    for key, value in data.model_dump(exclude_unset=True).items():
-        if key in _ALLOWED_FIELDS:
-            setattr(log, key, value)
+    values = {k: v for k, v in data.model_dump(exclude_unset=True).items() if k in _ALLOWED_FIELDS}
+    log = await update_owned(db, WeightLog, weight_id, current_user, values, "Weight log not found")
     await db.commit()
-    await db.refresh(log)
-    return WeightOut.model_validate(log)
+    data_changes.publish(current_user, "weight", log.pet_id, upserted=log.id)
+    return _OUT.response(log)
 
 
 @router.delete("/weight/{weight_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -81,9 +78,6 @@ async def delete_weight(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    log = await db.get(WeightLog, weight_id)
-    if not log:
-        raise HTTPException(status_code=404, detail="Weight log not found")
-    await get_pet_for_user(log.pet_id, current_user, db)
-    await db.delete(log)
+    pet_id = await delete_owned(db, WeightLog, weight_id, current_user, "Weight log not found")
     await db.commit()
+    data_changes.publish(current_user, "weight", pet_id, deleted=weight_id)
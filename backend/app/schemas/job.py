@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Any, Optional
+from pydantic import BaseModel
+
+
+class JobOut(BaseModel):
+    id: int
+    kind: str
+    status: str  # queued, running, succeeded, failed
+    progress: float
+    progress_message: Optional[str]
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    result: Optional[Any]
+    last_error: Optional[str]
+    created_at: datetime
+    finished_at: Optional[datetime]
+
+    model_config = {"from_attributes": True}
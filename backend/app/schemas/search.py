@@ -0,0 +1,10 @@
+from typing import Optional
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    kind: str  # pet, feeding, symptom, event, vaccine, medication
+    id: int
+    pet_id: int
+    score: float  # higher is more relevant; comparable within one result list only
+    snippet: Optional[str]  # matched text, hits wrapped in [ ]
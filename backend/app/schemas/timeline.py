@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional, Union
+from pydantic import BaseModel
+
+from app.schemas.event import EventOut
+from app.schemas.feeding import FeedingOut
+from app.schemas.medication import MedicationOut
+from app.schemas.symptom import SymptomOut
+from app.schemas.vaccine import VaccineOut
+from app.schemas.water import WaterOut
+from app.schemas.weight import WeightOut
+
+
+class TimelineItem(BaseModel):
+    kind: str  # feeding, water, weight, symptom, vaccine, medication, event
+    id: int
+    at: datetime  # UTC; midnight for date-only records (vaccines, medications)
+    data: Union[FeedingOut, WaterOut, WeightOut, SymptomOut, VaccineOut, MedicationOut, EventOut]
+
+
+class TimelinePage(BaseModel):
+    items: list[TimelineItem]
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next (older) page
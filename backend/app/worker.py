@@ -0,0 +1,42 @@
+"""Standalone background job worker.
+
+    python -m app.worker [--concurrency N]
+
+Runs the same claim loop as the in-process worker, against DATABASE_URL.
+Set JOB_WORKER_IN_PROCESS=false on the API when running workers this way.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from app.core.database import engine
+from app.core.jobs import Worker
+
+logger = logging.getLogger("pwelltrack.worker")
+
+
+async def main(concurrency: int | None) -> None:
+    task = asyncio.create_task(Worker(engine, concurrency=concurrency).run())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, task.cancel)
+    try:
+        await task
+    except asyncio.CancelledError:
+        logger.info("Job worker stopping")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s | %(levelname)-7s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    parser = argparse.ArgumentParser(description="Run background jobs from the jobs table.")
+    parser.add_argument("--concurrency", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
@@ -0,0 +1 @@
+"""Performance benchmarks for the PWellTrack API (not collected by pytest)."""
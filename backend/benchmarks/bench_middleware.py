@@ -0,0 +1,116 @@
+"""Compare the old BaseHTTPMiddleware stack with app.core.middleware.
+
+Both apps carry the same CORS + safety + logging layers and the same routes;
+only the implementation of the two custom layers differs.  The "before" stack
+reproduces the previous ``@app.middleware("http")`` logger and
+``CORSSafetyMiddleware(BaseHTTPMiddleware)`` verbatim.
+
+    python -m benchmarks.bench_middleware [--iterations 1000]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.middleware import CORSSafetyMiddleware, RequestLoggingMiddleware
+
+ORIGIN = "https://p-well-track.vercel.app"
+logger = logging.getLogger("pwelltrack")
+
+
+class _OldCORSSafetyMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        try:
+            response = await call_next(request)
+        except Exception:
+            logger.exception("Exception escaped middleware stack on %s %s", request.method, request.url.path)
+            response = JSONResponse(status_code=500, content={"detail": "Internal server error"})
+        if "access-control-allow-origin" not in response.headers:
+            origin = request.headers.get("origin")
+            if origin == ORIGIN:
+                response.headers["access-control-allow-origin"] = origin
+                response.headers["access-control-allow-credentials"] = "true"
+        return response
+
+
+def _add_routes(app: FastAPI, chunks: int) -> None:
+    payload = {"items": [{"id": i, "name": f"Pet {i}"} for i in range(50)]}
+
+    @app.get("/json")
+    async def json_route():
+        return payload
+
+    @app.get("/stream")
+    async def stream_route():
+        async def body():
+            for _ in range(chunks):
+                yield b"x" * 4096
+        return StreamingResponse(body(), media_type="application/octet-stream")
+
+
+def build_old_app(chunks: int) -> FastAPI:
+    app = FastAPI()
+    _add_routes(app, chunks)
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info("%s %s %d (%.0fms)", request.method, request.url.path, response.status_code, elapsed_ms)
+        return response
+
+    app.add_middleware(_OldCORSSafetyMiddleware)
+    app.add_middleware(CORSMiddleware, allow_origins=[ORIGIN], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    return app
+
+
+def build_new_app(chunks: int) -> FastAPI:
+    app = FastAPI()
+    _add_routes(app, chunks)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(CORSMiddleware, allow_origins=[ORIGIN], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    app.add_middleware(CORSSafetyMiddleware, allowed_origins=[ORIGIN])
+    return app
+
+
+async def _time(app: FastAPI, path: str, iterations: int) -> list[float]:
+    samples = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench",
+                           headers={"Origin": ORIGIN}) as client:
+        for _ in range(20):  # warm-up
+            await client.get(path)
+        for _ in range(iterations):
+            start = time.perf_counter()
+            resp = await client.get(path)
+            samples.append((time.perf_counter() - start) * 1000)
+            resp.raise_for_status()
+    return samples
+
+
+async def main(iterations: int, chunks: int) -> None:
+    logging.getLogger("pwelltrack").setLevel(logging.WARNING)  # keep I/O out of the timings
+    old_app, new_app = build_old_app(chunks), build_new_app(chunks)
+    for path in ("/json", "/stream"):
+        before = await _time(old_app, path, iterations)
+        after = await _time(new_app, path, iterations)
+        b, a = statistics.median(before), statistics.median(after)
+        print(f"{path:8s} old p50 {b:7.3f} ms  new p50 {a:7.3f} ms  speedup x{b / a:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--chunks", type=int, default=64, help="4 KiB chunks per streamed response")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.chunks))
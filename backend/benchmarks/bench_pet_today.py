@@ -0,0 +1,100 @@
+"""Compare the sequential pet_today queries with the single composite statement.
+
+A seeded SQLite database stands in for Postgres, and a cursor hook sleeps
+``--latency-ms`` before every statement to mimic the network round trip to
+the pooler.  "before" replays the previous handler's six awaits (ownership,
+feeding, water, water goal, events, medications); "after" is
+``load_pet_today``.
+
+    python -m benchmarks.bench_pet_today [--latency-ms 0 2 10] [--iterations 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time as _time
+from datetime import date, datetime, time, timezone
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models.event import Event
+from app.models.feeding_log import FeedingLog
+from app.models.medication import Medication
+from app.models.pet import Pet
+from app.models.water_log import WaterLog
+from app.routers.pets import load_pet_today
+from benchmarks.generate import DatasetSpec, generate
+
+_latency = {"seconds": 0.0}
+
+
+async def before(db: AsyncSession, pet_id: int, user_id: int, today: date) -> None:
+    pet = await db.get(Pet, pet_id)
+    assert pet is not None and pet.user_id == user_id
+    start = datetime.combine(today, time.min, tzinfo=timezone.utc)
+    end = datetime.combine(today, time.max, tzinfo=timezone.utc)
+    await db.execute(select(
+        func.coalesce(func.sum(FeedingLog.actual_amount_grams), 0),
+        func.coalesce(func.sum(FeedingLog.planned_amount_grams), 0),
+        func.count(FeedingLog.id),
+    ).where(FeedingLog.pet_id == pet_id, FeedingLog.datetime_.between(start, end)))
+    await db.execute(select(func.coalesce(func.sum(WaterLog.amount_ml), 0), func.count(WaterLog.id))
+                     .where(WaterLog.pet_id == pet_id, WaterLog.datetime_.between(start, end)))
+    await db.execute(select(WaterLog.daily_goal_ml)
+                     .where(WaterLog.pet_id == pet_id, WaterLog.daily_goal_ml.isnot(None))
+                     .order_by(WaterLog.datetime_.desc()).limit(1))
+    (await db.execute(select(Event).where(Event.pet_id == pet_id, Event.datetime_start >= datetime.now(timezone.utc))
+                      .order_by(Event.datetime_start).limit(5))).scalars().all()
+    (await db.execute(select(Medication).where(
+        Medication.pet_id == pet_id, Medication.start_date <= today,
+        (Medication.end_date.is_(None)) | (Medication.end_date >= today),
+    ))).scalars().all()
+
+
+async def after(db: AsyncSession, pet_id: int, user_id: int, today: date) -> None:
+    await load_pet_today(db, pet_id, user_id, today, timezone.utc)
+
+
+async def _time_variant(factory, fn, spec: DatasetSpec, iterations: int) -> list[float]:
+    samples = []
+    today = spec.anchor
+    for i in range(iterations):
+        user_id = i % spec.users + 1
+        pet_id = (user_id - 1) * spec.pets_per_user + 1
+        async with factory() as db:
+            start = _time.perf_counter()
+            await fn(db, pet_id, user_id, today)
+            samples.append((_time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def main(latencies_ms: list[float], iterations: int) -> None:
+    spec = DatasetSpec(users=20, pets_per_user=2, years=1, anchor=datetime.now(timezone.utc).date())
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        await generate(engine, spec)
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _inject_latency(conn, cursor, statement, parameters, context, executemany):
+            if _latency["seconds"]:
+                _time.sleep(_latency["seconds"])
+
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        print(f"{'latency':>8s} {'before p50':>11s} {'after p50':>10s} {'speedup':>8s}")
+        for latency in latencies_ms:
+            _latency["seconds"] = latency / 1000
+            old = await _time_variant(factory, before, spec, iterations)
+            new = await _time_variant(factory, after, spec, iterations)
+            old_p50, new_p50 = statistics.median(old), statistics.median(new)
+            print(f"{latency:6.1f}ms {old_p50:9.2f}ms {new_p50:8.2f}ms {old_p50 / new_p50:7.1f}x")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0.0, 2.0, 10.0])
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.latency_ms, args.iterations))
@@ -0,0 +1,148 @@
+"""Compare the default FastAPI response path with app.core.serialization.
+
+Each scenario mounts two routes on a throwaway app that return the same
+in-memory ORM-like rows: one the old way (``XOut.model_validate`` +
+``response_model`` re-validation + ``jsonable_encoder``) and one through a
+precompiled ``Serializer``.  Bodies are checked for byte equality first.
+
+    python -m benchmarks.bench_serialization [--iterations 300]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.core.serialization import Serializer
+from app.schemas.dashboard import (
+    FeedingSummary, PetDashboard, PetSummaryItem, VaccineStatusSummary, WaterSummary,
+)
+from app.schemas.event import EventOut
+from app.schemas.feeding import FeedingOut
+from app.schemas.medication import MedicationOut
+from app.schemas.pet import PetOut
+
+_NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _feeding_rows(n: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=i, pet_id=1, datetime_=_NOW - timedelta(hours=i), food_type="dry kibble",
+            planned_amount_grams=150.0, actual_amount_grams=142.5, notes="ração húmida" if i % 3 else None,
+        )
+        for i in range(n)
+    ]
+
+
+def _summary_rows(n_pets: int) -> list[tuple[SimpleNamespace, list, list]]:
+    """ORM-like (pet, upcoming events, active meds) rows as pets_summary loads them."""
+    photo = "data:image/jpeg;base64," + "A" * 20_000
+    rows = []
+    for p in range(n_pets):
+        pet = SimpleNamespace(
+            id=p, name=f"Pet {p}", species="dog", breed="Labrador", date_of_birth=date(2020, 1, 1),
+            sex="female", weight_kg=21.4, photo_url=photo, notes=None, created_at=_NOW, updated_at=_NOW,
+        )
+        events = [
+            SimpleNamespace(
+                id=p * 10 + e, pet_id=p, type="vet_visit", title="Checkup", datetime_start=_NOW + timedelta(days=e),
+                duration_minutes=30, location="Clinic", notes=None, reminder_minutes_before=60,
+            )
+            for e in range(5)
+        ]
+        meds = [
+            SimpleNamespace(
+                id=p * 10 + m, pet_id=p, name="Antibiotic", dosage="5 mg", frequency_per_day=2,
+                start_date=date(2026, 2, 1), end_date=None, times_of_day=["08:00", "20:00"], notes=None,
+            )
+            for m in range(3)
+        ]
+        rows.append((pet, events, meds))
+    return rows
+
+
+def _assemble_summary(rows: list[tuple[SimpleNamespace, list, list]]) -> list[PetSummaryItem]:
+    """Build the response tree with the same calls pets_summary makes."""
+    items = []
+    for pet, events, meds in rows:
+        items.append(PetSummaryItem(
+            pet=PetOut.model_validate(pet),
+            dashboard=PetDashboard(
+                feeding=FeedingSummary(total_actual_grams=300.0, total_planned_grams=320.0, entries_count=2),
+                water=WaterSummary(total_ml=450.0, daily_goal_ml=800.0, entries_count=3),
+                upcoming_events=[EventOut.model_validate(e) for e in events],
+                active_medications=[MedicationOut.model_validate(m) for m in meds],
+            ),
+            vaccine_status=VaccineStatusSummary(status="up_to_date", overdue_count=0),
+        ))
+    return items
+
+
+def build_app(list_rows: int, summary_pets: int) -> FastAPI:
+    app = FastAPI()
+    rows = _feeding_rows(list_rows)
+    summary_rows = _summary_rows(summary_pets)
+    list_out = Serializer(list[FeedingOut])
+    summary_out = Serializer(list[PetSummaryItem])
+
+    @app.get("/old/list", response_model=list[FeedingOut])
+    async def old_list():
+        return [FeedingOut.model_validate(r) for r in rows]
+
+    @app.get("/new/list", response_model=list[FeedingOut])
+    async def new_list():
+        return list_out.response(rows)
+
+    @app.get("/old/summary", response_model=list[PetSummaryItem])
+    async def old_summary():
+        return _assemble_summary(summary_rows)
+
+    @app.get("/new/summary", response_model=list[PetSummaryItem])
+    async def new_summary():
+        return summary_out.response(_assemble_summary(summary_rows))
+
+    return app
+
+
+async def _time(client: AsyncClient, path: str, iterations: int) -> list[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        resp = await client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+        resp.raise_for_status()
+    return samples
+
+
+async def main(iterations: int, list_rows: int, summary_pets: int) -> None:
+    app = build_app(list_rows, summary_pets)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for name in ("list", "summary"):
+            old = await client.get(f"/old/{name}")
+            new = await client.get(f"/new/{name}")
+            assert old.content == new.content, f"{name}: response bodies differ"
+
+            await _time(client, f"/old/{name}", 20)  # warm-up
+            before = await _time(client, f"/old/{name}", iterations)
+            await _time(client, f"/new/{name}", 20)
+            after = await _time(client, f"/new/{name}", iterations)
+            b, a = statistics.median(before), statistics.median(after)
+            print(
+                f"{name:8s} {len(new.content) / 1024:8.1f} KiB  "
+                f"old p50 {b:7.2f} ms  new p50 {a:7.2f} ms  speedup x{b / a:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--list-rows", type=int, default=200)
+    parser.add_argument("--summary-pets", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.list_rows, args.summary_pets))
@@ -3,7 +3,8 @@ import asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
-from app.core.database import Base, get_db
+from app.core.database import Base, enable_sqlite_foreign_keys, get_db
+from app.core.query_stats import instrument_queries
 from app.main import app
 from app.routers.auth import limiter as auth_limiter
 
@@ -12,6 +13,8 @@ auth_limiter.enabled = False
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 test_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+enable_sqlite_foreign_keys(test_engine.sync_engine)
+instrument_queries(test_engine.sync_engine)
 TestSession = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
 
 
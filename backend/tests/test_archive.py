@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.core.archive import archive_old_logs
+from app.models.feeding_log import FeedingLog, FeedingLogArchive
+from app.models.water_log import WaterLog, WaterLogArchive
+from tests.conftest import TestSession, test_engine
+
+
+async def _count(model) -> int:
+    async with TestSession() as db:
+        return (await db.execute(select(func.count()).select_from(model))).scalar()
+
+
+async def test_old_logs_move_to_archive_and_stay_readable(auth_client: AsyncClient):
+    pet_id = (await auth_client.post("/pets/", json={"name": "Rex", "species": "dog"})).json()["id"]
+    now = datetime.now(timezone.utc)
+    old = now - timedelta(days=400)
+    for i in range(3):
+        await auth_client.post(f"/pets/{pet_id}/feeding", json={
+            "datetime": (old + timedelta(hours=i)).isoformat(), "food_type": "old", "actual_amount_grams": 10,
+        })
+    for i in range(2):
+        await auth_client.post(f"/pets/{pet_id}/feeding", json={
+            "datetime": (now - timedelta(hours=i)).isoformat(), "food_type": "new", "actual_amount_grams": 20,
+        })
+    # The only goal row stays hot even though it is old; the other old row moves
+    await auth_client.post(f"/pets/{pet_id}/water", json={"datetime": old.isoformat(), "amount_ml": 100})
+    await auth_client.post(f"/pets/{pet_id}/water", json={
+        "datetime": (old + timedelta(hours=1)).isoformat(), "amount_ml": 100, "daily_goal_ml": 500,
+    })
+
+    moved = await archive_old_logs(test_engine, cutoff=now - timedelta(days=365), batch_size=2)
+
+    assert moved == {"feeding_logs": 3, "water_logs": 1}
+    assert (await _count(FeedingLog), await _count(FeedingLogArchive)) == (2, 3)
+    assert (await _count(WaterLog), await _count(WaterLogArchive)) == (1, 1)
+
+    history = (await auth_client.get(f"/pets/{pet_id}/feeding")).json()
+    assert [f["food_type"] for f in history] == ["new", "new", "old", "old", "old"]
+    page = (await auth_client.get(f"/pets/{pet_id}/feeding", params={"limit": 2, "offset": 2})).json()
+    assert [f["food_type"] for f in page] == ["old", "old"]
+    recent = (await auth_client.get(f"/pets/{pet_id}/feeding", params={
+        "date_from": (now - timedelta(days=1)).isoformat()})).json()
+    assert len(recent) == 2
+    assert len((await auth_client.get(f"/pets/{pet_id}/water")).json()) == 2
+
+    await auth_client.delete(f"/pets/{pet_id}")
+    assert await _count(FeedingLogArchive) == 0
+    assert await _count(WaterLogArchive) == 0
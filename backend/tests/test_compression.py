@@ -0,0 +1,96 @@
+import gzip
+import json
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from httpx import AsyncClient, ASGITransport
+
+from app.core.compression import CompressionMiddleware, negotiate
+from app.core.metrics import http_response_compression_ratio
+
+BIG = {"items": [{"id": i, "name": f"pet {i}", "notes": "lorem ipsum " * 5} for i in range(200)]}
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/big")
+    async def big():
+        return BIG
+
+    @app.get("/small")
+    async def small():
+        return {"status": "ok"}
+
+    @app.get("/photo")
+    async def photo():
+        return Response(b"\x89PNG" + b"\0" * 5000, media_type="image/png")
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            for i in range(3):
+                yield f"line {i} ".encode() * 50
+        return StreamingResponse(body(), media_type="text/plain")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+    return app
+
+
+async def _get(path: str, accept_encoding: str) -> tuple:
+    # Read the raw stream: httpx would otherwise decode the body for us
+    async with AsyncClient(transport=ASGITransport(app=_build_app()), base_url="http://test") as client:
+        async with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as resp:
+            raw = b"".join([chunk async for chunk in resp.aiter_raw()])
+            return resp, raw
+
+
+async def test_large_json_is_gzipped():
+    before = http_response_compression_ratio.count("gzip")
+    resp, raw = await _get("/big", "gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["content-length"] == str(len(raw))
+    assert "accept-encoding" in resp.headers["vary"].lower()
+    assert json.loads(gzip.decompress(raw)) == BIG
+    assert http_response_compression_ratio.count("gzip") == before + 1
+
+
+async def test_small_and_incompressible_bodies_pass_through():
+    resp, raw = await _get("/small", "gzip")
+    assert "content-encoding" not in resp.headers
+    assert json.loads(raw) == {"status": "ok"}
+
+    resp, raw = await _get("/photo", "gzip")
+    assert "content-encoding" not in resp.headers
+    assert raw.startswith(b"\x89PNG")
+
+
+async def test_identity_when_not_accepted():
+    resp, raw = await _get("/big", "gzip;q=0, identity")
+    assert "content-encoding" not in resp.headers
+    assert json.loads(raw) == BIG
+
+
+async def test_streamed_body_is_compressed_per_chunk():
+    resp, raw = await _get("/stream", "gzip")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "content-length" not in resp.headers
+    expected = b"".join(f"line {i} ".encode() * 50 for i in range(3))
+    assert zlib.decompress(raw, 31) == expected
+
+
+def test_negotiation_prefers_quality_then_server_order():
+    assert negotiate("gzip, br", ["zstd", "br", "gzip"]) == "br"
+    assert negotiate("gzip;q=1, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate("*", ["zstd", "gzip"]) == "zstd"
+    assert negotiate("identity", ["gzip"]) is None
+    assert negotiate("", ["gzip"]) is None
+
+
+async def test_brotli_when_installed():
+    brotli = pytest.importorskip("brotli")
+    resp, raw = await _get("/big", "br")
+    assert resp.headers["content-encoding"] == "br"
+    assert json.loads(brotli.decompress(raw)) == BIG
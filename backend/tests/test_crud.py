@@ -1,6 +1,12 @@
 import pytest
 from httpx import AsyncClient
 
+from app.models.event import Event
+from app.models.feeding_log import FeedingLog
+from app.models.pet import Pet
+from app.models.user import User
+from tests.conftest import TestSession
+
 
 async def _create_pet(client: AsyncClient) -> int:
     resp = await client.post("/pets/", json={"name": "TestPet", "species": "dog"})
@@ -109,6 +115,44 @@ async def test_symptom_crud(auth_client: AsyncClient):
     assert resp.status_code == 204
 
 
+@pytest.mark.asyncio
+async def test_event_partial_update_keeps_reminder_in_sync(auth_client: AsyncClient):
+    pet_id = await _create_pet(auth_client)
+    resp = await auth_client.post(f"/pets/{pet_id}/events", json={
+        "type": "vet_visit", "title": "Checkup",
+        "datetime_start": "2025-12-01T10:00:00", "reminder_minutes_before": 60,
+    })
+    eid = resp.json()["id"]
+    for body, expected in (
+        ({"datetime_start": "2025-12-02T10:00:00"}, "2025-12-02T09:00:00"),
+        ({"reminder_minutes_before": 30}, "2025-12-02T09:30:00"),
+        ({"datetime_start": "2025-12-03T10:00:00", "reminder_minutes_before": 15}, "2025-12-03T09:45:00"),
+    ):
+        assert (await auth_client.put(f"/events/{eid}", json=body)).status_code == 200
+        async with TestSession() as db:
+            assert (await db.get(Event, eid)).reminder_at.isoformat().startswith(expected)
+
+
+@pytest.mark.asyncio
+async def test_other_users_rows_are_not_found(auth_client: AsyncClient):
+    async with TestSession() as db:
+        other = User(name="Other", email="other@example.com", password_hash="x")
+        pet = Pet(owner=other, name="Theirs", species="cat")
+        log = FeedingLog(pet=pet, food_type="dry", actual_amount_grams=100)
+        db.add_all([other, pet, log])
+        await db.commit()
+        pet_id, log_id = pet.id, log.id
+
+    assert (await auth_client.put(f"/feeding/{log_id}", json={"food_type": "wet"})).status_code == 404
+    assert (await auth_client.delete(f"/feeding/{log_id}")).status_code == 404
+    assert (await auth_client.put(f"/pets/{pet_id}", json={"name": "Mine"})).status_code == 404
+    assert (await auth_client.delete(f"/pets/{pet_id}")).status_code == 404
+    assert (await auth_client.put("/feeding/9999", json={"food_type": "wet"})).status_code == 404
+    async with TestSession() as db:
+        assert (await db.get(FeedingLog, log_id)).food_type == "dry"
+        assert (await db.get(Pet, pet_id)).name == "Theirs"
+
+
 @pytest.mark.asyncio
 async def test_health(auth_client: AsyncClient):
     resp = await auth_client.get("/health")
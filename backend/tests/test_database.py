@@ -0,0 +1,34 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from app.core.database import run_concurrently
+from tests.conftest import TestSession
+
+
+async def test_run_concurrently_overlaps_jobs_under_a_cap():
+    running = peak = 0
+
+    def job(seconds: float, value: int):
+        async def run(session):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(seconds)
+            running -= 1
+            return (await session.execute(text(f"SELECT {value}"))).scalar()
+        return run
+
+    async with TestSession() as db:
+        start = time.perf_counter()
+        results = await run_concurrently(db, job(0.1, 1), job(0.05, 2), job(0.05, 3), limit=3)
+        elapsed = time.perf_counter() - start
+        assert results == [1, 2, 3]
+        # Roughly the slowest job, not the sum
+        assert elapsed < 0.18
+        assert peak == 3
+
+        peak = 0
+        await run_concurrently(db, *(job(0.01, i) for i in range(6)), limit=2)
+        assert peak == 2
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.core.config import settings
+from app.core.jobs import Worker
+from app.core.query_stats import capture_queries
+from app.models.feeding_log import FeedingLog
+from app.models.job import Job
+from app.models.pet import Pet
+from app.models.user import User
+from tests.conftest import TestSession, test_engine
+
+
+async def _count(model) -> int:
+    async with TestSession() as db:
+        return (await db.execute(select(func.count()).select_from(model))).scalar()
+
+
+async def _seed_logs(pet_id: int, n: int) -> None:
+    start = datetime.now(timezone.utc) - timedelta(days=n)
+    async with TestSession() as db:
+        db.add_all(FeedingLog(pet_id=pet_id, datetime_=start + timedelta(days=i), food_type="kibble",
+                              actual_amount_grams=50) for i in range(n))
+        await db.commit()
+
+
+async def test_delete_pet_cascades_in_the_database(auth_client: AsyncClient):
+    pet_id = (await auth_client.post("/pets/", json={"name": "Rex", "species": "dog"})).json()["id"]
+    await _seed_logs(pet_id, 30)
+
+    with capture_queries() as stats:
+        assert (await auth_client.delete(f"/pets/{pet_id}")).status_code == 204
+    # Auth + ownership lookups and one DELETE; logs are never selected
+    assert not [s for s in stats.statements if "feeding_logs" in s.lower()]
+    assert await _count(FeedingLog) == 0
+
+
+async def test_small_account_deleted_inline(auth_client: AsyncClient):
+    pet_id = (await auth_client.post("/pets/", json={"name": "Rex", "species": "dog"})).json()["id"]
+    await _seed_logs(pet_id, 5)
+    assert (await auth_client.delete("/auth/account")).status_code == 204
+    assert (await _count(User), await _count(Pet), await _count(FeedingLog), await _count(Job)) == (0, 0, 0, 0)
+
+
+async def test_large_account_deleted_by_background_job(auth_client: AsyncClient, monkeypatch):
+    monkeypatch.setattr(settings, "ACCOUNT_DELETE_SYNC_MAX_ROWS", 10)
+    monkeypatch.setattr(settings, "ACCOUNT_DELETE_BATCH_SIZE", 7)
+    for name in ("Rex", "Luna"):
+        pet_id = (await auth_client.post("/pets/", json={"name": name, "species": "dog"})).json()["id"]
+        await _seed_logs(pet_id, 20)
+
+    assert (await auth_client.delete("/auth/account")).status_code == 204
+    # Signed out straight away, email free again
+    assert (await auth_client.get("/auth/me")).status_code == 401
+    assert await _count(FeedingLog) == 40
+
+    assert await Worker(test_engine).run_once()
+    assert (await _count(User), await _count(Pet), await _count(FeedingLog)) == (0, 0, 0)
+    async with TestSession() as db:
+        job = (await db.execute(select(Job))).scalar_one()
+    assert (job.status, job.result) == ("succeeded", {"deleted_rows": 43})
@@ -0,0 +1,53 @@
+import pytest
+
+from app.core.health import monitor, reminder_heartbeat
+from app.core.query_stats import capture_queries
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+async def healthy():
+    await monitor.check(test_engine)
+    reminder_heartbeat.beat()
+    yield
+    reminder_heartbeat.last = None
+
+
+async def test_live_needs_nothing(client):
+    for path in ("/health", "/health/live"):
+        resp = await client.get(path)
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "ok"}
+
+
+async def test_ready_serves_cached_checks(client, healthy):
+    with capture_queries() as stats:
+        resp = await client.get("/health/ready")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == "ready"
+    assert body["checks"]["database"]["ok"]
+    assert body["checks"]["pool"]["capacity"] > 0
+    # Probes never reach the database
+    assert stats.count == 0
+
+
+async def test_ready_fails_on_stale_heartbeat(client, healthy):
+    reminder_heartbeat.last -= reminder_heartbeat.max_age_seconds + 1
+    resp = await client.get("/health/ready")
+    assert resp.status_code == 503
+    assert not resp.json()["checks"]["reminder_loop"]["ok"]
+
+
+async def test_ready_fails_when_pool_saturated(client, healthy, monkeypatch):
+    monkeypatch.setattr(monitor, "connections_in_use", monitor.pool_capacity)
+    resp = await client.get("/health/ready")
+    assert resp.status_code == 503
+    assert not resp.json()["checks"]["pool"]["ok"]
+
+
+async def test_ready_fails_on_stale_db_result(client, healthy):
+    monitor.checked_at -= 1_000
+    resp = await client.get("/health/ready")
+    assert resp.status_code == 503
+    assert not resp.json()["checks"]["database"]["ok"]
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta, timezone
+
+from httpx import AsyncClient
+from sqlalchemy import update
+
+from app.core.jobs import JobContext, Worker, enqueue, register
+from app.models.job import Job
+from tests.conftest import TestSession, test_engine
+
+_calls: list[int] = []
+
+
+@register("test.echo")
+async def _echo(ctx: JobContext, payload: dict) -> dict:
+    await ctx.progress(0.5, "halfway")
+    return {"echo": payload["value"]}
+
+
+@register("test.flaky")
+async def _flaky(ctx: JobContext, payload: dict) -> None:
+    _calls.append(ctx.attempt)
+    if ctx.attempt < payload["succeed_on"]:
+        raise RuntimeError("not yet")
+
+
+async def _enqueue(kind: str, payload: dict, **kwargs) -> int:
+    async with TestSession() as db:
+        job = await enqueue(db, kind, payload, **kwargs)
+        await db.commit()
+        return job.id
+
+
+async def _job(job_id: int) -> Job:
+    async with TestSession() as db:
+        return await db.get(Job, job_id)
+
+
+async def _make_due(job_id: int) -> None:
+    async with test_engine.begin() as conn:
+        await conn.execute(update(Job).where(Job.id == job_id).values(run_at=datetime.now(timezone.utc)))
+
+
+async def test_job_runs_and_reports_status(auth_client: AsyncClient):
+    job_id = await _enqueue("test.echo", {"value": 42}, user_id=1)
+    assert await Worker(test_engine).run_once()
+    assert not await Worker(test_engine).run_once()
+
+    resp = await auth_client.get(f"/jobs/{job_id}")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["status"], body["result"], body["progress"], body["attempts"]) == ("succeeded", {"echo": 42}, 1.0, 1)
+    assert body["progress_message"] == "halfway"
+
+    other = await _enqueue("test.echo", {"value": 1})
+    assert (await auth_client.get(f"/jobs/{other}")).status_code == 404
+
+
+async def test_failed_attempts_back_off_then_give_up():
+    _calls.clear()
+    worker = Worker(test_engine)
+    job_id = await _enqueue("test.flaky", {"succeed_on": 99}, max_attempts=2)
+
+    assert await worker.run_once()
+    job = await _job(job_id)
+    assert (job.status, job.attempts) == ("queued", 1)
+    assert "not yet" in job.last_error
+    # Backing off: not claimable until run_at passes
+    assert not await worker.run_once()
+
+    await _make_due(job_id)
+    assert await worker.run_once()
+    job = await _job(job_id)
+    assert (job.status, job.attempts, job.finished_at is not None) == ("failed", 2, True)
+    assert _calls == [1, 2]
+
+
+async def test_retry_succeeds_and_unknown_kind_fails_fast():
+    worker = Worker(test_engine)
+    job_id = await _enqueue("test.flaky", {"succeed_on": 2})
+    await worker.run_once()
+    await _make_due(job_id)
+    await worker.run_once()
+    assert (await _job(job_id)).status == "succeeded"
+
+    unknown = await _enqueue("test.missing", {})
+    await worker.run_once()
+    job = await _job(unknown)
+    assert (job.status, job.attempts) == ("failed", 1)
+
+
+async def test_lapsed_lease_is_reclaimed():
+    job_id = await _enqueue("test.echo", {"value": 7})
+    crashed = Worker(test_engine)
+    assert await crashed.claim()
+    assert not await Worker(test_engine).run_once()
+
+    async with test_engine.begin() as conn:
+        await conn.execute(update(Job).where(Job.id == job_id).values(
+            locked_until=datetime.now(timezone.utc) - timedelta(seconds=1)))
+    assert await Worker(test_engine).run_once()
+    job = await _job(job_id)
+    assert (job.status, job.attempts) == ("succeeded", 2)
@@ -0,0 +1,32 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.metrics import Histogram, http_requests_total
+
+
+def test_histogram_renders_cumulative_buckets():
+    h = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1.0))
+    h.observe(0.05, "/a")
+    h.observe(0.5, "/a")
+    h.observe(5, "/a")
+    lines = h.render()
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{route="/a"} 3' in lines
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_labels_by_route_template(auth_client: AsyncClient):
+    pet = await auth_client.post("/pets/", json={"name": "Rex", "species": "dog"})
+    before = http_requests_total.value("GET", "/pets/{pet_id}", "200")
+    await auth_client.get(f"/pets/{pet.json()['id']}")
+    assert http_requests_total.value("GET", "/pets/{pet_id}", "200") == before + 1
+
+    resp = await auth_client.get("/metrics")
+    assert resp.status_code == 200
+    body = resp.text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/pets/{pet_id}",le="+Inf"}' in body
+    assert "http_requests_in_flight 1" in body  # the scrape itself
+    assert "ws_connections 0" in body
+    assert "# TYPE db_queries_total counter" in body
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient, ASGITransport
+
+from app.core.middleware import CORSSafetyMiddleware, RequestLoggingMiddleware
+
+ORIGIN = "https://p-well-track.vercel.app"
+
+
+def _build_app(first_chunk_seen: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        async def body():
+            yield b"first"
+            # Only proceeds once the client has received the first chunk
+            await asyncio.wait_for(first_chunk_seen.wait(), timeout=2)
+            yield b"second"
+        return StreamingResponse(body(), media_type="text/plain")
+
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(CORSMiddleware, allow_origins=[ORIGIN], allow_credentials=True,
+                       allow_methods=["*"], allow_headers=["*"])
+    app.add_middleware(CORSSafetyMiddleware, allowed_origins=[ORIGIN])
+    return app
+
+
+@pytest.mark.asyncio
+async def test_escaped_error_has_cors_headers():
+    app = _build_app(asyncio.Event())
+    async with AsyncClient(transport=ASGITransport(app=app, raise_app_exceptions=False),
+                           base_url="http://test") as client:
+        resp = await client.get("/boom", headers={"Origin": ORIGIN})
+    assert resp.status_code == 500
+    assert resp.json() == {"detail": "Internal server error"}
+    assert resp.headers["access-control-allow-origin"] == ORIGIN
+    assert resp.headers["access-control-allow-credentials"] == "true"
+
+
+@pytest.mark.asyncio
+async def test_streaming_body_is_not_buffered():
+    first_chunk_seen = asyncio.Event()
+    app = _build_app(first_chunk_seen)
+    response_done = asyncio.Event()
+    chunks: list[bytes] = []
+    request_sent = False
+
+    async def receive():
+        # Deliver the request once, then block like a real server until the
+        # response is finished (StreamingResponse listens for disconnects).
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            if message.get("body"):
+                chunks.append(message["body"])
+                first_chunk_seen.set()
+            if not message.get("more_body", False):
+                response_done.set()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/stream", "raw_path": b"/stream", "root_path": "",
+        "query_string": b"", "headers": [(b"host", b"test")], "server": ("test", 80), "client": ("c", 1),
+    }
+    await app(scope, receive, send)
+    assert chunks == [b"first", b"second"]
+
+
+@pytest.mark.asyncio
+async def test_cors_headers_on_normal_and_preflight_responses():
+    app = _build_app(asyncio.Event())
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.get("/ok", headers={"Origin": ORIGIN})
+        preflight = await client.options("/ok", headers={
+            "Origin": ORIGIN, "Access-Control-Request-Method": "GET",
+        })
+        foreign = await client.get("/ok", headers={"Origin": "https://evil.example"})
+    assert resp.headers.get_list("access-control-allow-origin") == [ORIGIN]
+    assert resp.headers["access-control-allow-credentials"] == "true"
+    assert preflight.status_code == 200
+    assert preflight.headers.get_list("access-control-allow-origin") == [ORIGIN]
+    assert "access-control-allow-origin" not in foreign.headers
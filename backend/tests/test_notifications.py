@@ -0,0 +1,172 @@
+from datetime import datetime, timedelta, timezone
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.core import changes
+from app.routers import notifications
+from tests.conftest import TestSession
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent: list[dict] = []
+
+    async def send_json(self, data: dict):
+        self.sent.append(data)
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    """Register a fake socket for user 1 and point the reminder loop at the test DB."""
+    monkeypatch.setattr(notifications, "async_session", TestSession)
+    monkeypatch.setattr(changes, "async_session", TestSession)
+    ws = _FakeWebSocket()
+    notifications.manager._connections[1] = {ws}
+    yield ws
+    notifications.manager._connections.pop(1, None)
+    changes.data_changes._pending.clear()  # flushes scheduled on this test's loop never run
+
+
+@pytest.mark.asyncio
+async def test_event_reminder_sent_once(auth_client: AsyncClient, fake_ws):
+    pet = await auth_client.post("/pets/", json={"name": "Rex", "species": "dog"})
+    pet_id = pet.json()["id"]
+    start = datetime.now(timezone.utc) + timedelta(minutes=30)
+    await auth_client.post(f"/pets/{pet_id}/events", json={
+        "type": "vet_visit", "title": "Checkup",
+        "datetime_start": start.isoformat(), "reminder_minutes_before": 30,
+    })
+    # Far-future reminder must not fire yet
+    await auth_client.post(f"/pets/{pet_id}/events", json={
+        "type": "grooming", "title": "Bath",
+        "datetime_start": (start + timedelta(days=3)).isoformat(), "reminder_minutes_before": 60,
+    })
+
+    await notifications._check_reminders()
+    await notifications._check_reminders()
+
+    reminders = [m for m in fake_ws.sent if m["type"] == "event_reminder"]
+    assert len(reminders) == 1
+    assert reminders[0]["title"] == "Checkup"
+    assert reminders[0]["pet_name"] == "Rex"
+
+
+@pytest.mark.asyncio
+async def test_event_reminder_rescheduled(auth_client: AsyncClient, fake_ws):
+    pet = await auth_client.post("/pets/", json={"name": "Luna", "species": "cat"})
+    pet_id = pet.json()["id"]
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    resp = await auth_client.post(f"/pets/{pet_id}/events", json={
+        "type": "vet_visit", "title": "Vaccine",
+        "datetime_start": start.isoformat(), "reminder_minutes_before": 15,
+    })
+    await notifications._check_reminders()
+    assert not [m for m in fake_ws.sent if m["type"] == "event_reminder"]
+
+    # Moving the event updates its fire time
+    soon = datetime.now(timezone.utc) + timedelta(minutes=15)
+    await auth_client.put(f"/events/{resp.json()['id']}", json={"datetime_start": soon.isoformat()})
+    await notifications._check_reminders()
+    assert [m["title"] for m in fake_ws.sent if m["type"] == "event_reminder"] == ["Vaccine"]
+
+
+@pytest.mark.asyncio
+async def test_medication_reminder_only_for_active_courses(auth_client: AsyncClient, fake_ws):
+    pet = await auth_client.post("/pets/", json={"name": "Milo", "species": "cat"})
+    pet_id = pet.json()["id"]
+    now = datetime.now(timezone.utc)  # test user's timezone is UTC
+    today = now.date()
+    slot = f"{now:%H:%M}"
+    await auth_client.post(f"/pets/{pet_id}/medications", json={
+        "name": "Antibiotic", "dosage": "5 mg", "frequency_per_day": 1,
+        "start_date": (today - timedelta(days=3)).isoformat(), "times_of_day": [slot],
+    })
+    await auth_client.post(f"/pets/{pet_id}/medications", json={
+        "name": "Finished", "dosage": "1 tab", "frequency_per_day": 1,
+        "start_date": (today - timedelta(days=30)).isoformat(),
+        "end_date": (today - timedelta(days=1)).isoformat(), "times_of_day": [slot],
+    })
+    await auth_client.post(f"/pets/{pet_id}/medications", json={
+        "name": "Upcoming", "dosage": "2 ml", "frequency_per_day": 1,
+        "start_date": (today + timedelta(days=1)).isoformat(), "times_of_day": [slot],
+    })
+
+    await notifications._check_reminders()
+    await notifications._check_reminders()
+
+    reminders = [m for m in fake_ws.sent if m["type"] == "medication_reminder"]
+    assert [m["medication_name"] for m in reminders] == ["Antibiotic"]
+    assert reminders[0]["scheduled_time"] == slot
+
+
+def test_medication_slots_parse_once():
+    notifications._slot_cache.clear()
+    raw = '["08:00", "20:30", "bogus"]'
+    assert notifications._medication_slots(raw) == ((480, "08:00"), (1230, "20:30"))
+    assert notifications._medication_slots(raw) is notifications._medication_slots(raw)
+    assert notifications._medication_slots("null") == ()
+
+
+class _FrozenDatetime(datetime):
+    # 19:02 in New York (EDT, UTC-4)
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 3, 10, 23, 2, tzinfo=timezone.utc).astimezone(tz)
+
+
+@pytest.mark.asyncio
+async def test_feeding_reminder_uses_local_day(auth_client: AsyncClient, fake_ws, monkeypatch):
+    await auth_client.put("/auth/profile", json={"timezone": "America/New_York"})
+    fed = (await auth_client.post("/pets/", json={"name": "Fed", "species": "dog"})).json()["id"]
+    hungry = (await auth_client.post("/pets/", json={"name": "Hungry", "species": "dog"})).json()["id"]
+    # 13:00 local today
+    await auth_client.post(f"/pets/{fed}/feeding", json={
+        "datetime": "2026-03-10T17:00:00+00:00", "food_type": "kibble", "actual_amount_grams": 100,
+    })
+    # Same UTC date, but 22:00 local *yesterday*
+    await auth_client.post(f"/pets/{hungry}/feeding", json={
+        "datetime": "2026-03-10T02:00:00+00:00", "food_type": "kibble", "actual_amount_grams": 100,
+    })
+    monkeypatch.setattr(notifications, "datetime", _FrozenDatetime)
+
+    await notifications._check_reminders()
+
+    reminders = [m for m in fake_ws.sent if m["type"] == "feeding_reminder"]
+    assert [(m["pet_name"], m["scheduled_time"]) for m in reminders] == [("Hungry", "19:00")]
+
+
+def test_timezone_bucket_bounds():
+    now = datetime(2026, 3, 10, 23, 2, tzinfo=timezone.utc)
+    bucket = notifications._TimezoneBucket.at("America/New_York", now)
+    assert (bucket.minute, bucket.today) == (19 * 60 + 2, now.date())
+    assert bucket.day_start == datetime(2026, 3, 10, 4, 0, tzinfo=timezone.utc)
+    assert notifications._TimezoneBucket.at("Not/AZone", now).minute == 23 * 60 + 2
+
+
+@pytest.mark.asyncio
+async def test_data_changed_coalesced_per_user(auth_client: AsyncClient, fake_ws, monkeypatch):
+    monkeypatch.setattr(changes.data_changes, "window", 0.5)
+    pet_id = (await auth_client.post("/pets/", json={"name": "Rex", "species": "dog"})).json()["id"]
+    now = datetime.now(timezone.utc).isoformat()
+    first = (await auth_client.post(f"/pets/{pet_id}/feeding", json={
+        "datetime": now, "food_type": "kibble", "actual_amount_grams": 100,
+    })).json()["id"]
+    await auth_client.post(f"/pets/{pet_id}/feeding", json={
+        "datetime": now, "food_type": "kibble", "actual_amount_grams": 50,
+    })
+    await auth_client.delete(f"/feeding/{first}")
+    await auth_client.post(f"/pets/{pet_id}/water", json={"datetime": now, "amount_ml": 200})
+    await asyncio.sleep(0.8)
+
+    pushes = [m for m in fake_ws.sent if m["type"] == "data_changed"]
+    assert len(pushes) == 1
+    by_entity = {c["entity"]: c for c in pushes[0]["changes"]}
+    assert set(by_entity) == {"pet", "feeding", "water"}
+    assert by_entity["feeding"]["deleted"] == [first]
+    assert first not in by_entity["feeding"]["upserted"]
+    totals = pushes[0]["totals"][str(pet_id)]
+    assert (totals["feeding_grams"], totals["feeding_count"]) == (50.0, 1)
+    assert (totals["water_ml"], totals["water_count"]) == (200.0, 1)
@@ -63,6 +63,37 @@ async def test_pet_today(auth_client: AsyncClient):
     assert "water" in data
 
 
+@pytest.mark.asyncio
+async def test_pet_today_contents(auth_client: AsyncClient):
+    from datetime import date, datetime, timedelta, timezone
+
+    pet_id = (await auth_client.post("/pets/", json={"name": "Busy", "species": "cat"})).json()["id"]
+    now = datetime.now(timezone.utc)
+    await auth_client.post(f"/pets/{pet_id}/feeding", json={
+        "food_type": "wet", "actual_amount_grams": 80, "planned_amount_grams": 100, "datetime": now.isoformat()})
+    await auth_client.post(f"/pets/{pet_id}/water", json={
+        "amount_ml": 150, "daily_goal_ml": 600, "datetime": now.isoformat()})
+    for days in (3, 1):
+        await auth_client.post(f"/pets/{pet_id}/events", json={
+            "type": "vet_visit", "title": f"In {days} days",
+            "datetime_start": (now + timedelta(days=days)).isoformat()})
+    await auth_client.post(f"/pets/{pet_id}/medications", json={
+        "name": "Drops", "dosage": "2 drops", "frequency_per_day": 2,
+        "start_date": date.today().isoformat(), "times_of_day": ["08:00", "20:00"]})
+
+    data = (await auth_client.get(f"/pets/{pet_id}/today")).json()
+    assert data["feeding"] == {"total_actual_grams": 80.0, "total_planned_grams": 100.0, "entries_count": 1}
+    assert data["water"] == {"total_ml": 150.0, "daily_goal_ml": 600.0, "entries_count": 1}
+    assert [e["title"] for e in data["upcoming_events"]] == ["In 1 days", "In 3 days"]
+    assert data["active_medications"][0]["times_of_day"] == ["08:00", "20:00"]
+
+    assert (await auth_client.get("/pets/9999/today")).status_code == 404
+
+    # The summary builds the same dashboard through its concurrent batched queries
+    summary = (await auth_client.get("/pets/summary")).json()
+    assert next(item["dashboard"] for item in summary if item["pet"]["id"] == pet_id) == data
+
+
 @pytest.mark.asyncio
 async def test_pets_summary(auth_client: AsyncClient):
     """Test the /pets/summary batch endpoint returns pets with dashboards and vaccine status."""
@@ -85,3 +116,32 @@ async def test_pets_summary(auth_client: AsyncClient):
 async def test_unauthorized_pet_access(client: AsyncClient):
     resp = await client.get("/pets/")
     assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_pets_summary_limits_upcoming_events_per_pet(auth_client: AsyncClient):
+    from datetime import datetime, timedelta, timezone
+
+    now = datetime.now(timezone.utc)
+    busy = (await auth_client.post("/pets/", json={"name": "Busy", "species": "dog"})).json()["id"]
+    calm = (await auth_client.post("/pets/", json={"name": "Calm", "species": "cat"})).json()["id"]
+    for days in (9, 2, 7, 1, 8, 3, 6, 4):
+        await auth_client.post(f"/pets/{busy}/events", json={
+            "type": "grooming", "title": f"Day {days}", "datetime_start": (now + timedelta(days=days)).isoformat()})
+    await auth_client.post(f"/pets/{busy}/events", json={
+        "type": "vet_visit", "title": "Past", "datetime_start": (now - timedelta(days=1)).isoformat()})
+    await auth_client.post(f"/pets/{calm}/events", json={
+        "type": "vet_visit", "title": "Checkup", "datetime_start": (now + timedelta(days=30)).isoformat()})
+
+    def titles(summary, pet_id):
+        item = next(i for i in summary if i["pet"]["id"] == pet_id)
+        return [e["title"] for e in item["dashboard"]["upcoming_events"]]
+
+    summary = (await auth_client.get("/pets/summary")).json()
+    assert titles(summary, busy) == ["Day 1", "Day 2", "Day 3", "Day 4", "Day 6"]
+    assert titles(summary, calm) == ["Checkup"]
+
+    summary = (await auth_client.get("/pets/summary", params={"upcoming_events": 2})).json()
+    assert titles(summary, busy) == ["Day 1", "Day 2"]
+    assert titles(summary, calm) == ["Checkup"]
+
@@ -0,0 +1,89 @@
+"""Query budgets per endpoint: adding a query to a hot path should fail here."""
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.query_stats import capture_queries
+
+
+async def _create_pet(client: AsyncClient) -> int:
+    resp = await client.post("/pets/", json={"name": "Budget", "species": "dog"})
+    return resp.json()["id"]
+
+
+async def _assert_budget(call, budget: int):
+    with capture_queries() as stats:
+        resp = await call
+    assert resp.status_code < 400, resp.text
+    assert stats.count <= budget, f"{stats.count} queries (budget {budget}): {list(stats.statements)}"
+    return resp
+
+
+@pytest.mark.asyncio
+async def test_feeding_query_budgets(auth_client: AsyncClient):
+    pet_id = await _create_pet(auth_client)
+    created = await _assert_budget(auth_client.post(f"/pets/{pet_id}/feeding", json={
+        "food_type": "kibble", "actual_amount_grams": 100,
+    }), budget=2)
+    fid = created.json()["id"]
+    await _assert_budget(auth_client.get(f"/pets/{pet_id}/feeding"), budget=3)
+    await _assert_budget(auth_client.put(f"/feeding/{fid}", json={"food_type": "wet"}), budget=2)
+    await _assert_budget(auth_client.delete(f"/feeding/{fid}"), budget=2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path, body", [
+    ("feeding", {"food_type": "kibble", "actual_amount_grams": 100}),
+    ("water", {"amount_ml": 250}),
+    ("weight", {"weight_kg": 12.5}),
+    ("symptoms", {"type": "vomiting", "severity": "mild"}),
+    ("vaccines", {"name": "Rabies", "date_administered": "2025-06-15"}),
+    ("medications", {"name": "Apoquel", "dosage": "16mg", "frequency_per_day": 1, "times_of_day": ["08:00"],
+                     "start_date": "2025-06-01"}),
+    ("events", {"type": "vet_visit", "title": "Checkup", "datetime_start": "2025-12-01T10:00:00",
+                "reminder_minutes_before": 60}),
+])
+async def test_create_is_one_statement(auth_client: AsyncClient, path: str, body: dict):
+    pet_id = await _create_pet(auth_client)
+    with capture_queries() as stats:
+        resp = await auth_client.post(f"/pets/{pet_id}/{path}", json=body)
+    assert resp.status_code == 201, resp.text
+    # Besides the current-user lookup: the ownership-checked INSERT ... SELECT ... RETURNING
+    data = [s for s in stats.statements if not s.startswith("SELECT users.")]
+    assert len(data) == 1 and data[0].startswith("INSERT INTO"), list(stats.statements)
+    assert stats.count == 2
+
+    assert (await auth_client.post(f"/pets/9999/{path}", json=body)).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_dashboard_query_budgets(auth_client: AsyncClient):
+    for _ in range(3):
+        await _create_pet(auth_client)
+    # Batched: must not grow with the number of pets
+    await _assert_budget(auth_client.get("/pets/summary"), budget=8)
+    # Current user + one composite statement
+    await _assert_budget(auth_client.get("/pets/1/today"), budget=2)
+
+
+@pytest.mark.asyncio
+async def test_query_stats_headers_opt_in(auth_client: AsyncClient, monkeypatch):
+    resp = await auth_client.get("/pets/")
+    assert "x-db-query-count" not in resp.headers
+
+    monkeypatch.setattr(settings, "SQL_STATS_HEADERS", True)
+    resp = await auth_client.get("/pets/")
+    assert resp.headers["x-db-query-count"] == "2"
+    assert float(resp.headers["x-db-time-ms"]) >= 0
+    assert resp.headers["server-timing"].startswith("db;dur=")
+
+
+def test_repeated_statements_flagged_as_n_plus_one():
+    with capture_queries() as stats:
+        pass
+    for _ in range(12):
+        stats.record("SELECT * FROM pets WHERE id = ?", 0.001)
+    stats.record("SELECT * FROM users", 0.005)
+    assert stats.repeated(10) == [("SELECT * FROM pets WHERE id = ?", 12)]
+    assert stats.slowest_statement == "SELECT * FROM users"
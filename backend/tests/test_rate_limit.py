@@ -0,0 +1,59 @@
+import time
+
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import SlidingWindowCounterRateLimiter
+from starlette.requests import Request
+
+from app.core.rate_limit import DatabaseStorage, user_or_ip_key
+from app.core.security import create_access_token
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "headers": raw, "client": ("203.0.113.7", 1234)})
+
+
+def test_database_storage_is_shared_between_workers(tmp_path):
+    uri = f"db+sqlite:///{tmp_path}/ratelimit.db"
+    worker_a = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+    worker_b = SlidingWindowCounterRateLimiter(storage_from_string(uri))
+    assert isinstance(worker_a.storage, DatabaseStorage)
+    limit = parse("3/minute")
+
+    assert worker_a.hit(limit, "ip:1")
+    assert worker_b.hit(limit, "ip:1")
+    assert worker_a.hit(limit, "ip:1")
+    # The fourth hit is refused no matter which worker serves it
+    assert not worker_b.hit(limit, "ip:1")
+    assert not worker_a.hit(limit, "ip:1")
+    assert worker_a.hit(limit, "ip:2")
+
+    worker_a.clear(limit, "ip:1")
+    assert worker_b.hit(limit, "ip:1")
+
+
+def test_expired_counter_starts_over(tmp_path):
+    storage = DatabaseStorage(f"db+sqlite:///{tmp_path}/ratelimit.db")
+    assert storage.incr("k", expiry=60) == 1
+    assert storage.incr("k", expiry=60, amount=2) == 3
+    storage._execute("UPDATE rate_limits SET expires_at = 0")
+    assert storage.get("k") == 0
+    assert storage.incr("k", expiry=60) == 1
+
+
+def test_database_storage_overhead_under_a_millisecond(tmp_path):
+    limiter = SlidingWindowCounterRateLimiter(DatabaseStorage(f"db+sqlite:///{tmp_path}/ratelimit.db"))
+    limit = parse("1000000/minute")
+    hits = 500
+    start = time.perf_counter()
+    for i in range(hits):
+        limiter.hit(limit, f"user:{i % 50}")
+    assert (time.perf_counter() - start) / hits < 0.001
+
+
+def test_authenticated_requests_are_keyed_by_user():
+    token = create_access_token(42)
+    assert user_or_ip_key(_request({"Authorization": f"Bearer {token}"})) == "user:42"
+    assert user_or_ip_key(_request({"Authorization": "Bearer not-a-token"})) == "203.0.113.7"
+    assert user_or_ip_key(_request()) == "203.0.113.7"
@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+
+from app.core.retention import partition_ddl, purge_sent_notifications
+from app.models.sent_notification import SentNotification
+from app.models.user import User
+from tests.conftest import TestSession, test_engine
+
+
+async def test_purge_deletes_old_rows_in_batches():
+    today = date(2026, 3, 20)
+    async with TestSession() as db:
+        user = User(email="retention@example.com", name="R", password_hash="x")
+        db.add(user)
+        await db.flush()
+        for i in range(25):
+            db.add(SentNotification(user_id=user.id, notification_key=f"feeding:{i}:08:00",
+                                    sent_date=today - timedelta(days=30 + i % 3)))
+        for days_ago in (0, 1, 6):
+            db.add(SentNotification(user_id=user.id, notification_key="feeding:1:13:00",
+                                    sent_date=today - timedelta(days=days_ago)))
+        await db.commit()
+
+    deleted = await purge_sent_notifications(test_engine, retention_days=7, batch_size=10, today=today)
+
+    assert deleted == 25
+    async with TestSession() as db:
+        remaining = (await db.execute(select(func.count(SentNotification.id)))).scalar()
+    assert remaining == 3
+
+
+async def test_retention_never_drops_yesterday():
+    today = date(2026, 3, 20)
+    async with TestSession() as db:
+        user = User(email="retention2@example.com", name="R", password_hash="x")
+        db.add(user)
+        await db.flush()
+        db.add(SentNotification(user_id=user.id, notification_key="event:1:x", sent_date=today - timedelta(days=1)))
+        await db.commit()
+    assert await purge_sent_notifications(test_engine, retention_days=0, today=today) == 0
+
+
+def test_partition_ddl_covers_one_month():
+    assert partition_ddl(date(2026, 12, 15)) == (
+        "CREATE TABLE IF NOT EXISTS sent_notifications_p202612 PARTITION OF sent_notifications "
+        "FOR VALUES FROM ('2026-12-01') TO ('2027-01-01')"
+    )
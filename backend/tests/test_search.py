@@ -0,0 +1,62 @@
+from httpx import AsyncClient
+
+from app.core.search import query_terms
+from app.models.pet import Pet
+from app.models.symptom import Symptom
+from app.models.user import User
+from tests.conftest import TestSession
+
+
+async def _search(client: AsyncClient, q: str, **params) -> list[dict]:
+    resp = await client.get("/search", params={"q": q, **params})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+async def test_search_finds_ranks_and_tracks_writes(auth_client: AsyncClient):
+    pet_id = (await auth_client.post("/pets/", json={
+        "name": "Rex", "species": "dog", "notes": "Allergic to chicken",
+    })).json()["id"]
+    symptom = (await auth_client.post(f"/pets/{pet_id}/symptoms", json={
+        "type": "vomiting", "severity": "mild", "notes": "After eating chicken, vomiting twice",
+    })).json()
+    event = (await auth_client.post(f"/pets/{pet_id}/events", json={
+        "type": "vet_visit", "title": "Allergy test", "location": "Downtown Clinic",
+        "datetime_start": "2025-12-01T10:00:00",
+    })).json()
+
+    hits = await _search(auth_client, "chick")
+    assert {(h["kind"], h["id"]) for h in hits} == {("pet", pet_id), ("symptom", symptom["id"])}
+    assert all(h["pet_id"] == pet_id for h in hits)
+    # Symptom type and notes both say "vomiting": ranked above a single mention
+    hits = await _search(auth_client, "vomiting chicken")
+    assert [(h["kind"], h["id"]) for h in hits] == [("symptom", symptom["id"])]
+    assert "[vomiting]" in hits[0]["snippet"]
+
+    assert [h["id"] for h in await _search(auth_client, "downtown")] == [event["id"]]
+    await auth_client.put(f"/events/{event['id']}", json={"location": "Uptown Clinic"})
+    assert await _search(auth_client, "downtown") == []
+    assert [h["id"] for h in await _search(auth_client, "uptown")] == [event["id"]]
+
+    assert len(await _search(auth_client, "chicken", limit=1)) == 1
+    assert len(await _search(auth_client, "chicken", limit=1, offset=1)) == 1
+    assert await _search(auth_client, '"*') == []
+
+    # Deleting the pet cascades to its records and out of the index
+    await auth_client.delete(f"/pets/{pet_id}")
+    assert await _search(auth_client, "chicken") == []
+    assert await _search(auth_client, "allergy") == []
+
+
+async def test_search_is_scoped_to_current_user(auth_client: AsyncClient):
+    async with TestSession() as db:
+        other = User(name="Other", email="other@example.com", password_hash="x")
+        pet = Pet(owner=other, name="Theirs", species="cat", notes="secret chicken recipe")
+        db.add_all([other, pet, Symptom(pet=pet, type="sneezing", severity="mild")])
+        await db.commit()
+    assert await _search(auth_client, "chicken") == []
+    assert await _search(auth_client, "sneezing") == []
+
+
+def test_query_terms_drop_operators():
+    assert query_terms('Vómito AND "owner:u2" NEAR(x*') == ["vómito", "and", "owner", "u2", "near", "x"]
@@ -0,0 +1,26 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.serialization import Serializer
+from app.schemas.feeding import FeedingOut
+
+
+def test_serializer_matches_default_encoding():
+    """The fast path must emit exactly what FastAPI's default response would."""
+    now = datetime(2026, 3, 1, 8, 30, 15, 123456, tzinfo=timezone(timedelta(hours=1)))
+    rows = [
+        SimpleNamespace(id=1, pet_id=2, datetime_=now, food_type="ração", planned_amount_grams=None,
+                        actual_amount_grams=120.5, notes="línguas ✓"),
+        SimpleNamespace(id=2, pet_id=2, datetime_=now, food_type="kibble", planned_amount_grams=100.0,
+                        actual_amount_grams=100, notes=None),
+    ]
+    expected = JSONResponse(jsonable_encoder([FeedingOut.model_validate(r) for r in rows])).body
+
+    resp = Serializer(list[FeedingOut]).response(rows, status_code=201)
+
+    assert resp.body == expected
+    assert resp.status_code == 201
+    assert b'"datetime":' in resp.body
@@ -0,0 +1,44 @@
+import asyncio
+
+from app.core.config import settings
+from app.core.metrics import startup_phase_seconds
+from app.core.startup import migration_head, startup
+
+
+async def test_gate_holds_requests_until_ready(client):
+    startup.close_gate()
+    try:
+        pending = asyncio.create_task(client.get("/"))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+        # Probes answer while the gate is closed
+        assert (await client.get("/health")).status_code == 200
+        startup.open_gate()
+        assert (await pending).status_code == 200
+    finally:
+        startup.open_gate()
+
+
+async def test_gate_times_out_with_503(client, monkeypatch):
+    monkeypatch.setattr(settings, "STARTUP_GATE_TIMEOUT", 0.01)
+    startup.close_gate()
+    try:
+        resp = await client.get("/")
+    finally:
+        startup.open_gate()
+    assert resp.status_code == 503
+    assert resp.headers["retry-after"] == "5"
+
+
+def test_phase_timings_are_exported():
+    with startup.phase("test_phase"):
+        pass
+    assert "test_phase" in startup.phases
+    assert startup_phase_seconds.value("test_phase") == startup.phases["test_phase"]
+    # Recorded when app.main finished importing
+    assert startup.phases["import"] > 0
+
+
+def test_migration_head_reads_scripts():
+    head = migration_head()
+    assert head and len(head) == 12
@@ -0,0 +1,68 @@
+from datetime import date, datetime, timedelta, timezone
+
+from httpx import AsyncClient
+
+from app.models.event import Event
+from app.models.feeding_log import FeedingLog, FeedingLogArchive
+from app.models.medication import Medication
+from app.models.symptom import Symptom
+from app.models.vaccine import Vaccine
+from app.models.water_log import WaterLog
+from app.models.weight_log import WeightLog
+from tests.conftest import TestSession
+
+
+async def _seed(pet_id: int) -> list[tuple[str, int]]:
+    """Rows across every source, with ties on the same instant; returns expected (kind, id) order."""
+    t = datetime(2025, 6, 10, 12, 0, tzinfo=timezone.utc)
+    old = datetime.now(timezone.utc) - timedelta(days=800)
+    async with TestSession() as db:
+        rows = [
+            FeedingLog(pet_id=pet_id, datetime_=t, food_type="a", actual_amount_grams=1),
+            FeedingLog(pet_id=pet_id, datetime_=t, food_type="b", actual_amount_grams=1),
+            FeedingLog(pet_id=pet_id, datetime_=t - timedelta(hours=1), food_type="c", actual_amount_grams=1),
+            WaterLog(pet_id=pet_id, datetime_=t, amount_ml=100),
+            WeightLog(pet_id=pet_id, datetime_=t - timedelta(days=1), weight_kg=10),
+            Symptom(pet_id=pet_id, datetime_=t + timedelta(hours=1), type="itching", severity="mild"),
+            Vaccine(pet_id=pet_id, name="Rabies", date_administered=date(2025, 6, 10)),
+            Medication(pet_id=pet_id, name="X", dosage="1", frequency_per_day=1, start_date=date(2025, 6, 9)),
+            Event(pet_id=pet_id, type="vet_visit", title="Visit", datetime_start=t + timedelta(days=3)),
+        ]
+        db.add_all(rows)
+        db.add(FeedingLogArchive(id=9999, pet_id=pet_id, datetime_=old, food_type="z", actual_amount_grams=1))
+        await db.commit()
+        ids = [r.id for r in rows]
+    f1, f2, f3, w, wt, s, v, m, e = ids
+    return [
+        ("event", e), ("symptom", s), ("water", w), ("feeding", f2), ("feeding", f1), ("feeding", f3),
+        ("vaccine", v), ("weight", wt), ("medication", m), ("feeding", 9999),
+    ]
+
+
+async def test_timeline_pages_through_merged_feed(auth_client: AsyncClient):
+    pet_id = (await auth_client.post("/pets/", json={"name": "T", "species": "dog"})).json()["id"]
+    expected = await _seed(pet_id)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": 3} | ({"cursor": cursor} if cursor else {})
+        resp = await auth_client.get(f"/pets/{pet_id}/timeline", params=params)
+        assert resp.status_code == 200
+        body = resp.json()
+        seen += [(item["kind"], item["id"]) for item in body["items"]]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+    assert pages == 4
+
+    first = (await auth_client.get(f"/pets/{pet_id}/timeline", params={"limit": 1})).json()["items"][0]
+    assert first["data"]["title"] == "Visit"
+
+
+async def test_timeline_rejects_bad_cursor_and_foreign_pet(auth_client: AsyncClient):
+    pet_id = (await auth_client.post("/pets/", json={"name": "T", "species": "dog"})).json()["id"]
+    resp = await auth_client.get(f"/pets/{pet_id}/timeline", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+    assert (await auth_client.get("/pets/9999/timeline")).status_code == 404